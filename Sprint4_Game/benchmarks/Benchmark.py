@@ -0,0 +1,92 @@
+from __future__ import annotations
+from typing import Any, Callable
+
+import gc
+import statistics
+import time
+
+
+class Benchmark:
+    """Times an action by calling it many times in a row. The action is created by a setup function, so preparing what the action
+    works on (e.g generating a game) is not timed. The number of calls per repeat is calibrated so each repeat takes long enough to
+    time accurately, and the time per call is reported as the median and minimum across repeats.
+
+    Author: Shen
+    """
+
+    def __init__(self, name: str, setup: Callable[[], Callable[[], Any]]):
+        """
+        Args:
+            name: The name of the benchmark, used to match results against a baseline
+            setup: Prepares what the action works on and returns the action to time
+        """
+        self.__name: str = name
+        self.__setup: Callable[[], Callable[[], Any]] = setup
+
+    def run(self, repeat: int, min_repeat_time: float) -> dict[str, float]:
+        """Run the setup, then time the action. The garbage collector is disabled whilst timing, so its pauses do not land on
+        whichever call happens to trigger them.
+
+        Args:
+            repeat: The number of times to time the calls
+            min_repeat_time: The minimum number of seconds each repeat should take, deciding the number of calls per repeat
+
+        Returns:
+            Dictionary with the median and minimum seconds per call (K = "median", "min") and the number of calls per repeat (K = "calls")
+        """
+        action: Callable[[], Any] = self.__setup()
+        calls: int = self.__calibrate(action, min_repeat_time)
+
+        gc_was_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            times: list[float] = [Benchmark.__time_calls(action, calls) / calls for _ in range(repeat)]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        return {"median": statistics.median(times), "min": min(times), "calls": calls}
+
+    def get_name(self) -> str:
+        """Get the name of the benchmark.
+
+        Returns:
+            The name
+        """
+        return self.__name
+
+    # ----------- Class methods -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __calibrate(action: Callable[[], Any], min_repeat_time: float) -> int:
+        """Find the number of calls to the action that take at least a minimum time, trying 1, 2, 5, 10, 20, 50... calls. The first
+        call also warms up anything the action loads lazily.
+
+        Args:
+            action: The action
+            min_repeat_time: The minimum number of seconds the calls should take
+
+        Returns:
+            The number of calls
+        """
+        multiplier: int = 1
+        while True:
+            for calls in (multiplier, multiplier * 2, multiplier * 5):
+                if Benchmark.__time_calls(action, calls) >= min_repeat_time:
+                    return calls
+            multiplier *= 10
+
+    @staticmethod
+    def __time_calls(action: Callable[[], Any], calls: int) -> float:
+        """Time calling the action a number of times in a row.
+
+        Args:
+            action: The action
+            calls: The number of calls
+
+        Returns:
+            The number of seconds the calls took
+        """
+        start_time: float = time.perf_counter()
+        for _ in range(calls):
+            action()
+        return time.perf_counter() - start_time
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import Any
+from definitions import ROOT_PATH
+
+import json
+import os
+import platform
+import pygame
+
+
+class BenchmarkReport:
+    """The results of a run of benchmarks, which can be written to a JSON file and compared against the results of an earlier run
+    (the baseline) to find regressions. Records the Python and pygame versions and the platform, as results are only comparable
+    between runs on the same machine and versions.
+
+    Author: Shen
+    """
+
+    FORMAT_VERSION: int = 1  # version of the results file format, incremented on incompatible changes
+
+    def __init__(self) -> None:
+        self.__results: dict[str, dict[str, float]] = dict()  # K = benchmark name, V = results as returned by Benchmark.run()
+        self.__environment: dict[str, str] = {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        }
+
+    def add_result(self, name: str, result: dict[str, float]) -> None:
+        """Add the result of a benchmark.
+
+        Args:
+            name: The name of the benchmark
+            result: The result as returned by Benchmark.run()
+        """
+        self.__results[name] = result
+
+    def get_results(self) -> dict[str, dict[str, float]]:
+        """Get the results of every benchmark.
+
+        Returns:
+            Dictionary with K = benchmark name, V = results as returned by Benchmark.run()
+        """
+        return self.__results
+
+    def get_environment(self) -> dict[str, str]:
+        """Get the versions and platform the benchmarks ran on.
+
+        Returns:
+            Dictionary with K = "python", "pygame" or "platform", V = the version or platform
+        """
+        return self.__environment
+
+    def compare(self, baseline: BenchmarkReport, tolerance: float) -> list[tuple[str, float, float]]:
+        """Compare the median time per call of each benchmark against the baseline. Benchmarks missing from either report are skipped.
+
+        Args:
+            baseline: The report of the earlier run to compare against
+            tolerance: The fraction the median time can be slower than the baseline's before it is a regression, e.g 0.1 for 10%
+
+        Returns:
+            List of (benchmark name, baseline median, median) for every benchmark slower than the baseline beyond the tolerance
+        """
+        regressions: list[tuple[str, float, float]] = []
+
+        for name, result in self.__results.items():
+            if name not in baseline.__results:
+                continue
+            baseline_median: float = baseline.__results[name]["median"]
+            if result["median"] > baseline_median * (1 + tolerance):
+                regressions.append((name, baseline_median, result["median"]))
+
+        return regressions
+
+    def write(self, path: str) -> None:
+        """Write the report as a JSON file, creating any directories that don't exist.
+
+        Args:
+            path: The file path relative to the root of the project
+        """
+        file_path: str = f"{ROOT_PATH}/{path}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        report: dict[str, Any] = {
+            "version": BenchmarkReport.FORMAT_VERSION,
+            "environment": self.__environment,
+            "results": self.__results,
+        }
+        with open(file_path, "w") as fp:
+            json.dump(report, fp, indent=4)
+
+    @staticmethod
+    def read(path: str) -> BenchmarkReport:
+        """Read a report written by write().
+
+        Args:
+            path: The file path relative to the root of the project
+
+        Returns:
+            The report
+
+        Raises:
+            Exception if the file is not a report of a supported version
+        """
+        file_path: str = f"{ROOT_PATH}/{path}"
+        with open(file_path, "r") as fp:
+            try:
+                report: dict[str, Any] = json.load(fp)
+            except Exception as e:
+                raise Exception(f"The benchmark results file at: {file_path} cannot be parsed as JSON. Error: {e}")
+
+        if report.get("version") != BenchmarkReport.FORMAT_VERSION:
+            raise Exception(f"The benchmark results file at: {file_path} has unsupported version {report.get('version')}. Supported: {BenchmarkReport.FORMAT_VERSION}")
+
+        benchmark_report: BenchmarkReport = BenchmarkReport()
+        benchmark_report.__environment = report["environment"]
+        for name, result in report["results"].items():
+            benchmark_report.add_result(name, result)
+        return benchmark_report
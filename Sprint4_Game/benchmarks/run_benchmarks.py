@@ -0,0 +1,246 @@
+"""Entry point for benchmarking the hot paths of drawing, the game rules and saving/loading, without a screen.
+
+Times each benchmark, writes the results as JSON and compares them against a baseline results file if one exists, exiting with status
+1 if any benchmark's median time per call is slower than the baseline's beyond the tolerance. Baselines are only comparable on the same
+machine and versions, so save one before making a change, then run again after it. Run from the root of the project.
+
+Example:
+    python -m benchmarks.run_benchmarks --save-baseline
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --filter draw_asset --tolerance 0.25
+"""
+
+import os
+
+# pygame draws to an off screen surface instead of opening a window, so benchmarks can run without a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import settings
+
+# the disk cache would turn cache misses into loads from disk (and fill the cache directory), so only the in memory caches are timed
+settings.DISK_SURFACE_CACHE = False
+
+from settings import REQUESTED_SCREEN_SIZE
+from definitions import ROOT_PATH
+from benchmarks.Benchmark import Benchmark
+from benchmarks.BenchmarkReport import BenchmarkReport
+from codec.saves.JSONSaveCodec import JSONSaveCodec
+from game_configurations.ArcadeGameConfiguration import ArcadeGameConfiguration
+from game_objects.characters.PlayableCharacter import PlayableCharacter
+from game_objects.game_board.DefaultGameBoard import DefaultGameBoard
+from screen.PygameScreenController import PygameScreenController
+from typing import Any, Callable, Optional
+
+import argparse
+import itertools
+import pygame
+import sys
+import tempfile
+
+# ----- CONFIGURATION VARIABLES --------------------------------------------------------------------------------------
+# RESULTS_PATH
+# The file path relative to the root project to write the results to, unless given with --output
+RESULTS_PATH: str = "benchmarks/results/latest.json"
+
+# BASELINE_PATH
+# The file path relative to the root project of the baseline results to compare against, unless given with --baseline
+BASELINE_PATH: str = "benchmarks/results/baseline.json"
+
+# GAME_SEED
+# The seed of the games benchmarked, so every run benchmarks the same game board
+GAME_SEED: int = 0
+
+# ASSET_PATH, ASSET_SIZE
+# The asset drawn by the drawing benchmarks, and the size it is drawn at
+ASSET_PATH: str = "assets/chit_cards/chit_card_back.png"
+ASSET_SIZE: tuple[int, int] = (64, 64)
+
+
+def generate_game(save_codec: JSONSaveCodec) -> ArcadeGameConfiguration:
+    """Generate the benchmarked game, laid out for the screen.
+
+    Args:
+        save_codec: The codec for the game to save with
+
+    Returns:
+        The configuration that generated the game
+    """
+    configuration: ArcadeGameConfiguration = ArcadeGameConfiguration(save_codec, seed=GAME_SEED)
+    configuration.generate_headless_game().close()
+    configuration.get_game_board().get_draw_assets_instructions()
+    return configuration
+
+
+def create_benchmarks(save_path: str) -> list[Benchmark]:
+    """Create the benchmarks.
+
+    Args:
+        save_path: The directory path relative to the root of the project for benchmarked games to save to
+
+    Returns:
+        The benchmarks
+    """
+    screen_controller: PygameScreenController = PygameScreenController.instance()
+
+    # ----- DRAWING -----------------------------------------------------------------------------------------------------
+    def draw_asset_hit() -> Callable[[], Any]:
+        return lambda: screen_controller.draw_asset(ASSET_PATH, 0, 0, ASSET_SIZE)
+
+    def draw_asset_rotated_hit() -> Callable[[], Any]:
+        return lambda: screen_controller.draw_asset(ASSET_PATH, 0, 0, ASSET_SIZE, 45)
+
+    def draw_asset_resize_miss() -> Callable[[], Any]:
+        # every call requests a size that has not been drawn before
+        counter: itertools.count[int] = itertools.count()
+
+        def draw() -> None:
+            n: int = next(counter)
+            screen_controller.draw_asset(ASSET_PATH, 0, 0, (16 + n % 256, 16 + n // 256))
+
+        return draw
+
+    def draw_asset_rotate_miss() -> Callable[[], Any]:
+        # every call requests a rotation that has not been drawn before. Rotations are cached to a tenth of a degree, so once every
+        # rotation has been drawn the height grows by a pixel, which resizes the image once per 3599 calls
+        counter: itertools.count[int] = itertools.count()
+
+        def draw() -> None:
+            n: int = next(counter)
+            screen_controller.draw_asset(ASSET_PATH, 0, 0, (ASSET_SIZE[0], ASSET_SIZE[1] + n // 3599), (n % 3599 + 1) / 10)
+
+        return draw
+
+    def get_draw_assets_instructions() -> Callable[[], Any]:
+        return generate_game(JSONSaveCodec(save_path)).get_game_board().get_draw_assets_instructions
+
+    def get_draw_assets_instructions_after_move() -> Callable[[], Any]:
+        # moving a character changes the tiles it moves between, so their instructions are rebuilt
+        configuration: ArcadeGameConfiguration = generate_game(JSONSaveCodec(save_path))
+        game_board: DefaultGameBoard = configuration.get_game_board()
+        character: PlayableCharacter = configuration.get_turn_manager().get_tracked_player_characters()[0]
+        game_board.move_character_by_steps(character, 1)
+
+        def move_and_get_instructions() -> None:
+            game_board.move_character_by_steps(character, 1)
+            game_board.get_draw_assets_instructions()
+            game_board.move_character_by_steps(character, -1)
+            game_board.get_draw_assets_instructions()
+
+        return move_and_get_instructions
+
+    # ----- RULES -------------------------------------------------------------------------------------------------------
+    def move_character_by_steps() -> Callable[[], Any]:
+        # a move forwards and back, so the character stays within the same tiles
+        configuration: ArcadeGameConfiguration = generate_game(JSONSaveCodec(save_path))
+        game_board: DefaultGameBoard = configuration.get_game_board()
+        character: PlayableCharacter = configuration.get_turn_manager().get_tracked_player_characters()[0]
+        game_board.move_character_by_steps(character, 1)
+
+        def move() -> None:
+            game_board.move_character_by_steps(character, 3)
+            game_board.move_character_by_steps(character, -3)
+
+        return move
+
+    def get_closest_character() -> Callable[[], Any]:
+        # characters on starting tiles have no closest character, so every character leaves their starting tile first
+        configuration: ArcadeGameConfiguration = generate_game(JSONSaveCodec(save_path))
+        game_board: DefaultGameBoard = configuration.get_game_board()
+        characters: list[PlayableCharacter] = configuration.get_turn_manager().get_tracked_player_characters()
+        for character in characters:
+            game_board.move_character_by_steps(character, 2)
+        return lambda: game_board.get_closest_character(characters[0])
+
+    # ----- SAVING & LOADING --------------------------------------------------------------------------------------------
+    def json_save_codec_save() -> Callable[[], Any]:
+        save_codec: JSONSaveCodec = JSONSaveCodec(f"{save_path}/save")
+        generate_game(save_codec)
+        return save_codec.save
+
+    def json_save_codec_load() -> Callable[[], Any]:
+        save_codec: JSONSaveCodec = JSONSaveCodec(f"{save_path}/load")
+        generate_game(save_codec)
+        save_codec.save()
+        return save_codec.load
+
+    def create_game_world_from_json_save() -> Callable[[], Any]:
+        # a new configuration is created for every load, as configurations load a game once
+        save_codec: JSONSaveCodec = JSONSaveCodec(f"{save_path}/load_world")
+        generate_game(save_codec)
+        save_codec.save()
+        save_data: dict[str, Any] = save_codec.load()
+        return lambda: ArcadeGameConfiguration(JSONSaveCodec(f"{save_path}/load_world"), seed=GAME_SEED).create_game_world_from_json_save(save_data)
+
+    return [
+        Benchmark("draw_asset_hit", draw_asset_hit),
+        Benchmark("draw_asset_rotated_hit", draw_asset_rotated_hit),
+        Benchmark("draw_asset_resize_miss", draw_asset_resize_miss),
+        Benchmark("draw_asset_rotate_miss", draw_asset_rotate_miss),
+        Benchmark("get_draw_assets_instructions", get_draw_assets_instructions),
+        Benchmark("get_draw_assets_instructions_after_move", get_draw_assets_instructions_after_move),
+        Benchmark("move_character_by_steps", move_character_by_steps),
+        Benchmark("get_closest_character", get_closest_character),
+        Benchmark("json_save_codec_save", json_save_codec_save),
+        Benchmark("json_save_codec_load", json_save_codec_load),
+        Benchmark("create_game_world_from_json_save", create_game_world_from_json_save),
+    ]
+
+
+if __name__ == "__main__":
+    # ----- ARGUMENTS -------------------------------------------------------------------------------------------------
+    parser = argparse.ArgumentParser(description="Benchmark drawing, the game rules and saving/loading, and compare against a baseline.")
+    parser.add_argument("--output", default=None, help=f"file to write the results to (default: {RESULTS_PATH})")
+    parser.add_argument("--baseline", default=None, help=f"results file to compare against if it exists (default: {BASELINE_PATH})")
+    parser.add_argument("--save-baseline", action="store_true", help="also write the results as the baseline for later runs")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="fraction slower than the baseline a benchmark can be before it is a regression")
+    parser.add_argument("--repeat", type=int, default=7, help="number of times each benchmark is timed")
+    parser.add_argument("--min-repeat-time", type=float, default=0.1, help="minimum seconds each timing takes, deciding the calls per timing")
+    parser.add_argument("--filter", nargs="+", default=None, help="only run benchmarks whose names contain any of these")
+    args = parser.parse_args()
+
+    results_path: str = os.path.relpath(os.path.abspath(args.output), ROOT_PATH) if args.output is not None else RESULTS_PATH
+    baseline_path: str = os.path.relpath(os.path.abspath(args.baseline), ROOT_PATH) if args.baseline is not None else BASELINE_PATH
+
+    # ----- PYGAME INIT -------------------------------------------------------------------------------------------------
+    pygame.init()
+    pygame.display.set_mode((REQUESTED_SCREEN_SIZE, REQUESTED_SCREEN_SIZE))
+
+    # ----- BENCHMARKS --------------------------------------------------------------------------------------------------
+    baseline: Optional[BenchmarkReport] = BenchmarkReport.read(baseline_path) if os.path.isfile(f"{ROOT_PATH}/{baseline_path}") else None
+    report: BenchmarkReport = BenchmarkReport()
+
+    print(f"{'benchmark':<42}{'median us':>12}{'min us':>12}{'calls':>10}{'baseline us':>14}{'change':>9}")
+    with tempfile.TemporaryDirectory() as save_directory:
+        for benchmark in create_benchmarks(os.path.relpath(save_directory, ROOT_PATH)):
+            if args.filter is not None and not any(name_filter in benchmark.get_name() for name_filter in args.filter):
+                continue
+
+            result: dict[str, float] = benchmark.run(args.repeat, args.min_repeat_time)
+            report.add_result(benchmark.get_name(), result)
+
+            comparison: str = ""
+            if baseline is not None and benchmark.get_name() in baseline.get_results():
+                baseline_median: float = baseline.get_results()[benchmark.get_name()]["median"]
+                comparison = f"{baseline_median * 1e6:14.2f}{(result['median'] / baseline_median - 1) * 100:+8.1f}%"
+            print(f"{benchmark.get_name():<42}{result['median'] * 1e6:12.2f}{result['min'] * 1e6:12.2f}{result['calls']:10d}{comparison}")
+
+    pygame.quit()
+
+    # ----- REPORT ------------------------------------------------------------------------------------------------------
+    report.write(results_path)
+    print(f"Results written to {results_path}")
+    if args.save_baseline:
+        report.write(baseline_path)
+        print(f"Baseline written to {baseline_path}")
+    elif baseline is None:
+        print(f"No baseline at {baseline_path} to compare against. Save one with --save-baseline")
+    else:
+        if baseline.get_environment() != report.get_environment():
+            print(f"Warning: the baseline was run on {baseline.get_environment()}, so results may not be comparable")
+
+        regressions: list[tuple[str, float, float]] = report.compare(baseline, args.tolerance)
+        for name, baseline_median, median in regressions:
+            print(f"REGRESSION {name}: {baseline_median * 1e6:.2f}us -> {median * 1e6:.2f}us ({(median / baseline_median - 1) * 100:+.1f}%)")
+        print(f"{len(regressions)} of {len(report.get_results())} benchmarks slower than the baseline beyond {args.tolerance * 100:.0f}%")
+        if len(regressions) > 0:
+            sys.exit(1)
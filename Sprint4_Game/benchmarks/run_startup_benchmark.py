@@ -0,0 +1,134 @@
+"""Entry point for benchmarking how long the game takes to start, using Python's -X importtime.
+
+Imports the modules main.py imports before showing the menu, and the game configuration it imports whilst the menu is showing, each
+in a fresh interpreter so nothing is already imported, and records the median and minimum seconds each took across repeats. Writes
+the results as JSON and compares them against a baseline results file like run_benchmarks.py, exiting with status 1 on a regression.
+The slowest modules imported before the menu are listed, to find what to import lazily. Run from the root of the project.
+
+Example:
+    python -m benchmarks.run_startup_benchmark --save-baseline
+    python -m benchmarks.run_startup_benchmark --slowest 20
+"""
+
+from definitions import ROOT_PATH
+from benchmarks.BenchmarkReport import BenchmarkReport
+from typing import Optional
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# ----- CONFIGURATION VARIABLES --------------------------------------------------------------------------------------
+# RESULTS_PATH
+# The file path relative to the root project to write the results to, unless given with --output
+RESULTS_PATH: str = "benchmarks/results/startup_latest.json"
+
+# BASELINE_PATH
+# The file path relative to the root project of the baseline results to compare against, unless given with --baseline
+BASELINE_PATH: str = "benchmarks/results/startup_baseline.json"
+
+# STARTUP_IMPORTS
+# The benchmarks, as benchmark name to (code run in a fresh interpreter, module whose cumulative import time is measured). The game
+# configuration is imported after main, as main imports it lazily whilst the menu is showing
+STARTUP_IMPORTS: dict[str, tuple[str, str]] = {
+    "import_main": ("import main", "main"),
+    "import_game_configuration": (
+        "import main; import game_configurations.ArcadeGameConfiguration",
+        "game_configurations.ArcadeGameConfiguration",
+    ),
+}
+
+
+def measure_import_times(code: str) -> dict[str, tuple[int, int]]:
+    """Run code in a fresh interpreter with -X importtime, and get the import time of every module it imported.
+
+    Args:
+        code: The code to run
+
+    Returns:
+        Dictionary with K = module name, V = (microseconds importing the module itself, microseconds including the modules it imported)
+
+    Raises:
+        Exception if the code failed to run
+    """
+    environment: dict[str, str] = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    process: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT_PATH, env=environment, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        raise Exception(f"Running: {code} failed with status {process.returncode}. Error: {process.stderr}")
+
+    # lines are "import time: self [us] | cumulative | imported package", with the module name indented by its import depth
+    import_times: dict[str, tuple[int, int]] = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative_time, module = line[len("import time:"):].split("|")
+        if not self_time.strip().isdigit():
+            continue  # the header line
+        import_times[module.strip()] = (int(self_time), int(cumulative_time))
+    return import_times
+
+
+if __name__ == "__main__":
+    # ----- ARGUMENTS -------------------------------------------------------------------------------------------------
+    parser = argparse.ArgumentParser(description="Benchmark the game's start up import times, and compare against a baseline.")
+    parser.add_argument("--output", default=None, help=f"file to write the results to (default: {RESULTS_PATH})")
+    parser.add_argument("--baseline", default=None, help=f"results file to compare against if it exists (default: {BASELINE_PATH})")
+    parser.add_argument("--save-baseline", action="store_true", help="also write the results as the baseline for later runs")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="fraction slower than the baseline a benchmark can be before it is a regression")
+    parser.add_argument("--repeat", type=int, default=7, help="number of fresh interpreters each benchmark is timed in")
+    parser.add_argument("--slowest", type=int, default=10, help="number of the slowest modules imported by main to list")
+    args = parser.parse_args()
+
+    results_path: str = os.path.relpath(os.path.abspath(args.output), ROOT_PATH) if args.output is not None else RESULTS_PATH
+    baseline_path: str = os.path.relpath(os.path.abspath(args.baseline), ROOT_PATH) if args.baseline is not None else BASELINE_PATH
+
+    # ----- BENCHMARKS --------------------------------------------------------------------------------------------------
+    baseline: Optional[BenchmarkReport] = BenchmarkReport.read(baseline_path) if os.path.isfile(f"{ROOT_PATH}/{baseline_path}") else None
+    report: BenchmarkReport = BenchmarkReport()
+    main_import_times: dict[str, tuple[int, int]] = dict()
+
+    print(f"{'benchmark':<42}{'median ms':>12}{'min ms':>12}{'baseline ms':>14}{'change':>9}")
+    for name, (code, module) in STARTUP_IMPORTS.items():
+        times: list[float] = []
+        for _ in range(args.repeat):
+            import_times: dict[str, tuple[int, int]] = measure_import_times(code)
+            times.append(import_times[module][1] / 1e6)
+            if name == "import_main":
+                main_import_times = import_times
+
+        result: dict[str, float] = {"median": statistics.median(times), "min": min(times), "calls": 1}
+        report.add_result(name, result)
+
+        comparison: str = ""
+        if baseline is not None and name in baseline.get_results():
+            baseline_median: float = baseline.get_results()[name]["median"]
+            comparison = f"{baseline_median * 1e3:14.2f}{(result['median'] / baseline_median - 1) * 100:+8.1f}%"
+        print(f"{name:<42}{result['median'] * 1e3:12.2f}{result['min'] * 1e3:12.2f}{comparison}")
+
+    # ----- SLOWEST MODULES ---------------------------------------------------------------------------------------------
+    print("\nSlowest modules imported by main (last run), by time importing the module itself:")
+    for module, (self_time, cumulative_time) in sorted(main_import_times.items(), key=lambda item: item[1][0], reverse=True)[: args.slowest]:
+        print(f"  {module:<56}{self_time / 1e3:8.2f}ms self{cumulative_time / 1e3:10.2f}ms cumulative")
+
+    # ----- REPORT ------------------------------------------------------------------------------------------------------
+    report.write(results_path)
+    print(f"\nResults written to {results_path}")
+    if args.save_baseline:
+        report.write(baseline_path)
+        print(f"Baseline written to {baseline_path}")
+    elif baseline is None:
+        print(f"No baseline at {baseline_path} to compare against. Save one with --save-baseline")
+    else:
+        if baseline.get_environment() != report.get_environment():
+            print(f"Warning: the baseline was run on {baseline.get_environment()}, so results may not be comparable")
+
+        regressions: list[tuple[str, float, float]] = report.compare(baseline, args.tolerance)
+        for name, baseline_median, median in regressions:
+            print(f"REGRESSION {name}: {baseline_median * 1e3:.2f}ms -> {median * 1e3:.2f}ms ({(median / baseline_median - 1) * 100:+.1f}%)")
+        print(f"{len(regressions)} of {len(report.get_results())} benchmarks slower than the baseline beyond {args.tolerance * 100:.0f}%")
+        if len(regressions) > 0:
+            sys.exit(1)
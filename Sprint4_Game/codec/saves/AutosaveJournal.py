@@ -0,0 +1,185 @@
+from typing import Any, Callable, Optional
+from codec.saves.JSONSaveCodec import JSONSaveCodec
+from game_concepts.events.WinEventListener import WinEventListener
+from game_concepts.events.WinEventPublisher import WinEventPublisher
+from game_objects.characters.PlayableCharacter import PlayableCharacter
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class AutosaveJournal(JSONSaveCodec, WinEventListener):
+    """Autosaves the game each turn to a rotating set of journal files, so a game that stopped without saving (e.g crashed) can be
+    resumed from its last turn. Saveables are the same as for JSONSaveCodec, and loading gives the same dictionary as the JSON save
+    of the same game.
+
+    Each entry is written to the next of slot_count files in turn, headed by its sequence number, the time it was written and a
+    checksum of the save data. Loading resumes from the newest entry whose checksum matches, so an entry damaged whilst being written
+    falls back to the one before it. Entries are written on a background thread, and if more turns are autosaved whilst an entry is
+    being written, only the newest is written next. The journal is cleared once a player wins, as there is nothing left to resume.
+
+    Author: Shen
+    """
+
+    SAVE_FILE_NAME = "autosave"  # the file name of the journal files, followed by the slot number
+
+    def __init__(self, save_path: str, slot_count: int = 3):
+        """Constructor.
+
+        Args:
+            save_path: The directory path relative to the root of the project to save the journal files to.
+            slot_count (optional): The number of journal files to rotate between
+        """
+        super().__init__(save_path)
+        self.__slot_count: int = slot_count
+        self.__queued_count_lock: threading.Lock = threading.Lock()
+        self.__queued_count: int = 0  # number of entries waiting to be written in the background
+        self.__next_sequence: Optional[int] = None  # sequence number of the next entry, found from the journal on first write
+        self.__is_game_over: bool = False
+
+        WinEventPublisher.instance().subscribe(self)
+
+    def load(self) -> dict[str, Any]:
+        """Load the save data of the newest valid entry in the journal.
+
+        Returns:
+            The dictionary of the newest valid entry
+
+        Raises:
+            Exception if the journal has no valid entries
+        """
+        newest_entry: Optional[tuple[int, float, dict[str, Any]]] = self.__get_newest_entry()
+        if newest_entry is None:
+            raise Exception(f"The autosave journal at: {self.get_save_file_path()} has no valid entries.")
+        return newest_entry[2]
+
+    def save_exists(self) -> bool:
+        """Get whether the journal has a valid entry to resume from.
+
+        Returns:
+            Whether a valid entry exists
+        """
+        return self.__get_newest_entry() is not None
+
+    def save_in_background(self, on_complete: Optional[Callable[[Optional[Exception]], None]] = None) -> None:
+        """Autosave the game to the journal, writing the entry on a background thread. Ignored once a player has won.
+
+        Args:
+            on_complete (optional): Called on the background thread once the entry is written or skipped for a newer one, with None if
+                it succeeded or the exception raised if it failed. If not given, failures are printed to the console.
+        """
+        if self.__is_game_over:
+            return
+
+        with self.__queued_count_lock:
+            self.__queued_count += 1
+        super().save_in_background(on_complete)
+
+    def get_last_save_time(self) -> Optional[float]:
+        """Get when the newest valid entry in the journal was written.
+
+        Returns:
+            The time in seconds since the epoch, or None if the journal has no valid entries
+        """
+        newest_entry: Optional[tuple[int, float, dict[str, Any]]] = self.__get_newest_entry()
+        return newest_entry[1] if newest_entry is not None else None
+
+    def get_save_file_path(self, slot: int = 0) -> str:
+        """Get the absolute path of a journal file.
+
+        Args:
+            slot (optional): The slot number of the journal file
+
+        Returns:
+            The path of the journal file
+        """
+        return f"{os.path.dirname(super().get_save_file_path())}/{self.SAVE_FILE_NAME}_{slot}.{self.SAVE_FILE_EXTENSION}"
+
+    def clear(self) -> None:
+        """Delete every entry in the journal, after any entries already being written. Used when starting a new game."""
+
+        def delete_entries() -> None:
+            for slot in range(self.__slot_count):
+                if os.path.isfile(self.get_save_file_path(slot)):
+                    os.remove(self.get_save_file_path(slot))
+            self.__next_sequence = 0
+
+        self._run_on_save_worker(delete_entries)
+
+    def _write_save_file(self, json_dict: dict[str, Any]) -> None:
+        """Write the json like dictionary as the next entry in the journal, unless a newer entry is already waiting to be written.
+
+        Args:
+            json_dict: The json like dictionary to write
+
+        Raises:
+            Exception when the json like dictionary cannot be encoded
+        """
+        with self.__queued_count_lock:
+            is_superseded: bool = self.__queued_count > 1
+            self.__queued_count = max(self.__queued_count - 1, 0)
+        if is_superseded:
+            return
+
+        if self.__next_sequence is None:
+            newest_entry: Optional[tuple[int, float, dict[str, Any]]] = self.__get_newest_entry()
+            self.__next_sequence = newest_entry[0] + 1 if newest_entry is not None else 0
+
+        try:
+            save_data: bytes = json.dumps(json_dict, separators=(",", ":")).encode("utf-8")
+        except Exception as e:
+            raise Exception(f"The final state of the json like dictionary cannot be encoded as json. Error: {e}")
+
+        header: dict[str, Any] = {"sequence": self.__next_sequence, "time": time.time(), "checksum": hashlib.sha256(save_data).hexdigest()}
+        self._write_file_atomically(self.get_save_file_path(self.__next_sequence % self.__slot_count), json.dumps(header).encode("utf-8") + b"\n" + save_data)
+        self.__next_sequence += 1
+
+    def __get_newest_entry(self) -> Optional[tuple[int, float, dict[str, Any]]]:
+        """Get the newest entry in the journal whose checksum matches its save data.
+
+        Returns:
+            Tuple of form (sequence number, time written, save data) of the newest valid entry, or None if there are no valid entries
+        """
+        newest_entry: Optional[tuple[int, float, dict[str, Any]]] = None
+
+        for slot in range(self.__slot_count):
+            entry: Optional[tuple[int, float, dict[str, Any]]] = AutosaveJournal.__read_entry(self.get_save_file_path(slot))
+            if entry is not None and (newest_entry is None or entry[0] > newest_entry[0]):
+                newest_entry = entry
+
+        return newest_entry
+
+    # ----------- Class methods -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __read_entry(file_path: str) -> Optional[tuple[int, float, dict[str, Any]]]:
+        """Read a journal file, checking the save data against its checksum.
+
+        Args:
+            file_path: The absolute path of the journal file
+
+        Returns:
+            Tuple of form (sequence number, time written, save data), or None if the file does not exist or is not a valid entry
+        """
+        try:
+            with open(file_path, "rb") as fp:
+                header_line, save_data = fp.read().split(b"\n", 1)
+            header: dict[str, Any] = json.loads(header_line)
+
+            if hashlib.sha256(save_data).hexdigest() != header["checksum"]:
+                return None
+            return header["sequence"], header["time"], json.loads(save_data)
+        except Exception:
+            return None
+
+    # --------- WinEventListener interface -------------------------------------------------------------------------------------------------
+    def on_player_win(self, character: PlayableCharacter) -> None:
+        """On a player win, stop autosaving and clear the journal, as the game can no longer be resumed.
+
+        Args:
+            character: The character who won
+        """
+        self.__is_game_over = True
+        self.clear()
@@ -0,0 +1,293 @@
+from typing import Any
+from codec.saves.JSONSaveCodec import JSONSaveCodec
+
+import struct
+
+
+class BinarySaveCodec(JSONSaveCodec):
+    """Save to and load from a compact binary file using json like python dictionaries. Saveables are the same as for
+    JSONSaveCodec, and a dictionary loaded from a binary save is equal to the one loaded from the JSON save of the same game, so
+    either codec can be used for any game.
+
+    The file starts with a magic number and format version, followed by a table of every distinct string (dictionary keys and
+    string values) in the order first written, then the root dictionary. Each value is a tag byte followed by its payload:
+    integers as zigzag varints, floats as 8 byte doubles, strings as varint indexes into the string table, and lists and
+    dictionaries as a varint length followed by their items. As keys such as 'type' and values such as 'tile_normal' repeat for
+    every tile, chit card and player, each is only stored once.
+
+    Author: Shen
+    """
+
+    SAVE_FILE_EXTENSION = "bin"  # the extension of the save file
+
+    __MAGIC: bytes = b"FDSV"  # bytes every binary save file starts with
+    __FORMAT_VERSION: int = 1  # version of the binary format, incremented on incompatible changes
+
+    # Tags written before each value to identify its type
+    __TAG_NONE: int = 0
+    __TAG_FALSE: int = 1
+    __TAG_TRUE: int = 2
+    __TAG_INT: int = 3
+    __TAG_FLOAT: int = 4
+    __TAG_STRING: int = 5
+    __TAG_LIST: int = 6
+    __TAG_DICT: int = 7
+
+    __FLOAT_STRUCT: struct.Struct = struct.Struct("<d")
+
+    def load(self) -> dict[str, Any]:
+        """Load the data in the binary save file as a python dictionary.
+
+        Returns:
+            The dictionary decoded from the binary save file
+
+        Raises:
+            Exception if the file could not be decoded.
+        """
+        binary_load_path: str = self.get_save_file_path()
+        with open(binary_load_path, "rb") as fp:
+            data: bytes = fp.read()
+
+        try:
+            return BinarySaveCodec.decode(data)
+        except Exception as e:
+            raise Exception(f"The binary save file at: {binary_load_path} cannot be decoded. Error: {e}")
+
+    def _encode_save_data(self, json_dict: dict[str, Any]) -> bytes:
+        """Encode the json like dictionary in the binary format as the contents of the save file.
+
+        Args:
+            json_dict: The json like dictionary to encode
+
+        Returns:
+            The contents of the save file
+
+        Raises:
+            Exception when the json like dictionary cannot be encoded
+        """
+        try:
+            return BinarySaveCodec.encode(json_dict)
+        except Exception as e:
+            raise Exception(f"The final state of the json like dictionary cannot be encoded as binary. Error: {e}")
+
+    # ----------- Class methods -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def encode(json_dict: dict[str, Any]) -> bytes:
+        """Encode a json like dictionary in the binary format. Can be used to convert JSON save data to a binary save.
+
+        Args:
+            json_dict: The json like dictionary
+
+        Returns:
+            The encoded bytes
+
+        Raises:
+            Exception if the dictionary contains a value that is not JSON compatible
+        """
+        body: bytearray = bytearray()
+        string_indexes: dict[str, int] = dict()  # K = string, V = index in the string table
+        BinarySaveCodec.__encode_value(json_dict, body, string_indexes)
+
+        header: bytearray = bytearray(BinarySaveCodec.__MAGIC)
+        header.append(BinarySaveCodec.__FORMAT_VERSION)
+        BinarySaveCodec.__encode_varint(len(string_indexes), header)
+        for string in string_indexes:
+            encoded_string: bytes = string.encode("utf-8")
+            BinarySaveCodec.__encode_varint(len(encoded_string), header)
+            header += encoded_string
+
+        return bytes(header + body)
+
+    @staticmethod
+    def decode(data: bytes) -> dict[str, Any]:
+        """Decode a json like dictionary from the binary format. Can be used to convert a binary save to JSON save data.
+
+        Args:
+            data: The encoded bytes
+
+        Returns:
+            The json like dictionary
+
+        Raises:
+            Exception if the data is not in the binary format or is incomplete
+        """
+        if data[: len(BinarySaveCodec.__MAGIC)] != BinarySaveCodec.__MAGIC:
+            raise Exception("The data is not a binary save.")
+        position: int = len(BinarySaveCodec.__MAGIC)
+
+        if data[position] != BinarySaveCodec.__FORMAT_VERSION:
+            raise Exception(f"Unsupported binary save format version {data[position]}. Supported: {BinarySaveCodec.__FORMAT_VERSION}")
+        position += 1
+
+        string_count, position = BinarySaveCodec.__decode_varint(data, position)
+        strings: list[str] = []
+        for _ in range(string_count):
+            length, position = BinarySaveCodec.__decode_varint(data, position)
+            if position + length > len(data):
+                raise Exception("The string table is incomplete.")
+            strings.append(data[position : position + length].decode("utf-8"))
+            position += length
+
+        json_dict, position = BinarySaveCodec.__decode_value(data, position, strings)
+        if not isinstance(json_dict, dict):
+            raise Exception("The root value is not a dictionary.")
+        if position != len(data):
+            raise Exception(f"Unexpected {len(data) - position} bytes after the root dictionary.")
+
+        return json_dict
+
+    @staticmethod
+    def __encode_value(value: Any, out: bytearray, string_indexes: dict[str, int]) -> None:
+        """Encode a JSON compatible value as a tag byte followed by its payload, adding new strings to the string table.
+
+        Args:
+            value: The value to encode
+            out: The bytes to append the encoded value to
+            string_indexes: The string table so far, as K = string, V = index in the string table
+
+        Raises:
+            Exception if the value is not JSON compatible
+        """
+        if value is None:
+            out.append(BinarySaveCodec.__TAG_NONE)
+        elif value is False:
+            out.append(BinarySaveCodec.__TAG_FALSE)
+        elif value is True:
+            out.append(BinarySaveCodec.__TAG_TRUE)
+        elif isinstance(value, int):
+            out.append(BinarySaveCodec.__TAG_INT)
+            BinarySaveCodec.__encode_varint(value * 2 if value >= 0 else -value * 2 - 1, out)  # zigzag, so small negatives stay small
+        elif isinstance(value, float):
+            out.append(BinarySaveCodec.__TAG_FLOAT)
+            out += BinarySaveCodec.__FLOAT_STRUCT.pack(value)
+        elif isinstance(value, str):
+            out.append(BinarySaveCodec.__TAG_STRING)
+            BinarySaveCodec.__encode_varint(string_indexes.setdefault(value, len(string_indexes)), out)
+        elif isinstance(value, (list, tuple)):
+            out.append(BinarySaveCodec.__TAG_LIST)
+            BinarySaveCodec.__encode_varint(len(value), out)
+            for item in value:
+                BinarySaveCodec.__encode_value(item, out, string_indexes)
+        elif isinstance(value, dict):
+            out.append(BinarySaveCodec.__TAG_DICT)
+            BinarySaveCodec.__encode_varint(len(value), out)
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise Exception(f"Dictionary keys must be strings, like in JSON. Key={key!r}")
+                BinarySaveCodec.__encode_varint(string_indexes.setdefault(key, len(string_indexes)), out)
+                BinarySaveCodec.__encode_value(item, out, string_indexes)
+        else:
+            raise Exception(f"Values of type {type(value).__name__} are not JSON compatible. Value={value!r}")
+
+    @staticmethod
+    def __decode_value(data: bytes, position: int, strings: list[str]) -> tuple[Any, int]:
+        """Decode the value starting at a position.
+
+        Args:
+            data: The encoded bytes
+            position: The index of the value's tag byte
+            strings: The string table
+
+        Returns:
+            Tuple of form (decoded value, index of the byte after the value)
+
+        Raises:
+            Exception if the value is not valid or is incomplete
+        """
+        if position >= len(data):
+            raise Exception("The data ended before a value.")
+        tag: int = data[position]
+        position += 1
+
+        match tag:
+            case BinarySaveCodec.__TAG_NONE:
+                return None, position
+            case BinarySaveCodec.__TAG_FALSE:
+                return False, position
+            case BinarySaveCodec.__TAG_TRUE:
+                return True, position
+            case BinarySaveCodec.__TAG_INT:
+                zigzag, position = BinarySaveCodec.__decode_varint(data, position)
+                return (zigzag // 2 if zigzag % 2 == 0 else -(zigzag + 1) // 2), position
+            case BinarySaveCodec.__TAG_FLOAT:
+                if position + BinarySaveCodec.__FLOAT_STRUCT.size > len(data):
+                    raise Exception("The data ended inside a float.")
+                return BinarySaveCodec.__FLOAT_STRUCT.unpack_from(data, position)[0], position + BinarySaveCodec.__FLOAT_STRUCT.size
+            case BinarySaveCodec.__TAG_STRING:
+                string_i, position = BinarySaveCodec.__decode_varint(data, position)
+                return BinarySaveCodec.__get_string(strings, string_i), position
+            case BinarySaveCodec.__TAG_LIST:
+                length, position = BinarySaveCodec.__decode_varint(data, position)
+                items: list[Any] = []
+                for _ in range(length):
+                    item, position = BinarySaveCodec.__decode_value(data, position, strings)
+                    items.append(item)
+                return items, position
+            case BinarySaveCodec.__TAG_DICT:
+                length, position = BinarySaveCodec.__decode_varint(data, position)
+                json_dict: dict[str, Any] = dict()
+                for _ in range(length):
+                    key_i, position = BinarySaveCodec.__decode_varint(data, position)
+                    value, position = BinarySaveCodec.__decode_value(data, position, strings)
+                    json_dict[BinarySaveCodec.__get_string(strings, key_i)] = value
+                return json_dict, position
+            case _:
+                raise Exception(f"Unknown value tag {tag} at byte {position - 1}.")
+
+    @staticmethod
+    def __get_string(strings: list[str], string_i: int) -> str:
+        """Get a string from the string table.
+
+        Args:
+            strings: The string table
+            string_i: The index of the string
+
+        Returns:
+            The string
+
+        Raises:
+            Exception if the index is outside the string table
+        """
+        if string_i >= len(strings):
+            raise Exception(f"String index {string_i} is outside the string table of {len(strings)} strings.")
+        return strings[string_i]
+
+    @staticmethod
+    def __encode_varint(value: int, out: bytearray) -> None:
+        """Encode a non negative integer in 7 bit groups, least significant first, with the high bit set on all but the last byte.
+
+        Args:
+            value: The non negative integer
+            out: The bytes to append the encoded integer to
+        """
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    @staticmethod
+    def __decode_varint(data: bytes, position: int) -> tuple[int, int]:
+        """Decode a non negative integer encoded with __encode_varint().
+
+        Args:
+            data: The encoded bytes
+            position: The index of the integer's first byte
+
+        Returns:
+            Tuple of form (decoded integer, index of the byte after the integer)
+
+        Raises:
+            Exception if the data ends inside the integer
+        """
+        value: int = 0
+        shift: int = 0
+
+        while True:
+            if position >= len(data):
+                raise Exception("The data ended inside an integer.")
+            byte: int = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, position
+            shift += 7
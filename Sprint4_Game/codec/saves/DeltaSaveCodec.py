@@ -0,0 +1,202 @@
+from typing import Any, Optional
+from codec.saves.JSONSaveCodec import JSONSaveCodec
+
+import json
+import os
+import uuid
+
+
+class DeltaSaveCodec(JSONSaveCodec):
+    """Save to and load from a base JSON file and an append only log of changes, using json like python dictionaries. Saveables
+    are the same as for JSONSaveCodec, and loading gives the same dictionary as the JSON save of the same game.
+
+    The first save writes the whole game to the base file. Each later save only appends the values that changed since the previous
+    save (e.g. character locations, flipped chit cards and the currently playing character) to the log, which is much smaller and
+    quicker to write than the whole game. Every compaction_interval saves, the log is compacted by writing the whole game to the base
+    file again and starting a new log.
+
+    Author: Shen
+    """
+
+    SAVE_FILE_EXTENSION = "base.json"  # the extension of the base file
+    LOG_FILE_EXTENSION = "log.jsonl"  # the extension of the log file
+
+    def __init__(self, save_path: str, compaction_interval: int = 50):
+        """Constructor.
+
+        Args:
+            save_path: The directory path relative to the root of the project to save the base and log files to.
+            compaction_interval (optional): The number of saves appended to the log before it is compacted into the base file
+        """
+        super().__init__(save_path)
+        self.__compaction_interval: int = compaction_interval
+        self.__last_saved: Optional[dict[str, Any]] = None  # the dictionary last written, None if nothing has been written yet
+        self.__log_record_count: int = 0  # number of saves appended to the log since the base file was written
+
+    def load(self) -> dict[str, Any]:
+        """Load the base file and apply the changes in the log to it. Changes from a log that belongs to an older base file (when the
+        game stopped mid compaction), and a last change that was only partially written (when the game stopped mid save) are ignored.
+
+        Returns:
+            The dictionary of the most recent save
+
+        Raises:
+            Exception if the base file could not be parsed as JSON.
+        """
+        base_file_path: str = self.get_save_file_path()
+        with open(base_file_path, "r") as fp:
+            try:
+                base: dict[str, Any] = json.load(fp)
+                json_dict: dict[str, Any] = base["save"]
+            except Exception as e:
+                raise Exception(f"The base save file at: {base_file_path} cannot be parsed. Error: {e}")
+
+        if not os.path.isfile(self.get_log_file_path()):
+            return json_dict
+
+        with open(self.get_log_file_path(), "r") as fp:
+            lines: list[str] = fp.read().splitlines()
+
+        if len(lines) == 0 or DeltaSaveCodec.__parse_log_line(lines[0]) != {"base": base["id"]}:
+            return json_dict
+
+        for line in lines[1:]:
+            changes: Optional[list[Any]] = DeltaSaveCodec.__parse_log_line(line)
+            if changes is None:
+                break
+            for path, value in changes:
+                json_dict = DeltaSaveCodec.__apply_change(json_dict, path, value)
+
+        return json_dict
+
+    def get_log_file_path(self) -> str:
+        """Get the absolute path of the log file.
+
+        Returns:
+            The path of the log file
+        """
+        return f"{os.path.dirname(self.get_save_file_path())}/{self.SAVE_FILE_NAME}.{self.LOG_FILE_EXTENSION}"
+
+    def get_last_save_time(self) -> Optional[float]:
+        """Get when the base file or log was last written.
+
+        Returns:
+            The time in seconds since the epoch, or None if there is no base file
+        """
+        if not self.save_exists():
+            return None
+        if not os.path.isfile(self.get_log_file_path()):
+            return os.path.getmtime(self.get_save_file_path())
+        return max(os.path.getmtime(self.get_save_file_path()), os.path.getmtime(self.get_log_file_path()))
+
+    def _write_save_file(self, json_dict: dict[str, Any]) -> None:
+        """Append the values that changed since the previous save to the log, or compact the log by writing the whole dictionary to
+        the base file if this is the first save or the log is due for compaction.
+
+        Args:
+            json_dict: The json like dictionary to write
+
+        Raises:
+            Exception when the json like dictionary cannot be encoded
+        """
+        if self.__last_saved is None or self.__log_record_count >= self.__compaction_interval:
+            self.__compact(json_dict)
+            return
+
+        changes: list[Any] = []
+        DeltaSaveCodec.__find_changes(self.__last_saved, json_dict, [], changes)
+        if len(changes) == 0:
+            return
+
+        try:
+            line: str = json.dumps(changes, separators=(",", ":")) + "\n"
+        except Exception as e:
+            raise Exception(f"The final state of the json like dictionary cannot be encoded as json. Error: {e}")
+
+        with open(self.get_log_file_path(), "a") as fp:
+            fp.write(line)
+            fp.flush()
+            os.fsync(fp.fileno())
+
+        self.__last_saved = json_dict
+        self.__log_record_count += 1
+
+    def __compact(self, json_dict: dict[str, Any]) -> None:
+        """Write the whole dictionary to a new base file, then start a new log for it. The base file is replaced first, so if the game
+        stops in between, the old log is ignored on load as it belongs to the old base file.
+
+        Args:
+            json_dict: The json like dictionary to write
+
+        Raises:
+            Exception when the json like dictionary cannot be encoded
+        """
+        base_id: str = uuid.uuid4().hex
+
+        try:
+            base_data: bytes = json.dumps({"id": base_id, "save": json_dict}, indent=4).encode("utf-8")
+        except Exception as e:
+            raise Exception(f"The final state of the json like dictionary cannot be encoded as json. Error: {e}")
+
+        self._write_file_atomically(self.get_save_file_path(), base_data)
+        self._write_file_atomically(self.get_log_file_path(), (json.dumps({"base": base_id}) + "\n").encode("utf-8"))
+
+        self.__last_saved = json_dict
+        self.__log_record_count = 0
+
+    # ----------- Class methods -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __find_changes(old: Any, new: Any, path: list[Any], changes: list[Any]) -> None:
+        """Find the values that differ between two json like values, as the smallest values that can be replaced to turn the old
+        value into the new one.
+
+        Args:
+            old: The old value
+            new: The new value
+            path: The dictionary keys and list indexes leading to the values from the root dictionary
+            changes: The list to add changes to, each in form [path, new value]
+        """
+        if isinstance(old, dict) and isinstance(new, dict) and old.keys() == new.keys():
+            for key in new:
+                DeltaSaveCodec.__find_changes(old[key], new[key], path + [key], changes)
+        elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+            for i in range(len(new)):
+                DeltaSaveCodec.__find_changes(old[i], new[i], path + [i], changes)
+        elif type(old) is not type(new) or old != new:
+            changes.append([path, new])
+
+    @staticmethod
+    def __apply_change(json_dict: dict[str, Any], path: list[Any], value: Any) -> dict[str, Any]:
+        """Replace the value at a path in a json like dictionary.
+
+        Args:
+            json_dict: The dictionary
+            path: The dictionary keys and list indexes leading to the value from the dictionary. Empty to replace the dictionary
+            value: The new value
+
+        Returns:
+            The dictionary with the value replaced
+        """
+        if len(path) == 0:
+            return value
+
+        container: Any = json_dict
+        for key in path[:-1]:
+            container = container[key]
+        container[path[-1]] = value
+        return json_dict
+
+    @staticmethod
+    def __parse_log_line(line: str) -> Optional[Any]:
+        """Parse a line of the log.
+
+        Args:
+            line: The line
+
+        Returns:
+            The parsed line, or None if it was only partially written
+        """
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
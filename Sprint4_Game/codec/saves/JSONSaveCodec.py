@@ -1,7 +1,8 @@
-from typing import Any
+from typing import Any, Callable, Optional
 from definitions import ROOT_PATH
 from codec.saves.JSONSavable import JSONSavable
 from codec.saves.SaveCodec import SaveCodec
+from concurrent.futures import ThreadPoolExecutor, Future
 
 import json
 import os
@@ -14,6 +15,7 @@ class JSONSaveCodec(SaveCodec[dict[str, Any]]):
     """
 
     SAVE_FILE_NAME = "save"  # the file name for the save file
+    SAVE_FILE_EXTENSION = "json"  # the extension of the save file
 
     def __init__(self, save_path: str):
         """Constructor.
@@ -22,8 +24,8 @@ class JSONSaveCodec(SaveCodec[dict[str, Any]]):
             save_path: The directory path relative to the root of the project to save the json file to.
         """
         super().__init__(save_path)
-        self.__json_dict: dict[str, Any] = dict()
         self.__saveables: list[JSONSavable] = []
+        self.__save_worker: Optional[ThreadPoolExecutor] = None  # single thread writing saves in order, started on first use
 
     def register_saveable(self, saveable: JSONSavable) -> None:
         """Register a saveable that can load and receive a json like dictionary.
@@ -42,7 +44,7 @@ class JSONSaveCodec(SaveCodec[dict[str, Any]]):
         Raises:
             Exception if the file could not be parsed as a JSON.
         """
-        json_load_path: str = f"{ROOT_PATH}/{self._save_path}/{self.SAVE_FILE_NAME}.json"
+        json_load_path: str = self.get_save_file_path()
         with open(json_load_path, "r") as fp:
             try:
                 loaded_dict: dict[str, Any] = json.load(fp)
@@ -52,6 +54,22 @@ class JSONSaveCodec(SaveCodec[dict[str, Any]]):
             finally:
                 fp.close()
 
+    def save_exists(self) -> bool:
+        """Get whether a save file exists at the configured save path.
+
+        Returns:
+            Whether the save file exists
+        """
+        return os.path.isfile(self.get_save_file_path())
+
+    def get_save_file_path(self) -> str:
+        """Get the absolute path of the save file.
+
+        Returns:
+            The path of the save file
+        """
+        return f"{ROOT_PATH}/{self._save_path}/{self.SAVE_FILE_NAME}.{self.SAVE_FILE_EXTENSION}"
+
     def save(self) -> None:
         """Notify all registered saveables of a save occuring, and pass in a json like dictionary that saveables
         can use to modify what will be written. Finally, save to the configured save path, whilst creating any
@@ -60,21 +78,130 @@ class JSONSaveCodec(SaveCodec[dict[str, Any]]):
         Raises:
             Exception when the final state of the json like dictionary cannot be encoded
         """
-        save_directory_path: str = f"{ROOT_PATH}/{self._save_path}"
+        json_dict: dict[str, Any] = self.__snapshot()
 
-        # notify saveables to save
-        for saveable in self.__saveables:
-            saveable.on_save(self.__json_dict)
+        if self.__save_worker is not None:
+            # wait behind any saves still being written in the background, so saves are always written in the order requested
+            self._run_on_save_worker(lambda: self._write_save_file(json_dict)).result()
+        else:
+            self._write_save_file(json_dict)
+
+    def save_in_background(self, on_complete: Optional[Callable[[Optional[Exception]], None]] = None) -> None:
+        """Notify all registered saveables of a save occuring on the calling thread, then encode and write the save file on a
+        background thread so the caller does not wait on encoding or disk I/O. Saves are written one at a time in the order requested.
 
-        # if save directory doesn't exist, create the directory
-        if not os.path.exists(save_directory_path):
-            os.makedirs(save_directory_path)
+        Args:
+            on_complete (optional): Called on the background thread once the save is written, with None if it succeeded or the
+                exception raised if it failed. If not given, failures are printed to the console.
+        """
+        json_dict: dict[str, Any] = self.__snapshot()
 
-        # encode json dict as JSON and save as file to path
-        with open(f"{save_directory_path}/{self.SAVE_FILE_NAME}.json", "w") as fp:
+        def write() -> None:
+            error: Optional[Exception] = None
             try:
-                json.dump(self.__json_dict, fp, indent=4)
+                self._write_save_file(json_dict)
             except Exception as e:
-                raise Exception(f"The final state of the json like dictionary cannot be encoded as json. Error: {e}")
+                error = e
+
+            if on_complete is not None:
+                on_complete(error)
+            elif error is not None:
+                print(f"The game could not be saved. Error: {error}")
+
+        self._run_on_save_worker(write)
+
+    def get_last_save_time(self) -> Optional[float]:
+        """Get when the save file was last written.
+
+        Returns:
+            The time in seconds since the epoch, or None if there is no save file
+        """
+        if not self.save_exists():
+            return None
+        return os.path.getmtime(self.get_save_file_path())
+
+    def _run_on_save_worker(self, action: Callable[[], None]) -> Future[None]:
+        """Run an action on the background thread saves are written on, after any saves already requested. Starts the thread on
+        first use.
+
+        Args:
+            action: The action to run
+
+        Returns:
+            The future of the action, which can be waited on
+        """
+        if self.__save_worker is None:
+            self.__save_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        return self.__save_worker.submit(action)
+
+    def _encode_save_data(self, json_dict: dict[str, Any]) -> bytes:
+        """Encode the json like dictionary as the contents of the save file. Subclasses can override this to save the dictionary in
+        another encoding.
+
+        Args:
+            json_dict: The json like dictionary to encode
+
+        Returns:
+            The contents of the save file
+
+        Raises:
+            Exception when the json like dictionary cannot be encoded
+        """
+        try:
+            return json.dumps(json_dict, indent=4).encode("utf-8")
+        except Exception as e:
+            raise Exception(f"The final state of the json like dictionary cannot be encoded as json. Error: {e}")
+
+    def __snapshot(self) -> dict[str, Any]:
+        """Notify all registered saveables of a save occuring, collecting what they write into a new json like dictionary. As
+        saveables only write new objects, the dictionary does not change after being returned.
+
+        Returns:
+            The json like dictionary describing the current state of the game
+        """
+        json_dict: dict[str, Any] = dict()
+        for saveable in self.__saveables:
+            saveable.on_save(json_dict)
+        return json_dict
+
+    def _write_save_file(self, json_dict: dict[str, Any]) -> None:
+        """Encode the json like dictionary and replace the save file with it atomically. Subclasses can override this to save the
+        dictionary across other files. Only ever called by one thread at a time, in the order saves were requested.
+
+        Args:
+            json_dict: The json like dictionary to write
+
+        Raises:
+            Exception when the json like dictionary cannot be encoded
+        """
+        self._write_file_atomically(self.get_save_file_path(), self._encode_save_data(json_dict))
+
+    def _write_file_atomically(self, file_path: str, data: bytes) -> None:
+        """Replace a file with new contents atomically, creating any directories that don't exist. The contents are written to a
+        temporary file and flushed to disk before being renamed over the file, so the file always holds either its previous or its
+        new contents, even if the game stops mid write.
+
+        Args:
+            file_path: The absolute path of the file
+            data: The new contents of the file
+        """
+        directory_path: str = os.path.dirname(file_path)
+        temporary_file_path: str = f"{file_path}.tmp"
+
+        # if directory doesn't exist, create the directory
+        if not os.path.exists(directory_path):
+            os.makedirs(directory_path)
+
+        with open(temporary_file_path, "wb") as fp:
+            fp.write(data)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(temporary_file_path, file_path)
+
+        # flush the rename to disk too. Windows does not support opening directories, and flushes renames itself
+        if os.name != "nt":
+            directory_fd: int = os.open(directory_path, os.O_RDONLY)
+            try:
+                os.fsync(directory_fd)
             finally:
-                fp.close()
+                os.close(directory_fd)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar, Generic
+from typing import Any, TypeVar, Generic, Callable, Optional
 
 T = TypeVar("T")
 
@@ -31,3 +31,21 @@ class SaveCodec(ABC, Generic[T]):
     def save(self) -> None:
         """Save any stored data into the save path."""
         ...
+
+    @abstractmethod
+    def save_in_background(self, on_complete: Optional[Callable[[Optional[Exception]], None]] = None) -> None:
+        """Capture the data to save on the calling thread, and save it into the save path on a background thread.
+
+        Args:
+            on_complete (optional): Called once the save is written, with None if it succeeded or the exception raised if it failed
+        """
+        ...
+
+    @abstractmethod
+    def save_exists(self) -> bool:
+        """Get whether there is a save file at the save path to load from.
+
+        Returns:
+            Whether a save file exists
+        """
+        ...
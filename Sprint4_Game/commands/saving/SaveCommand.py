@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Callable, Optional
 from commands.Command import Command
 from codec.saves.SaveCodec import SaveCodec
 
@@ -6,19 +6,23 @@ T = TypeVar("T")
 
 
 class SaveCommand(Command, Generic[T]):
-    """Command that when executes causes a save codec to perform a save.
+    """Command that when executes causes a save codec to perform a save in the background, so the game keeps running whilst
+    the save is written.
 
     Author: Shen
     """
 
-    def __init__(self, save_codec: SaveCodec[T]):
+    def __init__(self, save_codec: SaveCodec[T], on_complete: Optional[Callable[[Optional[Exception]], None]] = None):
         """Constructor.
 
         Args:
             save_codec: The save codec that will perform the save
+            on_complete (optional): Called on the save codec's background thread once the save is written, with None if it
+                succeeded or the exception raised if it failed
         """
         self.__save_codec: SaveCodec[T] = save_codec
+        self.__on_complete: Optional[Callable[[Optional[Exception]], None]] = on_complete
 
     def execute(self) -> None:
         """Execute the save for the save codec."""
-        return self.__save_codec.save()
+        return self.__save_codec.save_in_background(self.__on_complete)
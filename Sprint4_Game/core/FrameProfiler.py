@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import Any, Optional, Iterator
+from collections import deque
+from contextlib import contextmanager
+from definitions import ROOT_PATH
+
+import csv
+import json
+import os
+import time
+import pygame
+
+
+class FrameProfiler:
+    """Measures the time spent in each stage of every frame of a game loop (e.g drawing, handling events, updating the screen). Keeps
+    rolling percentiles over the most recent frames, which can be drawn as an overlay on the screen, and optionally keeps a trace of
+    every frame to write to a CSV or JSON file.
+
+    Author: Shen
+    """
+
+    PERCENTILES: tuple[int, ...] = (50, 95, 99)  # percentiles reported for each stage
+    FRAME_STAGE: str = "frame"  # name of the stage measuring the whole frame
+
+    __OVERLAY_FONT_SIZE: int = 18
+    __OVERLAY_TEXT_COLOUR: tuple[int, int, int] = (255, 255, 255)
+    __OVERLAY_BACKGROUND_COLOUR: tuple[int, int, int] = (0, 0, 0)
+
+    def __init__(self, window: int, keep_trace: bool):
+        """
+        Args:
+            window: The number of most recent frames to compute percentiles over
+            keep_trace: Whether to keep the stage times of every frame, for writing to a file with write_trace()
+        """
+        self.__window: int = window
+        self.__stage_times: dict[str, deque[float]] = dict()  # K = stage, V = seconds spent in the stage over the recent frames
+        self.__frame_stage_times: dict[str, float] = dict()  # K = stage, V = seconds spent in the stage in the current frame
+        self.__frame_start: Optional[float] = None
+        self.__frame_count: int = 0
+        self.__trace: Optional[list[dict[str, float]]] = [] if keep_trace else None  # stage times of every frame in ms
+        self.__overlay_font: Optional[pygame.font.Font] = None
+
+    def start_frame(self) -> None:
+        """Start measuring a new frame."""
+        self.__frame_start = time.perf_counter()
+        self.__frame_stage_times = dict()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Measure the time spent in a stage of the current frame whilst in the context. Time spent in the same stage more than once
+        in a frame is added together.
+
+        Args:
+            stage: The name of the stage
+        """
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__frame_stage_times[stage] = self.__frame_stage_times.get(stage, 0) + time.perf_counter() - start
+
+    def end_frame(self) -> None:
+        """Finish measuring the current frame, recording the time spent in each stage and in the whole frame.
+
+        Raises:
+            Exception if start_frame() was not called first
+        """
+        if self.__frame_start is None:
+            raise Exception("Tried ending a frame that was never started.")
+
+        self.__frame_stage_times[FrameProfiler.FRAME_STAGE] = time.perf_counter() - self.__frame_start
+        self.__frame_start = None
+        self.__frame_count += 1
+
+        for stage, seconds in self.__frame_stage_times.items():
+            if stage not in self.__stage_times:
+                self.__stage_times[stage] = deque(maxlen=self.__window)
+            self.__stage_times[stage].append(seconds)
+
+        if self.__trace is not None:
+            self.__trace.append({stage: seconds * 1000 for stage, seconds in self.__frame_stage_times.items()})
+
+    def get_percentiles(self) -> dict[str, dict[int, float]]:
+        """Get percentiles of the time spent in each stage over the most recent frames, in frames the stage happened in.
+
+        Returns:
+            Dictionary with K = stage, V = dictionary with K = percentile (of PERCENTILES), V = milliseconds
+        """
+        percentiles: dict[str, dict[int, float]] = dict()
+
+        for stage, stage_times in self.__stage_times.items():
+            sorted_times: list[float] = sorted(stage_times)
+            percentiles[stage] = {
+                percentile: sorted_times[min(len(sorted_times) - 1, len(sorted_times) * percentile // 100)] * 1000 for percentile in FrameProfiler.PERCENTILES
+            }
+
+        return percentiles
+
+    def get_frame_count(self) -> int:
+        """Get the number of frames measured.
+
+        Returns:
+            The number of frames
+        """
+        return self.__frame_count
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the percentiles of each stage at the top left of a surface.
+
+        Warning: Pygame must be initialised through pygame.init() before drawing.
+
+        Args:
+            surface: The surface to draw on
+
+        Returns:
+            The area of the surface drawn on
+        """
+        if self.__overlay_font is None:
+            self.__overlay_font = pygame.font.Font(None, FrameProfiler.__OVERLAY_FONT_SIZE)
+
+        percentile_names: str = "/".join(f"p{percentile}" for percentile in FrameProfiler.PERCENTILES)
+        lines: list[str] = [f"{percentile_names} ms over {min(self.__frame_count, self.__window)} frames"]
+        for stage, stage_percentiles in self.get_percentiles().items():
+            lines.append(f"{stage}: " + " / ".join(f"{ms:.2f}" for ms in stage_percentiles.values()))
+
+        line_images: list[pygame.Surface] = [
+            self.__overlay_font.render(line, True, FrameProfiler.__OVERLAY_TEXT_COLOUR, FrameProfiler.__OVERLAY_BACKGROUND_COLOUR) for line in lines
+        ]
+        y: int = 0
+        for line_image in line_images:
+            surface.blit(line_image, (0, y))
+            y += line_image.get_height()
+
+        return pygame.Rect(0, 0, max(line_image.get_width() for line_image in line_images), y)
+
+    def write_trace(self, path: str) -> None:
+        """Write the time spent in each stage of every frame to a file, creating any directories that don't exist. Written as CSV
+        if the path ends in .csv, otherwise JSON. Stages that did not happen in a frame are left empty (CSV) or missing (JSON).
+
+        Args:
+            path: The file path relative to the root of the project
+
+        Raises:
+            Exception if the profiler is not keeping a trace
+        """
+        if self.__trace is None:
+            raise Exception("Tried writing a trace from a frame profiler not keeping a trace.")
+
+        file_path: str = f"{ROOT_PATH}/{path}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with open(file_path, "w", newline="") as fp:
+            if path.endswith(".csv"):
+                stages: list[str] = list(self.__stage_times.keys())
+                writer = csv.DictWriter(fp, fieldnames=["frame_index"] + [f"{stage}_ms" for stage in stages])
+                writer.writeheader()
+                for i, frame in enumerate(self.__trace):
+                    writer.writerow({"frame_index": i, **{f"{stage}_ms": f"{ms:.4f}" for stage, ms in frame.items()}})
+            else:
+                trace: dict[str, Any] = {"percentiles_ms": self.get_percentiles(), "frames_ms": self.__trace}
+                json.dump(trace, fp)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Callable, Optional
+
+import heapq
+import itertools
+
+
+class FrameScheduler:
+    """Schedules actions to run after a delay on the thread running the game loop. Time only passes when the game loop advances the
+    scheduler each frame, so delays are measured in game time and actions never run concurrently with the game loop.
+
+    Author: Shen
+    """
+
+    def __init__(self):
+        self.__time: float = 0  # seconds of game time advanced so far
+        self.__actions: list[tuple[float, int, Callable[[], None]]] = []  # heap of (time due, order scheduled, action)
+        self.__order: itertools.count[int] = itertools.count()  # breaks ties between actions due at the same time in order scheduled
+
+    def schedule(self, delay: float, action: Callable[[], None]) -> None:
+        """Schedule an action to run once a delay has passed.
+
+        Args:
+            delay: The number of seconds of game time to wait before running the action
+            action: The action to run
+        """
+        heapq.heappush(self.__actions, (self.__time + delay, next(self.__order), action))
+
+    def advance(self, elapsed: float) -> None:
+        """Advance game time, running the actions that have become due in the order they are due. Actions scheduled by these actions
+        run in the same call if they are already due.
+
+        Args:
+            elapsed: The number of seconds of game time that passed
+        """
+        self.__time += elapsed
+
+        while len(self.__actions) > 0 and self.__actions[0][0] <= self.__time:
+            _, _, action = heapq.heappop(self.__actions)
+            action()
+
+    def get_time(self) -> float:
+        """Get the game time advanced so far.
+
+        Returns:
+            The number of seconds of game time advanced
+        """
+        return self.__time
+
+    def get_time_until_next_action(self) -> Optional[float]:
+        """Get the game time left until the next scheduled action is due.
+
+        Returns:
+            The number of seconds until the next action is due (0 if already due), or None if no actions are scheduled
+        """
+        if len(self.__actions) == 0:
+            return None
+        return max(self.__actions[0][0] - self.__time, 0)
+
+    def has_scheduled_actions(self) -> bool:
+        """Get whether any actions are waiting to run.
+
+        Returns:
+            Whether any actions are scheduled
+        """
+        return len(self.__actions) > 0
+
+    def clear(self) -> None:
+        """Cancel all scheduled actions."""
+        self.__actions.clear()
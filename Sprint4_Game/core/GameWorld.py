@@ -1,15 +1,20 @@
 from __future__ import annotations
-from typing import cast
-from settings import FRAMES_PER_SECOND, SCREEN_BACKGROUND_COLOUR
+from typing import Callable, Optional, ContextManager, cast
+from contextlib import nullcontext
+from settings import FRAMES_PER_SECOND, SCREEN_BACKGROUND_COLOUR, DIRTY_RECT_RENDERING, ADAPTIVE_FRAME_RATE, IDLE_DELAY, IDLE_FRAMES_PER_SECOND
+from settings import FRAME_PROFILER, FRAME_PROFILER_WINDOW, FRAME_PROFILER_OVERLAY, FRAME_PROFILER_TRACE_PATH
 from game_objects.characters.PlayableCharacter import PlayableCharacter
 from game_objects.game_board.GameBoard import GameBoard
 from screen.ModularClickableSprite import ModularClickableSprite
+from screen.HitTestGrid import HitTestGrid
 from screen.PygameScreenController import PygameScreenController
 from game_concepts.events.WinEventListener import WinEventListener
 from game_concepts.events.WinEventPublisher import WinEventPublisher
 from game_concepts.turns.TurnManager import TurnManager
 from metaclasses.SingletonMeta import SingletonMeta
-from threading import Timer
+from core.FrameScheduler import FrameScheduler
+from core.FrameProfiler import FrameProfiler
+from replays.ReplayRecorder import ReplayRecorder
 
 import pygame
 
@@ -34,6 +39,11 @@ class GameWorld(WinEventListener, metaclass=SingletonMeta):
         self.__turn_manager: TurnManager = turn_manager
         self.__should_game_run: bool = True
         self.__mouse_click_enabled = True
+        self.__player_input_enabled: bool = True  # whether clicks by the player are handled at all, e.g not whilst replaying
+        self.__scheduler: FrameScheduler = FrameScheduler()
+        self.__time_scale: float = 1  # seconds of game time that pass per second
+        self.__replay_recorder: Optional[ReplayRecorder] = None
+        self.__profiler: Optional[FrameProfiler] = FrameProfiler(FRAME_PROFILER_WINDOW, FRAME_PROFILER_TRACE_PATH is not None) if FRAME_PROFILER else None
 
         WinEventPublisher.instance().subscribe(self)
 
@@ -44,47 +54,201 @@ class GameWorld(WinEventListener, metaclass=SingletonMeta):
         Warning: Pygame and its display must be initialised through pygame.init() and pygame.display.set_mode() before running.
         """
         clock = pygame.time.Clock()
+        frame_time: float = 0  # seconds the previous frame took
+        idle_time: float = 0  # seconds since the last input or turn change
+        hit_test_grid: HitTestGrid = HitTestGrid([])  # index of the hitboxes of the clickable sprites, rebuilt when they change
+        should_redraw_screen: bool = True  # whether the entire screen should be redrawn next frame
+
+        overlay_rect: Optional[pygame.Rect] = None  # area of the screen the profiler overlay was drawn on last frame
+
         #### GAME LOOP
         while self.__should_game_run:
-            # Handle Drawing
-            PygameScreenController.instance().fill_screen_with_colour(SCREEN_BACKGROUND_COLOUR)
+            if self.__profiler is not None:
+                self.__profiler.start_frame()
 
-            PygameScreenController.instance().draw_drawable_by_assets([self.__game_board])
-            clickable_hitboxes = PygameScreenController.instance().draw_modular_clickable_sprites(self.__game_board.get_all_clickable_sprites())
+            # Handle Drawing. Areas invalidated before drawing are consumed first, as drawing can invalidate areas for the next frame.
+            dirty_rects: list[pygame.Rect] = self.__game_board.consume_dirty_rects()
+            is_animating: bool = len(dirty_rects) > 0
+            if overlay_rect is not None:
+                dirty_rects.append(overlay_rect)  # the overlay changes every frame
+
+            clickable_hitboxes: Optional[list[tuple[pygame.Rect, ModularClickableSprite]]] = None
+            if should_redraw_screen or not DIRTY_RECT_RENDERING:
+                clickable_hitboxes = self.__draw_game_board()
+                overlay_rect = self.__draw_profiler_overlay()
+                with self.__measure("display_update"):
+                    pygame.display.flip()  # update screen
+                should_redraw_screen = False
+            elif len(dirty_rects) > 0:
+                # only redraw and update the invalidated areas of the screen
+                PygameScreenController.instance().set_draw_area(dirty_rects[0].unionall(dirty_rects[1:]))
+                clickable_hitboxes = self.__draw_game_board()
+                PygameScreenController.instance().set_draw_area(None)
+                overlay_rect = self.__draw_profiler_overlay()
+                with self.__measure("display_update"):
+                    pygame.display.update(dirty_rects + ([overlay_rect] if overlay_rect is not None else []))
+
+            if clickable_hitboxes is not None and not hit_test_grid.is_for(clickable_hitboxes):
+                hit_test_grid = HitTestGrid(clickable_hitboxes)
 
             # Handle Events
-            for event in pygame.event.get():
-                match event.type:
-                    case pygame.QUIT:  # handle when X pressed on window
-                        self.__should_game_run = False
-                        break
+            with self.__measure("events"):
+                events: list[pygame.event.Event] = pygame.event.get()
+                for event in events:
+                    match event.type:
+                        case pygame.QUIT:  # handle when X pressed on window
+                            self.__should_game_run = False
+                            break
+
+                        case pygame.MOUSEBUTTONDOWN:  # handle mouse click
+                            if self.__mouse_click_enabled and self.__player_input_enabled:
+                                self.__fire_onclick_for_clicked_sprite(hit_test_grid, event.pos, self.__turn_manager.get_currently_playing_character())
 
-                    case pygame.MOUSEBUTTONDOWN:  # handle mouse click
-                        if self.__mouse_click_enabled:
-                            self.__fire_onclick_for_clicked_hitboxes(clickable_hitboxes, self.__turn_manager.get_currently_playing_character())
+                        case pygame.WINDOWEXPOSED | pygame.WINDOWRESIZED:  # screen contents may have been lost
+                            should_redraw_screen = True
 
             # Handle Player Turns
-            if self.__turn_manager.tick():
-                self.__game_board.on_player_turn_end()
+            with self.__measure("turn_manager_tick"):
+                turn_ended: bool = self.__turn_manager.tick()
+                if turn_ended:
+                    self.__game_board.on_player_turn_end()
 
-            # Update screen & Set FPS
-            pygame.display.flip()  # update screen
-            clock.tick(FRAMES_PER_SECOND)
+            # Handle Scheduled Actions
+            with self.__measure("scheduled_actions"):
+                self.__scheduler.advance(frame_time * self.__time_scale)
 
-        # Quit game once game loop broken
+            # Set FPS. Once idle, sleep until the next event, scheduled action or animation frame instead
+            with self.__measure("sleep"):
+                idle_time = 0 if len(events) > 0 or turn_ended else idle_time + frame_time
+                if ADAPTIVE_FRAME_RATE and idle_time >= IDLE_DELAY:
+                    self.__wait_while_idle(is_animating)
+                    frame_time = clock.tick() / 1000
+                else:
+                    frame_time = clock.tick(FRAMES_PER_SECOND) / 1000
+
+            if self.__profiler is not None:
+                self.__profiler.end_frame()
+
+        # Write the frame trace, then quit game once game loop broken
+        if self.__profiler is not None and FRAME_PROFILER_TRACE_PATH is not None:
+            self.__profiler.write_trace(FRAME_PROFILER_TRACE_PATH)
         pygame.quit()
 
-    def __fire_onclick_for_clicked_hitboxes(self, hitboxes: list[tuple[pygame.Rect, ModularClickableSprite]], player: PlayableCharacter) -> None:
-        """Fires on_click() for any objects containing hitboxes under the user's current cursor position.
+    def __wait_while_idle(self, is_animating: bool) -> None:
+        """Sleep until an event occurs, a scheduled action is due or, if an animation is playing, the next idle frame is due. An event
+        that ends the wait is left for the next frame to handle.
+
+        Args:
+            is_animating: Whether an animation is playing, i.e the screen changed this frame
+        """
+        timeouts: list[float] = [1 / IDLE_FRAMES_PER_SECOND] if is_animating else []
+        time_until_next_action: Optional[float] = self.__scheduler.get_time_until_next_action()
+        if time_until_next_action is not None:
+            timeouts.append(time_until_next_action / self.__time_scale)
+
+        # a timeout of 0 waits until the next event
+        event: pygame.event.Event = pygame.event.wait(max(int(min(timeouts) * 1000), 1) if len(timeouts) > 0 else 0)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+    def __draw_game_board(self) -> list[tuple[pygame.Rect, ModularClickableSprite]]:
+        """Draw the background, game board and its clickable sprites onto the screen.
+
+        Returns:
+            A list of tuples of form (rectangular hitbox, object associated with hitbox) for the drawn clickable sprites
+        """
+        with self.__measure("fill_screen"):
+            PygameScreenController.instance().fill_screen_with_colour(SCREEN_BACKGROUND_COLOUR)
+        with self.__measure("draw_drawable_by_assets"):
+            PygameScreenController.instance().draw_drawable_by_assets([self.__game_board])
+        with self.__measure("draw_modular_clickable_sprites"):
+            return PygameScreenController.instance().draw_modular_clickable_sprites(self.__game_board.get_all_clickable_sprites())
+
+    def __draw_profiler_overlay(self) -> Optional[pygame.Rect]:
+        """Draw the frame profiler's percentiles over the game board if the overlay is enabled.
+
+        Returns:
+            The area of the screen drawn on if drawn
+        """
+        if self.__profiler is None or not FRAME_PROFILER_OVERLAY:
+            return None
+        return self.__profiler.draw_overlay(pygame.display.get_surface())
+
+    def __measure(self, stage: str) -> ContextManager[None]:
+        """Measure the time spent in a stage of the current frame whilst in the context, if the frame profiler is enabled.
+
+        Args:
+            stage: The name of the stage
+
+        Returns:
+            The context to measure the stage in
+        """
+        if self.__profiler is None:
+            return nullcontext()
+        return self.__profiler.measure(stage)
+
+    def __fire_onclick_for_clicked_sprite(self, hit_test_grid: HitTestGrid, position: tuple[int, int], player: PlayableCharacter) -> None:
+        """Fires on_click() for the topmost clickable sprite under the position clicked if any.
 
         Args:
-            hitboxes: A list of tuples of form (rectangular hitbox, object associated with hitbox)
+            hit_test_grid: The index of the hitboxes of the drawn clickable sprites
+            position: The position clicked in form (x, y)
             player: The playable character of the current player
         """
-        for rect, clickable in hitboxes:
-            pos = pygame.mouse.get_pos()
-            if rect.collidepoint(pos):
-                clickable.on_click(player)
+        clickable: Optional[ModularClickableSprite] = hit_test_grid.get_topmost_at(position)
+        if clickable is not None:
+            if self.__replay_recorder is not None:
+                self.__replay_recorder.on_click(clickable, player, self.__scheduler.get_time())
+            clickable.on_click(player)
+
+    def schedule(self, delay: float, action: Callable[[], None]) -> None:
+        """Schedule an action to run on the game loop once a delay has passed. Actions run between frames, never at the same time as
+        the game loop, and are cancelled if the game stops first.
+
+        Args:
+            delay: The number of seconds to wait before running the action
+            action: The action to run
+        """
+        self.__scheduler.schedule(delay, action)
+
+    def get_time(self) -> float:
+        """Get the game time passed since the game started, which passes at the time scale and is used for scheduling actions.
+
+        Returns:
+            The number of seconds of game time passed
+        """
+        return self.__scheduler.get_time()
+
+    def set_time_scale(self, time_scale: float) -> None:
+        """Set how fast game time passes compared to real time, e.g to fast forward a replay. Scheduled actions, such as the delays
+        after turns end, happen sooner at higher time scales.
+
+        Args:
+            time_scale: The number of seconds of game time that pass per second
+        """
+        self.__time_scale = time_scale
+
+    def set_replay_recorder(self, replay_recorder: Optional[ReplayRecorder]) -> None:
+        """Set the recorder to record the player's clicks into, for replaying the game later.
+
+        Args:
+            replay_recorder: The recorder, or None to stop recording
+        """
+        self.__replay_recorder = replay_recorder
+
+    def disable_player_input(self) -> None:
+        """Ignore all clicks by the player, e.g whilst the game is being replayed. Unlike disable_mouse_clicks(), clicks are not
+        enabled again once a player's turn ends.
+        """
+        self.__player_input_enabled = False
+
+    def is_mouse_click_enabled(self) -> bool:
+        """Get whether user interaction with the game by mouse clicks is enabled, i.e the current player can flip chit cards.
+
+        Returns:
+            Whether mouse clicks are enabled
+        """
+        return self.__mouse_click_enabled
 
     def disable_mouse_clicks(self) -> None:
         """Disable user interaction with the game by mouse clicks."""
@@ -112,8 +276,7 @@ class GameWorld(WinEventListener, metaclass=SingletonMeta):
         self.disable_mouse_clicks()
 
         # stop game after delay
-        end_game_timer: Timer = Timer(GameWorld.__GAME_END_CLOSE_DELAY, self.stop_game)
-        end_game_timer.start()
+        self.schedule(GameWorld.__GAME_END_CLOSE_DELAY, self.stop_game)
 
     # -------- Static methods ---------------------------------------------------------------------------------------------------------------
     @staticmethod
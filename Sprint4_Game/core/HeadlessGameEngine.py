@@ -0,0 +1,174 @@
+from __future__ import annotations
+from typing import Optional
+from collections.abc import Sequence
+from game_objects.characters.PlayableCharacter import PlayableCharacter
+from game_objects.chit_cards.ChitCard import ChitCard
+from game_objects.game_board.GameBoard import GameBoard
+from game_concepts.events.WinEventListener import WinEventListener
+from game_concepts.events.WinEventPublisher import WinEventPublisher
+from game_concepts.turns.TurnManager import TurnManager
+
+import random
+
+
+class HeadlessGameEngine(WinEventListener):
+    """Plays a game on the same game board, chit cards and turn manager as a GameWorld, but without a screen, game loop or delays.
+    Chit cards are flipped by calling the engine instead of clicking on them, and turns change as soon as they end. Used to simulate
+    games quickly, e.g for balancing and testing. Many engines can exist at once, unlike the GameWorld.
+
+    Author: Shen
+    """
+
+    def __init__(self, game_board: GameBoard, turn_manager: TurnManager, chit_cards: Sequence[ChitCard], playable_characters: list[PlayableCharacter]):
+        """
+        Args:
+            game_board: The game board
+            turn_manager: The manager for managing turns
+            chit_cards: The chit cards on the game board that players flip
+            playable_characters: The playable characters playing on the game board
+        """
+        self.__game_board: GameBoard = game_board
+        self.__turn_manager: TurnManager = turn_manager
+        self.__chit_cards: Sequence[ChitCard] = chit_cards
+        self.__unflipped_chit_card_indexes: list[int] = [i for i, chit_card in enumerate(chit_cards) if not chit_card.get_flipped()]
+        self.__playable_characters: list[PlayableCharacter] = playable_characters
+        self.__playable_characters_set: set[PlayableCharacter] = set(playable_characters)
+        self.__winner: Optional[PlayableCharacter] = None
+        self.__turn_count: int = 0  # number of turns that have ended
+        self.__flip_count: int = 0  # number of chit cards flipped
+
+        WinEventPublisher.instance().subscribe(self)
+
+    # ----------- Class methods ----------------------------------------------------------------------------------------------------------------
+    def flip_chit_card(self, i: int) -> None:
+        """Flip a chit card as the currently playing character, as if they had clicked on it. If the character's turn ends as a
+        result, or there are no unflipped chit cards left to flip, turns change to the next character to play.
+
+        Args:
+            i: The index of the chit card to flip
+
+        Raises:
+            Exception if the game has already ended
+        """
+        if self.is_game_over():
+            raise Exception("Tried flipping a chit card after the game ended.")
+
+        chit_card: ChitCard = self.__chit_cards[i]
+        chit_card.on_click(self.__turn_manager.get_currently_playing_character())
+        if chit_card.get_flipped() and i in self.__unflipped_chit_card_indexes:
+            self.__unflipped_chit_card_indexes.remove(i)
+            self.__flip_count += 1
+
+        if self.is_game_over():
+            return
+
+        # a player can't continue their turn if every chit card is flipped
+        if len(self.__unflipped_chit_card_indexes) == 0:
+            self.__turn_manager.get_currently_playing_character().set_should_continue_turn(False)
+
+        # change turns until a player can play their turn, as turns of players who are skipped end immediately
+        turn_ended: bool = False
+        while self.__turn_manager.tick():
+            self.__turn_count += 1
+            turn_ended = True
+
+        if turn_ended:
+            self.__game_board.reset_chit_cards()
+            self.__unflipped_chit_card_indexes = list(range(len(self.__chit_cards)))
+
+    def play_random_game(self, rng: random.Random, max_turns: int) -> Optional[PlayableCharacter]:
+        """Play the game until a character wins or the number of turns reaches a limit, with every player flipping a randomly
+        chosen unflipped chit card each time. The engine stops listening for win events afterwards.
+
+        Args:
+            rng: The random number generator to choose chit cards with
+            max_turns: The number of turns after which to stop playing if no character has won
+
+        Returns:
+            The character who won if any
+        """
+        try:
+            while not self.is_game_over() and self.__turn_count < max_turns:
+                self.flip_chit_card(rng.choice(self.__unflipped_chit_card_indexes))
+        finally:
+            self.close()
+
+        return self.__winner
+
+    def get_unflipped_chit_card_indexes(self) -> list[int]:
+        """Get the indexes of the chit cards that can be flipped.
+
+        Returns:
+            The indexes of the unflipped chit cards in order
+        """
+        return list(self.__unflipped_chit_card_indexes)
+
+    def get_chit_cards(self) -> Sequence[ChitCard]:
+        """Get a read-only list of the chit cards that players flip.
+
+        Returns:
+            A read-only list containing the chit cards
+        """
+        return self.__chit_cards
+
+    def get_playable_characters(self) -> Sequence[PlayableCharacter]:
+        """Get a read-only list of the characters playing the game.
+
+        Returns:
+            A read-only list containing the playable characters
+        """
+        return self.__playable_characters
+
+    def get_currently_playing_character(self) -> PlayableCharacter:
+        """Get the character whose turn it is.
+
+        Returns:
+            The currently playing character
+        """
+        return self.__turn_manager.get_currently_playing_character()
+
+    def get_winner(self) -> Optional[PlayableCharacter]:
+        """Get the character who won the game if any.
+
+        Returns:
+            The character who won if any
+        """
+        return self.__winner
+
+    def is_game_over(self) -> bool:
+        """Get whether the game has ended, which is when a character has won.
+
+        Returns:
+            Whether the game has ended
+        """
+        return self.__winner is not None
+
+    def get_turn_count(self) -> int:
+        """Get the number of turns that have ended, including turns that were skipped.
+
+        Returns:
+            The number of turns
+        """
+        return self.__turn_count
+
+    def get_flip_count(self) -> int:
+        """Get the number of chit cards flipped.
+
+        Returns:
+            The number of chit cards flipped
+        """
+        return self.__flip_count
+
+    def close(self) -> None:
+        """Stop listening for win events. Must be called once the engine is no longer used, unless play_random_game() was used."""
+        WinEventPublisher.instance().unsubscribe(self)
+
+    # --------- WinEventListener interface -------------------------------------------------------------------------------------------------
+    def on_player_win(self, character: PlayableCharacter) -> None:
+        """On a player win, end the game if the character is playing in this engine's game. Wins in other games are ignored.
+
+        Args:
+            character: The character
+        """
+        if character in self.__playable_characters_set and self.__winner is None:
+            self.__winner = character
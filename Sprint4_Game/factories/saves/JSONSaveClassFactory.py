@@ -1,28 +1,7 @@
-from typing import Any, Optional, Callable
-from presets import *
-from settings import *
-from core.GameWorld import GameWorld
-from codec.saves.JSONSaveCodec import JSONSaveCodec
-from codec.saves.JSONSavable import JSONSavable
-from game_configurations.GameConfiguration import GameConfiguration
-from game_concepts.turns.DefaultTurnManager import DefaultTurnManger
-from game_concepts.turns.TurnManager import TurnManager
-from game_concepts.powers.SkipTurnPower import SkipTurnPower
-from game_concepts.powers.SwapPower import SwapPower
-from game_objects.characters.PlayableCharacter import PlayableCharacter
-from game_objects.characters.Dragon import Dragon
-from game_objects.chit_cards.ChitCard import ChitCard
-from game_objects.chit_cards.AnimalChitCard import AnimalChitCard
-from game_objects.chit_cards.PirateChitCard import PirateChitCard
-from game_objects.tiles.Tile import Tile
-from game_objects.tiles.CaveTile import CaveTile
-from game_objects.tiles.CaveTileVariant import CaveTileVariant
-from game_objects.game_board.GameBoard import GameBoard
-from game_objects.game_board.DefaultGameBoard import DefaultGameBoard
-from game_objects.animals.Animal import Animal
-from game_objects.characters.PlayableCharacterVariant import PlayableCharacterVariant
+from typing import Any
 from factories.ClassTypeIdentifier import ClassTypeIdentifier
-from utils.os_utils import *
+
+import importlib
 
 
 class JSONSaveClassFactory:
@@ -32,19 +11,22 @@ class JSONSaveClassFactory:
     """
 
     # MAPPING
-    # Defines the mapping from class type identifier to lambdas that create concrete classes using JSON dictionary save
-    # data and other required data.
-    MAPPING: dict[ClassTypeIdentifier, Callable[..., Any]] = {
-        ClassTypeIdentifier.tile_cave: lambda data: CaveTile.create_from_json_save(data),
-        ClassTypeIdentifier.tile_normal: lambda data: NormalTile.create_from_json_save(data),
-        ClassTypeIdentifier.player_dragon: lambda data: Dragon.create_from_json_save(data),
-        ClassTypeIdentifier.chit_card_animal: lambda data: AnimalChitCard.create_from_json_save(data),
-        ClassTypeIdentifier.chit_card_pirate: lambda data: PirateChitCard.create_from_json_save(data),
-        ClassTypeIdentifier.chit_card_power: lambda data, power: PowerChitCard.create_from_json_save(data, power),
-        ClassTypeIdentifier.power_skip: lambda data, turn_manager: SkipTurnPower.create_from_json_save(data, turn_manager),
-        ClassTypeIdentifier.power_swap: lambda data, game_board: SwapPower.create_from_json_save(data, game_board),
+    # Defines the mapping from class type identifier to the module and name of the concrete class, whose create_from_json_save() creates
+    # it using JSON dictionary save data and other required data. Modules are only imported once a class from them is first created, so
+    # importing the factory does not import every game object.
+    MAPPING: dict[ClassTypeIdentifier, tuple[str, str]] = {
+        ClassTypeIdentifier.tile_cave: ("game_objects.tiles.CaveTile", "CaveTile"),
+        ClassTypeIdentifier.tile_normal: ("game_objects.tiles.NormalTile", "NormalTile"),
+        ClassTypeIdentifier.player_dragon: ("game_objects.characters.Dragon", "Dragon"),
+        ClassTypeIdentifier.chit_card_animal: ("game_objects.chit_cards.AnimalChitCard", "AnimalChitCard"),
+        ClassTypeIdentifier.chit_card_pirate: ("game_objects.chit_cards.PirateChitCard", "PirateChitCard"),
+        ClassTypeIdentifier.chit_card_power: ("game_objects.chit_cards.PowerChitCard", "PowerChitCard"),
+        ClassTypeIdentifier.power_skip: ("game_concepts.powers.SkipTurnPower", "SkipTurnPower"),
+        ClassTypeIdentifier.power_swap: ("game_concepts.powers.SwapPower", "SwapPower"),
     }
 
+    __resolved_classes: dict[ClassTypeIdentifier, Any] = {}  # K = class type identifier, V = concrete class already imported
+
     def create_concrete_class(self, identifier: ClassTypeIdentifier, save_data: dict[str, Any], *args: Any) -> Any:
         """Create a concrete class based on the class identifier, save data and any other required parameters as
         specified in the same order as each concrete class's create_from_json_save() method.
@@ -61,4 +43,20 @@ class JSONSaveClassFactory:
             Exception if the passed in arguments were incompatible with the associated with identifier concrete class's
             create_from_save() method
         """
-        return self.MAPPING[identifier](save_data, *args)
+        return JSONSaveClassFactory.__resolve_class(identifier).create_from_json_save(save_data, *args)
+
+    # ----------- Class methods -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __resolve_class(identifier: ClassTypeIdentifier) -> Any:
+        """Get the concrete class bound to a class type identifier, importing its module on first use.
+
+        Args:
+            identifier: The identifier for the concrete class
+
+        Returns:
+            The concrete class
+        """
+        if identifier not in JSONSaveClassFactory.__resolved_classes:
+            module_name, class_name = JSONSaveClassFactory.MAPPING[identifier]
+            JSONSaveClassFactory.__resolved_classes[identifier] = getattr(importlib.import_module(module_name), class_name)
+        return JSONSaveClassFactory.__resolved_classes[identifier]
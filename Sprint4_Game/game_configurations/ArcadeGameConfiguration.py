@@ -1,16 +1,20 @@
 from __future__ import annotations
-from typing import Any, Optional
-from presets import *
-from settings import *
+from typing import Any, Optional, TYPE_CHECKING
+from collections.abc import Sequence
+from presets import randomised_volcano_card_sequence, add_dragon_pirate_chit_cards_in_sequence
 from core.GameWorld import GameWorld
+from core.HeadlessGameEngine import HeadlessGameEngine
+from screen.DrawAssetInstruction import DrawAssetInstruction
 from codec.saves.JSONSaveCodec import JSONSaveCodec
+from codec.saves.AutosaveJournal import AutosaveJournal
+from replays.ReplayLog import ReplayLog
+from replays.ReplayRecorder import ReplayRecorder
 from codec.saves.JSONSavable import JSONSavable
 from factories.saves.JSONSaveClassFactory import JSONSaveClassFactory
 from factories.ClassTypeIdentifier import ClassTypeIdentifier
 from game_configurations.GameConfiguration import GameConfiguration
 from game_concepts.turns.DefaultTurnManager import DefaultTurnManger
 from game_concepts.turns.TurnManager import TurnManager
-from game_concepts.powers.Power import Power
 from game_concepts.powers.SkipTurnPower import SkipTurnPower
 from game_concepts.powers.SwapPower import SwapPower
 from game_objects.characters.PlayableCharacter import PlayableCharacter
@@ -18,17 +22,21 @@ from game_objects.characters.Dragon import Dragon
 from game_objects.chit_cards.ChitCard import ChitCard
 from game_objects.chit_cards.AnimalChitCard import AnimalChitCard
 from game_objects.chit_cards.PirateChitCard import PirateChitCard
+from game_objects.chit_cards.PowerChitCard import PowerChitCard
 from game_objects.tiles.Tile import Tile
 from game_objects.tiles.CaveTile import CaveTile
 from game_objects.tiles.CaveTileVariant import CaveTileVariant
-from game_objects.game_board.GameBoard import GameBoard
 from game_objects.game_board.DefaultGameBoard import DefaultGameBoard
+from game_objects.game_board.DefaultGameBoardLayout import DefaultGameBoardLayout
+from game_objects.game_board.DefaultGameBoardAssetManifest import DefaultGameBoardAssetManifest
 from game_objects.animals.Animal import Animal
 from game_objects.characters.PlayableCharacterVariant import PlayableCharacterVariant
-from utils.os_utils import *
 
 import random
 
+if TYPE_CHECKING:
+    from simulation.VectorisedGameBoards import VectorisedGameBoards
+
 # TODO: In the future, save and load need to be refactored into several helper functions to reduce cognitive load - Shen
 
 
@@ -39,20 +47,47 @@ class ArcadeGameConfiguration(GameConfiguration):
     Author: Shen
     """
 
+    # GEN_MAIN_TILE_COUNT
+    # The number of tiles in the main tile sequence when using generate_game_world() to generate a GameWorld.
+    # Warning: Must be a multiple of 3, as volcano cards have 3 tiles each
+    GEN_MAIN_TILE_COUNT: int = 24
+
     # GEN_DEFAULT_STARTING_TILE_POSITIONS
     # The starting tile positions as indexes along the start of the main tile sequence to use for placing the starting tiles when
     # using generate_game_world() to generate a GameWorld.
     # Warning: Indexes must be within the bounds of the main number of tiles - 1
     __GEN_DEFAULT_STARTING_TILE_POSITIONS: list[int] = [3, 9, 15, 21]
 
-    def __init__(self, save_codec: JSONSaveCodec):
+    def __init__(
+        self,
+        save_codec: JSONSaveCodec,
+        pirate_chit_card_count: int = 4,
+        skip_chit_card_count: int = 2,
+        swap_chit_card_count: int = 2,
+        starting_tile_positions: Optional[list[int]] = None,
+        autosave_journal: Optional[AutosaveJournal] = None,
+        seed: Optional[int] = None,
+    ):
         """
         Constructor.
 
         Args:
             save_codec: The codec to use for saving.
+            pirate_chit_card_count: The number of dragon pirate chit cards to generate, alternating between 1 and 2 dragon pirates
+            skip_chit_card_count: The number of skip chit cards to generate, alternating between skipping 1 and 2 players
+            swap_chit_card_count: The number of swap chit cards to generate
+            starting_tile_positions (optional): The positions as indexes along the main tile sequence to place the starting tiles at.
+                Characters start in order of the positions from lowest to highest. Default is GEN_DEFAULT_STARTING_TILE_POSITIONS.
+            autosave_journal (optional): The journal to autosave every turn to. Default is no autosaving.
+            seed (optional): The seed of the random number generator that generates the game's tiles and chit cards and places its chit
+                cards. The same seed and arguments always generate the same game. Default is a random seed.
+
+        Raises:
+            Exception if the starting tile positions are not unique positions within the main tile sequence, one for each character
         """
-        self.__main_tile_sequence: list[Tile] = randomised_volcano_card_sequence(8)
+        self.__seed: int = seed if seed is not None else random.randrange(2**32)
+        self.__rng: random.Random = random.Random(self.__seed)  # the game's own generator, unaffected by other games
+        self.__main_tile_sequence: list[Tile] = randomised_volcano_card_sequence(ArcadeGameConfiguration.GEN_MAIN_TILE_COUNT // 3, self.__rng)
         self.__playable_characters: list[PlayableCharacter] = [
             Dragon(PlayableCharacterVariant.BLUE, "Blue"),
             Dragon(PlayableCharacterVariant.GREEN, "Green"),
@@ -65,13 +100,27 @@ class ArcadeGameConfiguration(GameConfiguration):
             CaveTile(Animal.SPIDER, CaveTileVariant.ORANGE, character=self.__playable_characters[2]),
             CaveTile(Animal.BAT, CaveTileVariant.PURPLE, character=self.__playable_characters[3]),
         ]
-        self.__starting_tile_positions_set: set[int] = set(self.__GEN_DEFAULT_STARTING_TILE_POSITIONS)  # positions as indexes along main sequence tiles
+        self.__starting_tile_positions: list[int] = sorted(
+            starting_tile_positions if starting_tile_positions is not None else self.__GEN_DEFAULT_STARTING_TILE_POSITIONS
+        )  # positions as indexes along main sequence tiles
+        self.__starting_tile_positions_set: set[int] = set(self.__starting_tile_positions)
+        self.__pirate_chit_card_count: int = pirate_chit_card_count
+        self.__skip_chit_card_count: int = skip_chit_card_count
+        self.__swap_chit_card_count: int = swap_chit_card_count
         self.__chit_cards: list[ChitCard] = []
         self.__turn_manager: TurnManager = DefaultTurnManger(self.__playable_characters, 0)
-        self.__game_board: Optional[GameBoard] = None
+        self.__game_board: Optional[DefaultGameBoard] = None
         self.__save_codec: JSONSaveCodec = save_codec
+        self.__autosave_journal: Optional[AutosaveJournal] = autosave_journal
+
+        if len(self.__starting_tile_positions_set) != len(self.__starting_tiles) or not all(
+            0 <= position < len(self.__main_tile_sequence) for position in self.__starting_tile_positions
+        ):
+            raise Exception(f"There must be {len(self.__starting_tiles)} unique starting tile positions within the main tile sequence. Passed in={starting_tile_positions}")
 
         save_codec.register_saveable(self)
+        if autosave_journal is not None:
+            autosave_journal.register_saveable(self)
 
     def generate_game_world(self) -> GameWorld:
         """Generate the game world with the default arcade fiery dragons game configuration.
@@ -79,43 +128,185 @@ class ArcadeGameConfiguration(GameConfiguration):
         Returns:
             The generated game world
         """
+        return GameWorld(self.__generate_game_board(), self.__turn_manager)
+
+    def generate_headless_game(self) -> HeadlessGameEngine:
+        """Generate a game with the default arcade fiery dragons game configuration, to be played without a screen.
+
+        Returns:
+            The headless game engine playing the generated game
+        """
+        game_board: DefaultGameBoard = self.__generate_game_board()
+        return HeadlessGameEngine(game_board, self.__turn_manager, game_board.get_chit_cards(), self.__playable_characters)
 
+    def generate_vectorised_game_boards(self, game_count: int, random_starts: bool = False) -> VectorisedGameBoards:
+        """Generate many games with the arcade fiery dragons game configuration, stored as arrays to be played all at once without a
+        screen. Each game has its own randomised volcano card sequence, and the configuration's chit cards and characters.
+
+        Args:
+            game_count: The number of games to generate
+            random_starts: Whether the starting tiles of each game are placed at random positions instead of the configuration's positions
+
+        Returns:
+            The generated games
+        """
+        # NumPy is only imported for vectorised games, as the game itself does not need it
+        import numpy as np
+        from simulation.VectorisedGameBoards import VectorisedGameBoards
+
+        main_tile_count: int = len(self.__main_tile_sequence)
+
+        # TILES
+        main_tile_animals: np.ndarray = np.array(
+            [
+                [VectorisedGameBoards.ANIMALS.index(tile.get_animal()) for tile in randomised_volcano_card_sequence(main_tile_count // 3, self.__rng)]
+                for _ in range(game_count)
+            ],
+            dtype=np.int8,
+        ).reshape(game_count, main_tile_count)
+        starting_tile_positions: np.ndarray = np.array(
+            [
+                sorted(self.__rng.sample(range(main_tile_count), len(self.__starting_tiles))) if random_starts else self.__starting_tile_positions
+                for _ in range(game_count)
+            ],
+            dtype=np.int32,
+        ).reshape(game_count, len(self.__starting_tiles))
+
+        # CHIT CARDS: the same chit cards as generated for a game world, as (kind, value, animal)
+        chit_cards: list[tuple[int, int, int]] = [
+            (VectorisedGameBoards.CHIT_CARD_ANIMAL, j, VectorisedGameBoards.ANIMALS.index(animal)) for animal in Animal if animal != Animal.UNIVERSAL for j in range(1, 4)
+        ]
+        chit_cards.extend((VectorisedGameBoards.CHIT_CARD_PIRATE, 1 if i % 2 == 0 else 2, 0) for i in range(self.__pirate_chit_card_count))
+        chit_cards.extend((VectorisedGameBoards.CHIT_CARD_SKIP, 1 if i % 2 == 0 else 2, 0) for i in range(self.__skip_chit_card_count))
+        chit_cards.extend((VectorisedGameBoards.CHIT_CARD_SWAP, 0, 0) for _ in range(self.__swap_chit_card_count))
+        chit_card_rows: np.ndarray = np.tile(np.array(chit_cards, dtype=np.int8).T[:, None, :], (1, game_count, 1))
+
+        starting_tile_animals: list[Animal] = []
+        for starting_tile in self.__starting_tiles:
+            animal: Optional[Animal] = starting_tile.get_animal()
+            if animal is None:
+                raise Exception("Starting tiles must have an animal to be generated as vectorised game boards.")
+            starting_tile_animals.append(animal)
+
+        return VectorisedGameBoards(main_tile_animals, starting_tile_positions, starting_tile_animals, chit_card_rows[0], chit_card_rows[1], chit_card_rows[2])
+
+    def __generate_game_board(self) -> DefaultGameBoard:
+        """Generate the game board, its chit cards and tiles with the default arcade fiery dragons game configuration.
+
+        Returns:
+            The generated game board
+        """
         # CHIT CARDS: Default
-        # Generate 12 animal chit cards, 4 pirate chit cards
-        for i, animal in enumerate(Animal):
+        # Generate 12 animal chit cards and dragon pirate chit cards (default 4)
+        for animal in Animal:
             # don't generate any universal matching chit cards
             if animal == Animal.UNIVERSAL:
                 continue
 
             for j in range(1, 4):
                 self.__chit_cards.append(AnimalChitCard(animal, j))
-            self.__chit_cards.append(PirateChitCard(1 if i % 2 == 0 else 2))
+        add_dragon_pirate_chit_cards_in_sequence(self.__pirate_chit_card_count, self.__chit_cards)
 
-        random.shuffle(self.__chit_cards)
+        self.__rng.shuffle(self.__chit_cards)
 
         # GAME BOARD
-        self.__game_board = DefaultGameBoard(
+        game_board: DefaultGameBoard = DefaultGameBoard(
             self.__main_tile_sequence,
-            [
-                (self.__starting_tiles[0], self.__main_tile_sequence[self.__GEN_DEFAULT_STARTING_TILE_POSITIONS[0]]),
-                (self.__starting_tiles[1], self.__main_tile_sequence[self.__GEN_DEFAULT_STARTING_TILE_POSITIONS[1]]),
-                (self.__starting_tiles[2], self.__main_tile_sequence[self.__GEN_DEFAULT_STARTING_TILE_POSITIONS[2]]),
-                (self.__starting_tiles[3], self.__main_tile_sequence[self.__GEN_DEFAULT_STARTING_TILE_POSITIONS[3]]),
-            ],
+            [(starting_tile, self.__main_tile_sequence[position]) for starting_tile, position in zip(self.__starting_tiles, self.__starting_tile_positions)],
             self.__chit_cards,
             self.__playable_characters,
             self.__save_codec,
+            self.__autosave_journal,
+            self.__rng,
         )
 
         # CHIT CARDS: Powers
-        # Add 2 skip and 2 swap power chit cards
-        self.__game_board.add_chit_card(PowerChitCard(SkipTurnPower(self.__turn_manager, 1), "assets/chit_cards/chit_card_skip_1.png"), True)
-        self.__game_board.add_chit_card(PowerChitCard(SkipTurnPower(self.__turn_manager, 2), "assets/chit_cards/chit_card_skip_2.png"), True)
-        for _ in range(2):
-            self.__game_board.add_chit_card(PowerChitCard(SwapPower(self.__game_board), "assets/chit_cards/chit_card_swap.png"), True)
+        # Add skip and swap power chit cards (default 2 each)
+        for i in range(self.__skip_chit_card_count):
+            skip_count: int = 1 if i % 2 == 0 else 2
+            game_board.add_chit_card(PowerChitCard(SkipTurnPower(self.__turn_manager, skip_count), f"assets/chit_cards/chit_card_skip_{skip_count}.png"), True)
+        for _ in range(self.__swap_chit_card_count):
+            game_board.add_chit_card(PowerChitCard(SwapPower(game_board), "assets/chit_cards/chit_card_swap.png"), True)
+
+        self.__game_board = game_board
+        return game_board
+
+    def get_generation_arguments(self) -> dict[str, Any]:
+        """Get the arguments the configuration was created with that decide the games it generates, besides the seed. Creating a
+        configuration with these keyword arguments and the same seed generates the same game.
+
+        Returns:
+            Dictionary with K = argument name, V = argument value
+        """
+        return {
+            "pirate_chit_card_count": self.__pirate_chit_card_count,
+            "skip_chit_card_count": self.__skip_chit_card_count,
+            "swap_chit_card_count": self.__swap_chit_card_count,
+            "starting_tile_positions": self.__starting_tile_positions,
+        }
+
+    def get_seed(self) -> int:
+        """Get the seed of the random number generator that generates the game.
+
+        Returns:
+            The seed
+        """
+        return self.__seed
+
+    def get_game_board(self) -> DefaultGameBoard:
+        """Get the game board of the generated or loaded game.
+
+        Returns:
+            The game board
 
-        # GAME WORLD
-        return GameWorld(self.__game_board, self.__turn_manager)
+        Raises:
+            Exception if no game has been generated or loaded
+        """
+        if self.__game_board is None:
+            raise Exception("Game board not defined. Run generate_game_world() or create_game_world_from_json_save() first.")
+        return self.__game_board
+
+    def get_chit_cards(self) -> Sequence[ChitCard]:
+        """Get the chit cards of the generated or loaded game, in the order placed on the game board.
+
+        Returns:
+            A read-only list containing the chit cards
+
+        Raises:
+            Exception if no game has been generated or loaded
+        """
+        return self.get_game_board().get_chit_cards()
+
+    def get_turn_manager(self) -> TurnManager:
+        """Get the turn manager of the generated or loaded game.
+
+        Returns:
+            The turn manager
+        """
+        return self.__turn_manager
+
+    def create_replay_recorder(self) -> ReplayRecorder:
+        """Create a recorder to record the generated game into a replay log.
+
+        Returns:
+            The replay recorder
+
+        Raises:
+            Exception if no game has been generated
+        """
+        return ReplayRecorder(ReplayLog(self.__seed, self.get_generation_arguments()), self.get_chit_cards(), self.__playable_characters)
+
+    def get_asset_manifest(self, screen_size: tuple[int, int]) -> list[DrawAssetInstruction]:
+        """Get the instructions for drawing every asset the default game board can draw on a screen size with the configuration's number
+        of main tiles.
+
+        Args:
+            screen_size: The size of the screen the game world is drawn on in form (width, height)
+
+        Returns:
+            The drawing instructions
+        """
+        return DefaultGameBoardAssetManifest(DefaultGameBoardLayout(screen_size, len(self.__main_tile_sequence))).get_draw_assets_instructions()
 
     def on_save(self, to_write: dict[str, Any]) -> None:
         """Upon save, configure the save dictionary to represent the state of the current arcade type game.
@@ -281,7 +472,9 @@ class ArcadeGameConfiguration(GameConfiguration):
             starting_tile.set_character_on_tile(character)
 
         # initialise game board and move character to correct positions
-        game_board: DefaultGameBoard = DefaultGameBoard(main_tiles, starting_tiles, chit_cards, playable_characters, self.__save_codec)
+        game_board: DefaultGameBoard = DefaultGameBoard(
+            main_tiles, starting_tiles, chit_cards, playable_characters, self.__save_codec, self.__autosave_journal, self.__rng
+        )
         game_board.move_characters_to_position_indexes(playable_character_positions, False)
 
         self.__game_board = game_board
@@ -1,6 +1,8 @@
 from typing import Protocol
 from abc import abstractmethod
 from core.GameWorld import GameWorld
+from core.HeadlessGameEngine import HeadlessGameEngine
+from screen.DrawAssetInstruction import DrawAssetInstruction
 from codec.saves.JSONSavable import JSONSavable
 
 
@@ -19,3 +21,25 @@ class GameConfiguration(JSONSavable, Protocol):
             The generated game world
         """
         ...
+
+    @abstractmethod
+    def generate_headless_game(self) -> HeadlessGameEngine:
+        """Generate a game with the configuration, to be played without a screen.
+
+        Returns:
+            The headless game engine playing the generated game
+        """
+        ...
+
+    @abstractmethod
+    def get_asset_manifest(self, screen_size: tuple[int, int]) -> list[DrawAssetInstruction]:
+        """Get the instructions for drawing every asset a game world generated with the configuration can draw, at the sizes and
+        rotations they will be drawn at. Used to load and transform the assets ahead of running the game world.
+
+        Args:
+            screen_size: The size of the screen the game world is drawn on in form (width, height)
+
+        Returns:
+            The drawing instructions
+        """
+        ...
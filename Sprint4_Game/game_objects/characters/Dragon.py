@@ -30,6 +30,8 @@ class Dragon(PlayableCharacter):
         """Draw the dragon if the drawing properties have been specified. Otherwise draws nothing. A dragon who is currently
         taking its turn will rotate slowly anticlockwise, otherwise, it will use it standard appearance (not rotated).
 
+        The same instructions are returned each call until the drawing properties change, with the rotation updated in place.
+
         Returns:
             The drawing instructions
         """
@@ -38,13 +40,22 @@ class Dragon(PlayableCharacter):
             return []
         x, y = draw_properties.get_coordinates()
 
-        # Turn sprite anticlockwise whilst playing. Otherwise draw at normal rotation (none).
+        # Turn sprite anticlockwise whilst playing, invalidating the area the sprite spins in for the next frame. Otherwise draw
+        # at normal rotation (none).
         if self._is_currently_playing:
             self.__draw_rotation += Dragon.__TURN_ROTATE_SPEED
+            self._dirty_rect_tracker.mark_draw_properties_dirty(draw_properties, any_rotation=True)
         else:
             self.__draw_rotation = 0
 
-        return [DrawAssetInstruction(f"assets/characters/dragon/dragon_{self._variant.value}.png", x, y, draw_properties.get_size(), self.__draw_rotation)]
+        if self._draw_instructions is None:
+            self._draw_instructions = [
+                DrawAssetInstruction(f"assets/characters/dragon/dragon_{self._variant.value}.png", x, y, draw_properties.get_size(), self.__draw_rotation)
+            ]
+        else:
+            self._draw_instructions[0].set_rotation(self.__draw_rotation)
+
+        return self._draw_instructions
 
     def on_save(self, to_write: dict[str, Any]) -> Optional[Any]:
         """When requested on save, return a JSON compatible object describing this dragon. Location of the player is left
@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
 from screen.DrawableByAsset import DrawableByAsset
+from screen.DrawAssetInstruction import DrawAssetInstruction
 from screen.DrawProperties import DrawProperties
+from screen.DirtyRectTrackable import DirtyRectTrackable
+from screen.DirtyRectTracker import DirtyRectTracker
 from game_objects.characters.PlayableCharacterVariant import PlayableCharacterVariant
 from codec.saves.JSONSavable import JSONSavable
 from typing import Optional
 
+import pygame
 
-class PlayableCharacter(ABC, DrawableByAsset, JSONSavable):
+
+class PlayableCharacter(ABC, DrawableByAsset, JSONSavable, DirtyRectTrackable):
     """Represents a playable character in the game. Actions in the game interact with this class to determine their
     behaviour.
 
@@ -25,6 +30,8 @@ class PlayableCharacter(ABC, DrawableByAsset, JSONSavable):
         self.__should_continue_turn: bool = True
         self.__name: str = name
         self._is_currently_playing: bool = False
+        self._dirty_rect_tracker: DirtyRectTracker = DirtyRectTracker()
+        self._draw_instructions: Optional[list[DrawAssetInstruction]] = None  # retained instructions, None when they must be rebuilt
 
     def should_continue_turn(self) -> bool:
         """Return whether the playable character should continue its turn for the next tick (i.e game loop).
@@ -48,6 +55,8 @@ class PlayableCharacter(ABC, DrawableByAsset, JSONSavable):
         Args:
             draw_data: The draw data
         """
+        if self._dirty_rect_tracker.mark_draw_properties_change(self._draw_properties, draw_properties, self._is_currently_playing):
+            self._draw_instructions = None
         self._draw_properties = draw_properties
 
     def set_is_currently_playing(self, playing: bool) -> None:
@@ -56,8 +65,18 @@ class PlayableCharacter(ABC, DrawableByAsset, JSONSavable):
         Args:
             playing: Whether the character is currently playing
         """
+        if playing != self._is_currently_playing:
+            self._dirty_rect_tracker.mark_draw_properties_dirty(self._draw_properties, any_rotation=True)
         self._is_currently_playing = playing
 
+    def consume_dirty_rects(self) -> list[pygame.Rect]:
+        """Get the areas of the screen invalidated by changes to the character since the last call, and stop tracking them.
+
+        Returns:
+            The invalidated areas of the screen
+        """
+        return self._dirty_rect_tracker.consume()
+
     def name(self) -> str:
         """Gets the name of the playable character.
 
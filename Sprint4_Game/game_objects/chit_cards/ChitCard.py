@@ -1,16 +1,20 @@
 from screen.ModularClickableSprite import ModularClickableSprite
 from screen.DrawProperties import DrawProperties
 from screen.DrawAssetInstruction import DrawAssetInstruction
+from screen.DirtyRectTracker import DirtyRectTracker
 from game_objects.game_board.GameBoard import GameBoard
 from codec.saves.JSONSavable import JSONSavable
 
 from typing import Optional
 from abc import ABC, abstractmethod
 
+import pygame
+
 
 class ChitCard(ModularClickableSprite, ABC, JSONSavable):
     """Represents a chit card. A chit card is a game element that can be flipped, and can be pressed on to perform
-    an associated functionality.
+    an associated functionality. The drawing instructions for the chit card are kept between frames, and are only rebuilt
+    when the chit card is flipped or its draw properties change.
 
     Author: Shen
     """
@@ -25,6 +29,8 @@ class ChitCard(ModularClickableSprite, ABC, JSONSavable):
         self.__flipped: bool = False
         self._draw_properties: Optional[DrawProperties] = draw_properties
         self._board_delegate: Optional[GameBoard] = None
+        self.__dirty_rect_tracker: DirtyRectTracker = DirtyRectTracker()
+        self.__draw_instructions: Optional[list[tuple[DrawAssetInstruction, ModularClickableSprite]]] = None  # retained, None when they must be rebuilt
 
     def set_flipped(self, state: bool) -> None:
         """Set the flipped state of the chit card.
@@ -32,6 +38,9 @@ class ChitCard(ModularClickableSprite, ABC, JSONSavable):
         Args:
             state: Whether the chit card is flipped
         """
+        if state != self.__flipped:
+            self.__dirty_rect_tracker.mark_draw_properties_dirty(self._draw_properties)
+            self.__draw_instructions = None
         self.__flipped = state
 
     def set_game_board_delegate(self, game_board: GameBoard) -> None:
@@ -56,8 +65,18 @@ class ChitCard(ModularClickableSprite, ABC, JSONSavable):
         Args:
             draw_properties: The draw properties
         """
+        if self.__dirty_rect_tracker.mark_draw_properties_change(self._draw_properties, draw_properties):
+            self.__draw_instructions = None
         self._draw_properties = draw_properties
 
+    def consume_dirty_rects(self) -> list[pygame.Rect]:
+        """Get the areas of the screen invalidated by changes to the chit card since the last call, and stop tracking them.
+
+        Returns:
+            The invalidated areas of the screen
+        """
+        return self.__dirty_rect_tracker.consume()
+
     def get_draw_clickable_assets_instructions(self) -> list[tuple[DrawAssetInstruction, ModularClickableSprite]]:
         """Get the instructions required to draw the clickable chit cards.
 
@@ -70,7 +89,9 @@ class ChitCard(ModularClickableSprite, ABC, JSONSavable):
         """
         if self._draw_properties is None:
             raise Exception("Tried drawing, but the draw properties (properties required for drawing) weren't set.")
-        return self._on_draw_request(self._draw_properties)
+        if self.__draw_instructions is None:
+            self.__draw_instructions = self._on_draw_request(self._draw_properties)
+        return self.__draw_instructions
 
     @abstractmethod
     def _on_draw_request(self, draw_properties: DrawProperties) -> list[tuple[DrawAssetInstruction, ModularClickableSprite]]:
@@ -27,6 +27,14 @@ class PowerChitCard(ChitCard):
         self.__image_path: str = image_path
         self.__power: Power = power
 
+    def get_power(self) -> Power:
+        """Get the power the chit card executes when clicked.
+
+        Returns:
+            The power
+        """
+        return self.__power
+
     def _on_draw_request(self, draw_properties: DrawProperties) -> list[tuple[DrawAssetInstruction, ModularClickableSprite]]:
         """On draw request, returns instructions to draw a chit card that displays its back when its not flipped. When flipped,
         it draws dragon pirate symbol with an indication of the number of sybmbols.
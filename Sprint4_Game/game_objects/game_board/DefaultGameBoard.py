@@ -1,8 +1,9 @@
 from __future__ import annotations
-from threading import Timer
 from typing import Optional, overload, Any
 from collections.abc import Sequence
+from bisect import bisect_left, insort
 from game_objects.game_board.GameBoard import GameBoard
+from game_objects.game_board.DefaultGameBoardLayout import DefaultGameBoardLayout
 from game_objects.characters.PlayableCharacter import PlayableCharacter
 from game_objects.tiles.Tile import Tile
 from game_objects.chit_cards.ChitCard import ChitCard
@@ -15,19 +16,23 @@ from screen.ui.buttons.Button import Button
 from codec.saves.SaveCodec import SaveCodec
 from core.GameWorld import GameWorld
 from commands.saving.SaveCommand import SaveCommand
-from utils.math_utils import *
 import random
+import pygame
 
 
 class DefaultGameBoard(GameBoard, DrawableByAsset):
     """Initialises and represents the default fiery dragons game board. Cells are drawn in a circle.
     Caves jut out from the main sequence of tiles. Chit cards are randomly placed within the inner ring.
 
+    The drawing layout of the board is computed once per screen size, and is only recomputed when the screen size changes
+    or a chit card is added.
+
     Author: Shen
     """
 
     ### CONFIG
     TURN_END_RESET_DELAY: float = 1.5  # Seconds to delay resetting game board on player turn end
+    STEP_TABLE_MAX_STEPS: int = 6  # Moves of up to this many steps either way are looked up in precomputed step tables
 
     def __init__(
         self,
@@ -36,6 +41,8 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
         chit_cards: list[ChitCard],
         playable_characters: list[PlayableCharacter],
         save_codec: SaveCodec[dict[str, Any]],
+        autosave_codec: Optional[SaveCodec[dict[str, Any]]] = None,
+        rng: Optional[random.Random] = None,
     ):
         """
         Args:
@@ -44,6 +51,9 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
             chit_cards: The chit cards to use for the game board. Will be placed in order from left to right, top to bottom.
             playable_characters: The playable characters to play on the game board
             save_codec: JSON type save codec to use for saving functionalities
+            autosave_codec (optional): JSON type save codec to autosave to in the background at the start of every turn
+            rng (optional): The random number generator to place chit cards with, e.g the game's own so it can be regenerated from its
+                seed. Default is a new unseeded generator.
 
         Raises:
             Exception if the number of players to be playing on the board is less than 2.
@@ -62,18 +72,32 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
         self.__playable_characters: list[PlayableCharacter] = playable_characters
         self.__character_location: dict[PlayableCharacter, int] = dict()  # K = character, V = index along main tile sequence
         self.__character_starting_tiles: dict[PlayableCharacter, Tile] = dict()  # K = character, V = their starting tile
+        self.__character_order: dict[PlayableCharacter, int] = dict()  # K = character, V = order used to break ties between closest characters
+        self.__tile_indexes: dict[Tile, int] = dict()  # K = tile, V = index along tile sequence (last index for starting tile destinations)
+        self.__occupied_positions: list[int] = []  # sorted indexes along tile sequence of characters not on starting tiles
+        self.__position_characters: dict[int, PlayableCharacter] = dict()  # K = index of an occupied position, V = character on it
+        self.__next_tile_indexes: list[int] = []  # index of the next tile clockwise from each tile, passing over starting tiles
+        self.__previous_tile_indexes: list[int] = []  # index of the next tile anti-clockwise from each tile, passing over starting tiles
+        self.__step_tables: dict[PlayableCharacter, list[Optional[int]]] = dict()  # K = character, V = step table, see __get_step_destination()
         self.__save_codec: SaveCodec[dict[str, Any]] = save_codec
+        self.__autosave_codec: Optional[SaveCodec[dict[str, Any]]] = autosave_codec
+        self.__rng: random.Random = rng if rng is not None else random.Random()
+        self.__turn_end_count: int = 0  # number of turns that have ended, so only the reset of the latest turn end runs
+        self.__save_button: Button = Button("assets/menu/save.png", SaveCommand(self.__save_codec, self.__on_save_complete))
+        self.__layout: Optional[DefaultGameBoardLayout] = None  # computed on first use, see __get_layout()
+        self.__tile_draw_order: list[Tile] = []  # tiles in the order they should be drawn, each tile appearing once
+        self.__tile_draw_instructions: list[Optional[list[DrawAssetInstruction]]] = []  # retained instructions of each tile in draw order
+        self.__draw_instructions: list[DrawAssetInstruction] = []  # retained instructions for the entire board
 
         # ------ INITIALISATION ------------------------------------------------------------------------------------------------------------------------------------------------
-        # initialise chit card position & size and add to clickables. Also set delegate
-        self.__set_chit_card_draw_properties()
+        # add chit cards to clickables, and set delegate
         self.__clickables.extend(chit_cards)
 
         for chit_card in self.__chit_cards:
             chit_card.set_game_board_delegate(self)
 
         # add save button
-        self.__configure_and_add_save_button()
+        self.__clickables.append(self.__save_button)
 
         # Populate starting tile stores, and create main tile sequence, taking in account starting tiles.
         dest_to_start_tile: dict[Tile, Tile] = dict()
@@ -91,6 +115,14 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
                 self.__tile_sequence.append(dest_to_start_tile[tile])
             self.__tile_sequence.append(tile)
 
+        # Initialise draw order. Duplicate starting tile destinations are only drawn once [increase game performance]
+        tiles_in_draw_order: set[Tile] = set()
+        for tile in self.__tile_sequence:
+            if tile not in tiles_in_draw_order:
+                tiles_in_draw_order.add(tile)
+                self.__tile_draw_order.append(tile)
+                self.__tile_draw_instructions.append(None)
+
         # Initialise character starting location,
         for tile in self.__starting_tiles:
             char_on_tile = tile.get_character_on_tile()
@@ -109,22 +141,65 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
         if player_count < 2:
             raise Exception(f"The starting tiles had in total {player_count} players. There must be at least 2.")
 
+        # Initialise occupancy index for finding tiles and the closest characters [increase game performance]
+        for i, tile in enumerate(self.__tile_sequence):
+            self.__tile_indexes[tile] = i
+
+        for i, character in enumerate(self.__character_location):
+            self.__character_order[character] = i
+            self.__add_to_occupancy_index(character)
+
+        # Precompute where each character lands moving any number of steps from every position [increase game performance]
+        tile_count: int = len(self.__tile_sequence)
+        for i in range(tile_count):
+            # 2 to account for duplicate starting destination tile
+            next_i, previous_i = (i + 1) % tile_count, (i - 1) % tile_count
+            self.__next_tile_indexes.append((next_i + 2) % tile_count if self.__tile_sequence[next_i] in self.__starting_tiles_set else next_i)
+            self.__previous_tile_indexes.append((previous_i - 2) % tile_count if self.__tile_sequence[previous_i] in self.__starting_tiles_set else previous_i)
+
+        for character, starting_tile in self.__character_starting_tiles.items():
+            self.__step_tables[character] = self.__build_step_table(self.__tile_sequence.index(starting_tile))
+
     # ----------- Initialisation helpers -------------------------------------------------------------------------------------------
-    def __set_chit_card_draw_properties(self) -> None:
+    def __build_step_table(self, starting_tile_i: int) -> list[Optional[int]]:
+        """Build the step table of a character, holding the destination of moving -STEP_TABLE_MAX_STEPS to STEP_TABLE_MAX_STEPS
+        steps from each position along the tile sequence in order. Moving k steps is the first k steps of moving further, so
+        each direction is walked once from each position.
+
+        Args:
+            starting_tile_i: The index along the tile sequence of the starting tile of the character
+
+        Returns:
+            The step table, with None where the character can't move by the number of steps
+        """
+        max_steps: int = DefaultGameBoard.STEP_TABLE_MAX_STEPS
+        step_table: list[Optional[int]] = []
+
+        for position in range(len(self.__tile_sequence)):
+            backward: list[Optional[int]] = self.__walk(starting_tile_i, position, -1, max_steps)
+            forward: list[Optional[int]] = self.__walk(starting_tile_i, position, 1, max_steps)
+            step_table.extend(reversed(backward))
+            step_table.append(position)  # moving 0 steps stays on the same tile
+            step_table.extend(forward)
+
+        return step_table
+
+    def __set_chit_card_draw_properties(self, layout: DefaultGameBoardLayout) -> None:
         """Initialise the clickable chit cards to draw randomly within the inner zone (square) of the game board.
 
-        DefaultGameBoard.CHIT_CARD_RAND_FACTOR and DefaultGameBoard.CHIT_CARD_DIMENSIONS determine the randomness
-        and size of the chit cards.
+        The chit card safe area width determines the randomness of the chit cards, and the layout determines their size.
+
+        Args:
+            layout: The layout of the game board to place chit cards within
 
         Warning:
             Will not set all chit card positions if random factor / chit card size is too large
         """
         #### Generating chit cards
-        safe_area = self.__get_chit_card_safe_area()
+        safe_area = layout.get_chit_card_safe_area()
         safe_area_width: int = safe_area[1][0] - safe_area[0][0]
         chit_card_rand_factor: int = int(safe_area_width * (52 / 1500))  # random factor for chit card generation in pixels.
-        # We have modified chit card size to fit more than 16 chit cards (+2 skip chit cards)
-        chit_card_size: tuple[int, int] = (int(0.16 * safe_area_width), int(0.16 * safe_area_width))  # chit card dimensions (width, height) in px
+        chit_card_size: tuple[int, int] = layout.get_chit_card_size()  # chit card dimensions (width, height) in px
 
         x0, y0, x1, y1 = safe_area[0][0], safe_area[0][1], safe_area[1][0], safe_area[1][1]
         chit_card_w, chit_card_h = chit_card_size
@@ -137,18 +212,53 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
             for cur_x in range(x0, x1 - x_random_range, x_random_range):
                 if chit_card_i == len(self.__chit_cards):  # exit if no more chit cards to generate
                     break
-                next_x, next_y = random.randint(cur_x, cur_x + chit_card_rand_factor), random.randint(cur_y, cur_y + chit_card_rand_factor)
+                next_x, next_y = self.__rng.randint(cur_x, cur_x + chit_card_rand_factor), self.__rng.randint(cur_y, cur_y + chit_card_rand_factor)
                 self.__chit_cards[chit_card_i].set_draw_properties(DrawProperties((next_x, next_y), chit_card_size))
                 chit_card_i += 1
 
-    def __configure_and_add_save_button(self) -> None:
-        """Configure and add the save button to the top right of the screen where the default game board is located."""
+    def __set_save_button_draw_properties(self, layout: DefaultGameBoardLayout) -> None:
+        """Place the save button at the top right of the screen where the default game board is located.
+
+        Args:
+            layout: The layout of the game board
+        """
+        self.__save_button.set_draw_properties(layout.get_save_button_draw_properties())
+
+    def __set_tile_draw_properties(self, layout: DefaultGameBoardLayout) -> None:
+        """Set the draw data for all tiles in a clockwise pattern (including starting tiles), starting at the right tile.
+
+        Args:
+            layout: The layout of the game board
+        """
+        main_circle_i: int = 0
+
+        for tile in self.__tile_draw_order:
+            # starting tiles are drawn jutting out from the destination tile drawn before it
+            if tile in self.__starting_tiles_set:
+                tile.set_draw_data(layout.get_cave_draw_properties(main_circle_i))
+                main_circle_i += 1
+                continue
+
+            tile.set_draw_data(layout.get_main_tile_draw_properties(main_circle_i))
+            if tile not in self.__starting_tiles_destinations_set:
+                main_circle_i += 1
+
+    def __get_layout(self) -> DefaultGameBoardLayout:
+        """Get the layout of the game board for the current screen size. The layout is only recomputed, and applied to the
+        tiles, chit cards and save button, if the screen size changed or the layout was invalidated.
+
+        Returns:
+            The layout of the game board
+        """
         screen_size: tuple[int, int] = PygameScreenController.instance().get_screen_size()
-        save_button_size: tuple[int, int] = (screen_size[0] // 10, screen_size[1] // 10)
-        save_button = Button(
-            "assets/menu/save.png", SaveCommand(self.__save_codec), DrawProperties((screen_size[0] - save_button_size[1], 0), (save_button_size[0], save_button_size[1]))
-        )
-        self.__clickables.append(save_button)
+
+        if self.__layout is None or self.__layout.get_screen_size() != screen_size:
+            self.__layout = DefaultGameBoardLayout(screen_size, self.__main_tile_sequence_length)
+            self.__set_tile_draw_properties(self.__layout)
+            self.__set_chit_card_draw_properties(self.__layout)
+            self.__set_save_button_draw_properties(self.__layout)
+
+        return self.__layout
 
     def move_characters_to_position_indexes(self, pos: list[int], perform_tile_effect: bool) -> None:
         """Move characters in order to the tiles corresponding to the position indexes as indicated by the position list.
@@ -196,7 +306,7 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
             else:
                 self.__chit_cards.insert(position, chit_card)
         else:
-            rand_i: int = random.randint(0, chit_card_last_i + 1)
+            rand_i: int = self.__rng.randint(0, chit_card_last_i + 1)
             if rand_i <= chit_card_last_i:
                 self.__chit_cards.insert(rand_i, chit_card)
             else:
@@ -205,8 +315,8 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
         self.__clickables.append(chit_card)
         chit_card.set_game_board_delegate(self)
 
-        # re-initialise drawing properties accounting for new chit cards,
-        self.__set_chit_card_draw_properties()
+        # invalidate layout so drawing properties are re-initialised accounting for new chit cards
+        self.__layout = None
 
     # ------ GameBoard abstract class & Moving --------------------------------------------------------------------------------------------
     def move_character_by_steps(self, character: PlayableCharacter, steps: int) -> None:
@@ -219,55 +329,104 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
             character: The character to move
             steps: The number of steps to move (negative = anti-clockwise, positive = clockwise)
         """
-        tile_intermediate_i: int = self.__character_location[character]
-        steps_taken: int = 0
-        current_tile_i = tile_intermediate_i % len(self.__tile_sequence)
-        current_tile = self.__tile_sequence[current_tile_i]
-
-        while steps_taken < abs(steps):
-            # If the character is already in a starting tile and is going to move further back, end their turn
-            if self.__character_starting_tiles[character] is current_tile and steps < 0:
-                character.set_should_continue_turn(False)
-                return
-
-            tile_intermediate_i = tile_intermediate_i - 1 if steps < 0 else tile_intermediate_i + 1  # consider next tile
-            steps_taken += 1
-
-            current_tile_i = tile_intermediate_i % len(self.__tile_sequence)
-            current_tile = self.__tile_sequence[current_tile_i]
-
-            if current_tile in self.__starting_tiles_set:
-                # If the player is going to re-enter/pass their own starting tile by moving backwards, end their turn.
-                if self.__character_starting_tiles[character] is current_tile and steps < 0:
-                    character.set_should_continue_turn(False)
-                    return
-
-                # Allow character to only re-enter its own starting tile only when moving forward and they dont overshoot
-                if self.__character_starting_tiles[character] is current_tile:
-                    if steps_taken < abs(steps):
-                        # don't move character if starting tile will be overshot & end character's turn
-                        character.set_should_continue_turn(False)
-                        return
-
-                    # go into its own starting tile
-                    break
+        # place character on the destination tile if not occupied and update character location. Otherwise end player's turn
+        destination_i: Optional[int] = self.__get_step_destination(character, steps)
+        if destination_i is None or self.is_tile_occupied(destination_i):
+            character.set_should_continue_turn(False)
+            return
 
-                tile_intermediate_i = tile_intermediate_i - 2 if steps < 0 else tile_intermediate_i + 2  # 2 to account for duplicate starting destination tile
+        self.__move_character_to_tile(character, True, destination_i)
 
-        # place character on the calculated destination tile if not occupied and update character location. Otherwise end player's turn
-        final_tile_i: int = tile_intermediate_i % len(self.__tile_sequence)
-        final_tile: Tile = self.__tile_sequence[final_tile_i]
+    def can_move_character_by_steps(self, character: PlayableCharacter, steps: int) -> bool:
+        """Get whether a character can move by a number of steps along the game board, following the same rules as
+        move_character_by_steps(), without moving them.
 
-        if final_tile.get_character_on_tile() is not None:
-            # if there is a character on the destination tile, end player's turn and do not move
-            character.set_should_continue_turn(False)
-            return
+        Args:
+            character: The character
+            steps: The number of steps to move (negative = anti-clockwise, positive = clockwise)
+
+        Returns:
+            Whether the character would move if moved by the number of steps
+        """
+        destination_i: Optional[int] = self.__get_step_destination(character, steps)
+        return destination_i is not None and not self.is_tile_occupied(destination_i)
+
+    def __get_step_destination(self, character: PlayableCharacter, steps: int) -> Optional[int]:
+        """Get the index along the tile sequence of the tile a character lands on when moving by a number of steps, ignoring
+        characters on the tile. Looked up in the character's step table in O(1) for up to STEP_TABLE_MAX_STEPS steps either way.
+
+        Args:
+            character: The character to move
+            steps: The number of steps to move (negative = anti-clockwise, positive = clockwise)
+
+        Returns:
+            The index of the destination tile, or None if the character can't move by the number of steps
+        """
+        position: int = self.__character_location[character]
+
+        if abs(steps) > DefaultGameBoard.STEP_TABLE_MAX_STEPS:
+            return self.__resolve_steps(self.__tile_sequence.index(self.__character_starting_tiles[character]), position, steps)
 
-        self.__move_character_to_tile(character, True, final_tile_i)
+        # step tables hold the destinations for steps -STEP_TABLE_MAX_STEPS to STEP_TABLE_MAX_STEPS from each position in order
+        table_width: int = 2 * DefaultGameBoard.STEP_TABLE_MAX_STEPS + 1
+        return self.__step_tables[character][position * table_width + steps + DefaultGameBoard.STEP_TABLE_MAX_STEPS]
+
+    def __resolve_steps(self, starting_tile_i: int, position: int, steps: int) -> Optional[int]:
+        """Find the tile a character lands on when moving by a number of steps, ignoring characters on the tile.
+
+        Args:
+            starting_tile_i: The index along the tile sequence of the starting tile of the character to move
+            position: The index of the tile along the tile sequence the character moves from
+            steps: The number of steps to move (negative = anti-clockwise, positive = clockwise)
+
+        Returns:
+            The index of the destination tile, or None if the character can't move by the number of steps
+        """
+        if steps == 0:
+            return position
+        return self.__walk(starting_tile_i, position, -1 if steps < 0 else 1, abs(steps))[-1]
+
+    def __walk(self, starting_tile_i: int, position: int, direction: int, steps: int) -> list[Optional[int]]:
+        """Walk the tile sequence tile by tile in a direction, finding the tile a character lands on after each step, ignoring
+        characters on the tiles. Characters pass over the starting tiles of other characters. Characters can only re-enter their
+        starting tile moving forward once they have visited all main tiles, without overshooting it, and can't move backwards
+        past their starting tile.
+
+        Args:
+            starting_tile_i: The index along the tile sequence of the starting tile of the character to move
+            position: The index of the tile along the tile sequence the character moves from
+            direction: The direction to move in (-1 = anti-clockwise, 1 = clockwise)
+            steps: The number of steps to walk, greater than 0
+
+        Returns:
+            The index of the tile landed on after each step in order, with None for steps the character can't move by
+        """
+        tile_count: int = len(self.__tile_sequence)
+        destinations: list[Optional[int]] = []
+        tile_i: int = position
+
+        while len(destinations) < steps:
+            if direction > 0:
+                # go into its own starting tile, ending there as moving any further overshoots it
+                if (tile_i + 1) % tile_count == starting_tile_i:
+                    destinations.append(starting_tile_i)
+                    break
+                tile_i = self.__next_tile_indexes[tile_i]
+            else:
+                # can't move back from, re-enter or pass its own starting tile by moving backwards
+                if tile_i == starting_tile_i or (tile_i - 1) % tile_count == starting_tile_i:
+                    break
+                tile_i = self.__previous_tile_indexes[tile_i]
+
+            destinations.append(tile_i)
+
+        return destinations + [None] * (steps - len(destinations))
 
     def get_closest_character(self, character: PlayableCharacter) -> Optional[PlayableCharacter]:
         """
-        Get the character closest to the character if there is one.
+        Get the character closest to the character if there is one, in O(log n) using the occupancy index. Characters on starting
+        tiles can't be closest, and characters on starting tiles have no closest character. Ties go to the character placed first
+        along the tile sequence when the game board was created.
 
         Args:
             character: The character to find the closest character to
@@ -279,29 +438,26 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
 
         # Don't let a player in a cave swap
         if self.__tile_sequence[current_player_i] in self.__starting_tiles_set:
-            return
+            return None
 
+        # the closest characters either way around the board are the ones before and after the character in the occupied positions
+        occupied_count: int = len(self.__occupied_positions)
+        occupied_i: int = bisect_left(self.__occupied_positions, current_player_i)
         closest_player: Optional[PlayableCharacter] = None
-        shortest_distance: Optional[int] = None
+        shortest_distance: Optional[tuple[int, int]] = None  # (distance, order)
 
-        for player in self.__character_location:
-            if player == character:
+        for player_i in (self.__occupied_positions[(occupied_i - 1) % occupied_count], self.__occupied_positions[(occupied_i + 1) % occupied_count]):
+            if player_i == current_player_i:
                 continue  # Ignore the player itself
-            player_i = self.__character_location[player]  # Get the index in the tile set of the closest player
-            if self.__tile_sequence[player_i] in self.__starting_tiles_set:  # If the player is in a cave skip player
-                continue
-            else:
-                forward_distance = abs(current_player_i - self.__character_location[player])
-                backward_distance = len(self.__tile_sequence) - forward_distance
-                if shortest_distance and closest_player:  # If there has already been a player found that can be potentially be swapped with
-                    if (
-                        min(forward_distance, backward_distance) < shortest_distance
-                    ):  # Compare if it is closer than that player if it is update so that this player is now the closest
-                        closest_player = player
-                        shortest_distance = min(forward_distance, backward_distance)
-                else:  # If no other player so far is valid for a swap , set this player as the closest player
-                    closest_player = player
-                    shortest_distance = min(forward_distance, backward_distance)
+
+            forward_distance = abs(current_player_i - player_i)
+            backward_distance = len(self.__tile_sequence) - forward_distance
+            player: PlayableCharacter = self.__position_characters[player_i]
+            distance: tuple[int, int] = (min(forward_distance, backward_distance), self.__character_order[player])
+
+            if shortest_distance is None or distance < shortest_distance:
+                closest_player = player
+                shortest_distance = distance
 
         return closest_player  # Return the closest player
 
@@ -314,10 +470,43 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
             char2: The second character
         """
         char1_tile, char2_tile = self.get_character_floor_tile(char1), self.get_character_floor_tile(char2)
+        self.__remove_from_occupancy_index(char1)
+        self.__remove_from_occupancy_index(char2)
         self.__character_location[char1], self.__character_location[char2] = self.__character_location[char2], self.__character_location[char1]
+        self.__add_to_occupancy_index(char1)
+        self.__add_to_occupancy_index(char2)
         char1_tile.set_character_on_tile(char2)
         char2_tile.set_character_on_tile(char1)
 
+    def get_tile_index(self, tile: Tile) -> int:
+        """Get the index of a tile along the tile sequence in O(1). Starting tile destinations appear twice along the tile sequence,
+        either side of their starting tile, and the later index is returned.
+
+        Args:
+            tile: The tile
+
+        Returns:
+            The index of the tile along the tile sequence
+
+        Raises:
+            Exception if the tile is not on the game board
+        """
+        try:
+            return self.__tile_indexes[tile]
+        except KeyError:
+            raise Exception("Tile could not be found on the game board.")
+
+    def is_tile_occupied(self, tile_i: int) -> bool:
+        """Get whether a character is on a tile.
+
+        Args:
+            tile_i: The index of the tile along the tile sequence
+
+        Returns:
+            Whether a character is on the tile
+        """
+        return self.__tile_sequence[tile_i].get_character_on_tile() is not None
+
     def get_character_floor_tile(self, character: PlayableCharacter) -> Tile:
         """Get the tile a character is on.
 
@@ -337,25 +526,42 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
 
     def on_player_turn_end(self) -> None:
         """When a player's turn ends, unflip all chit cards after a delay defined by DefaultGameBoard.TURN_END_RESET_DELAY.
-        User interaction is disabled during the delay.
+        User interaction is disabled during the delay. Once the chit cards are unflipped, the next player's turn is autosaved if
+        autosaving. If more turns end during the delay (e.g skipped players), only the delay after the last of them unflips the chit
+        cards, so user interaction is not enabled again early.
         """
+        self.__turn_end_count += 1
+        turn_end_number: int = self.__turn_end_count
 
         def unflip_chit_cards():
-            for chit_card in self.__chit_cards:
-                chit_card.set_flipped(False)
+            if turn_end_number != self.__turn_end_count:
+                return  # a later turn end will unflip the chit cards
+
+            self.reset_chit_cards()
             GameWorld.instance().enable_mouse_clicks()
+            if self.__autosave_codec is not None:
+                self.__autosave_codec.save_in_background()
 
-        unflip_timer = Timer(DefaultGameBoard.TURN_END_RESET_DELAY, unflip_chit_cards)
-        unflip_timer.start()
+        GameWorld.instance().schedule(DefaultGameBoard.TURN_END_RESET_DELAY, unflip_chit_cards)
         GameWorld.instance().disable_mouse_clicks()
 
+    def reset_chit_cards(self) -> None:
+        """Unflip all chit cards immediately."""
+        for chit_card in self.__chit_cards:
+            chit_card.set_flipped(False)
+
+    def get_chit_cards(self) -> Sequence[ChitCard]:
+        """Get a read-only list of the chit cards on the game board, in the order they are placed.
+
+        Returns:
+            A read-only list containing the chit cards
+        """
+        return self.__chit_cards
+
     @overload
     def __move_character_to_tile(self, character: PlayableCharacter, perform_tile_effect: bool, tile: Tile) -> None:
         """Move a character to the specified tile.
 
-        Warning:
-            More inefficient than overload of (PlayableCharacter, int). O(n) instead of O(1).
-
         Args:
             character: The character to move
             perform_tile_effect: Whether to perform any effect the tile has if any when moving the character to the tile
@@ -380,151 +586,99 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
             case int():
                 self.__tile_sequence[self.__character_location[character]].set_character_on_tile(None)  # remove char from its current tile
                 self.__tile_sequence[tile].place_character_on_tile(character, perform_tile_effect)
+                self.__remove_from_occupancy_index(character)
                 self.__character_location[character] = tile
+                self.__add_to_occupancy_index(character)
 
             case Tile():
-                self.__tile_sequence[self.__character_location[character]].set_character_on_tile(None)
-                tile.place_character_on_tile(character, perform_tile_effect)
-                for i in range(len(self.__tile_sequence)):
-                    if self.__tile_sequence[i] == tile:
-                        self.__character_location[character] = i
+                self.__move_character_to_tile(character, perform_tile_effect, self.get_tile_index(tile))
+
+    def __add_to_occupancy_index(self, character: PlayableCharacter) -> None:
+        """Add a character to the occupancy index at their location, unless they are on a starting tile.
+
+        Args:
+            character: The character
+        """
+        tile_i: int = self.__character_location[character]
+        if self.__tile_sequence[tile_i] not in self.__starting_tiles_set:
+            insort(self.__occupied_positions, tile_i)
+            self.__position_characters[tile_i] = character
+
+    def __remove_from_occupancy_index(self, character: PlayableCharacter) -> None:
+        """Remove a character from the occupancy index at their location if they are in it.
+
+        Args:
+            character: The character
+        """
+        tile_i: int = self.__character_location[character]
+        if self.__position_characters.get(tile_i) is character:
+            del self.__occupied_positions[bisect_left(self.__occupied_positions, tile_i)]
+            del self.__position_characters[tile_i]
 
     def get_all_clickable_sprites(self) -> Sequence[ModularClickableSprite]:
-        """Get a read-only list of all the clickable sprites for the game board.
+        """Get a read-only list of all the clickable sprites for the game board, laid out for drawing on the current screen.
 
         Returns:
             A read-only list containing all the clickable sprites.
         """
+        self.__get_layout()
         return self.__clickables
 
-    # ------ DrawableByAsset interface & Drawing --------------------------------------------------------------------------------------
-    def get_draw_assets_instructions(self) -> list[DrawAssetInstruction]:
-        """
-        Instructions to draw the game board as a square of square cells, with the number of cells on each dimension equal to
-        DefaultGameBoard.DIMENSION_CELL_COUNT.
+    # ------ DirtyRectTrackable interface -------------------------------------------------------------------------------------------
+    def consume_dirty_rects(self) -> list[pygame.Rect]:
+        """Get the areas of the screen invalidated by changes to the tiles, characters and clickable sprites on the game board
+        since the last call, and stop tracking them.
 
         Returns:
-            The list of drawing instructions
-
-        Author: Shen
+            The invalidated areas of the screen
         """
-        main_properties = self.__calculated_main_tile_sequence_properties()
-        square_size = main_properties.square_size
-
-        draw_instructions: list[DrawAssetInstruction] = []
-        starting_tile_destinations_drawn: set[Tile] = set()
-        main_circle_draw_properties: list[DrawProperties] = self.__circular_draw_properties_for_squares(
-            self.__main_tile_sequence_length, square_size, (int(main_properties.circle_center_x), int(main_properties.circle_center_y))
-        )
-        main_circle_draw_properties_i: int = 0
-
-        # setting draw data in clockwise pattern (including starting tiles) for tiles, starting at right tile
-        for tile in self.__tile_sequence:
-            did_draw_start_destination: bool = False
-
-            # offsetting for drawing of duplicate starting tile destinations; allow drawing of destination tile only if it has not been drawn
-            if tile in self.__starting_tiles_destinations_set:
-                did_draw_start_destination = True  # starting tile should be drawn on top of the destination tile
-                if tile in starting_tile_destinations_drawn:
-                    continue
-                starting_tile_destinations_drawn.add(tile)
-
-            # setting draw data for starting tiles
-            if tile in self.__starting_tiles_set:
-                tile.set_draw_data(
-                    self.__linearly_extrapolate_circlular_draw_properties(
-                        square_size,
-                        self.__main_tile_sequence_length,
-                        main_circle_draw_properties[main_circle_draw_properties_i],
-                    )
-                )
-                main_circle_draw_properties_i += 1
-                continue
-
-            # setting draw data for main tile sequence
-            tile.set_draw_data(main_circle_draw_properties[main_circle_draw_properties_i])
-            if not did_draw_start_destination:
-                main_circle_draw_properties_i += 1
-
-        # getting draw instructions for the entire board after setting draw data
-        starting_tile_destinations_drawn: set[Tile] = set()
+        dirty_rects: list[pygame.Rect] = []
 
         for tile in self.__tile_sequence:
-            tile_draw_instructions: Optional[list[DrawAssetInstruction]] = None
-
-            if tile in self.__starting_tiles_destinations_set:
-                # only get drawing instructions for one of the duplicate starting tile destination tiles [increase game performance]
-                if tile not in starting_tile_destinations_drawn:
-                    starting_tile_destinations_drawn.add(tile)
-                    tile_draw_instructions = tile.get_draw_assets_instructions()
-                else:
-                    continue
-            else:
-                tile_draw_instructions = tile.get_draw_assets_instructions()
+            dirty_rects.extend(tile.consume_dirty_rects())
+        for character in self.__playable_characters:
+            dirty_rects.extend(character.consume_dirty_rects())
+        for clickable in self.__clickables:
+            dirty_rects.extend(clickable.consume_dirty_rects())
 
-            for instruction in tile_draw_instructions:
-                draw_instructions.append(instruction)
+        return dirty_rects
 
-        return draw_instructions
-
-    def __circular_draw_properties_for_squares(self, n: int, square_size: float, central_coordinate: tuple[int, int]) -> list[DrawProperties]:
-        """Gets the drawing properties (coordinates, rotation and size) that correspond to drawing squares such that their bottom corners
-        touch in a circle around a specified coordinate.
-
-        Args:
-            n: The number of squares making up the circle
-            square_size: The square size in pixels.
-            central_coordinate: The coordinate (x,y) at which the circle should be centered
+    # ------ DrawableByAsset interface & Drawing --------------------------------------------------------------------------------------
+    def get_draw_assets_instructions(self) -> list[DrawAssetInstruction]:
+        """
+        Instructions to draw the game board as a circle of tiles with caves jutting out, using the layout for the current
+        screen size. The same instructions are returned between frames until any tile changes how it is drawn.
 
         Returns:
-            The draw properties to draw the circle
-        """
-        draw_properties: list[DrawProperties] = []
-        center_x: int = int(central_coordinate[0] - 0.5 * square_size)  # 0.5 * square size to offset for square overhang into circle
-        center_y: int = int(central_coordinate[1] - 0.5 * square_size)
-        circle_radius: float = polygon_radius_given_side_length(square_size, n)
+            The list of drawing instructions
 
-        # Going anti-clockwise for each vertex of the circle, get the coordinates and rotation to draw the square at
-        for i in range(n):
-            internal_deg: float = polygon_internal_deg(n)
-            central_deg: float = polygon_central_deg(n)
-            rot_from_normal: float = (180 - internal_deg) / 2
+        Author: Shen
+        """
+        self.__get_layout()
+        should_rebuild: bool = False
 
-            x: int = int(center_x + circle_radius * cos_deg(central_deg * i))
-            y: int = int(center_y - circle_radius * sin_deg(central_deg * i))  # sign flipped because pygame y coordinate system is reversed
-            rot: float = (((n - 1) + i) % n) * central_deg + rot_from_normal
+        # tiles keep their instructions between frames, so the instructions for the board only need rebuilding if a tile rebuilt its own
+        for i in range(len(self.__tile_draw_order)):
+            tile_instructions: list[DrawAssetInstruction] = self.__tile_draw_order[i].get_draw_assets_instructions()
+            if tile_instructions is not self.__tile_draw_instructions[i]:
+                self.__tile_draw_instructions[i] = tile_instructions
+                should_rebuild = True
 
-            draw_properties.append(DrawProperties((x, y), (int(square_size), int(square_size)), rot))
+        if should_rebuild:
+            self.__draw_instructions = [instruction for tile_instructions in self.__tile_draw_instructions if tile_instructions is not None for instruction in tile_instructions]
 
-        return draw_properties
+        return self.__draw_instructions
 
-    def __linearly_extrapolate_circlular_draw_properties(self, length: float, circle_sides: int, draw_properties: DrawProperties) -> DrawProperties:
-        """Linearly extrapolate the drawing coordinates of the drawing property along its axis within the unit circle (as determined
-        by its degrees of rotation) for a particular circle.
+    def __on_save_complete(self, error: Optional[Exception]) -> None:
+        """Report the outcome of a save started with the save button to the console. Called on the save codec's background thread.
 
         Args:
-            length: The size in px along its unit circle axis to extrapolate by
-            circle_sides: The number of sides/squares making up the circle to extrapolate in
-            draw_properties: The draw properties to extrapolate
-
-        Returns:
-            The linearly extrapolated draw properties.
+            error: The exception raised whilst saving, or None if the save succeeded
         """
-        x, y = draw_properties.get_coordinates()
-        rot: float = draw_properties.get_rotation()
-        internal_deg: float = polygon_internal_deg(circle_sides)
-        central_deg: float = polygon_central_deg(circle_sides)
-        rot_from_normal: float = (180 - internal_deg) / 2
-
-        pos_in_circle: int = round(
-            (((rot - rot_from_normal) + central_deg) / central_deg) % circle_sides
-        )  # reverse calculation from rot formula for drawing in circle. 0 = square at 0 deg in unit circle (i.e first square)
-
-        return DrawProperties(
-            (int(x + length * cos_deg(pos_in_circle * central_deg)), int(y - length * sin_deg(pos_in_circle * central_deg))),
-            draw_properties.get_size(),
-            rot,
-        )
+        if error is None:
+            print("The game has been saved.")
+        else:
+            print(f"The game could not be saved. Error: {error}")
 
     # ------- JSONSavable interface ------------------------------------------------------------------------------------
     def on_save(self, to_write: dict[str, Any]) -> Optional[Any]:
@@ -549,98 +703,3 @@ class DefaultGameBoard(GameBoard, DrawableByAsset):
 
         for i, player_entry in enumerate(players_list):
             player_entry["location"] = self.__character_location[self.__playable_characters[i]]
-
-    # ------- Board properties -----------------------------------------------------------------------------------------
-    def __get_chit_card_safe_area(self) -> tuple[tuple[int, int], tuple[int, int]]:
-        """Get the square safe area for the chit cards.
-
-        Returns:
-            ((x0, y0), (x1, y1)), where the first & second pair corresponds to the top left & bottom right corner of the square
-            shaped safe area.
-        """
-        main_properties = self.__calculated_main_tile_sequence_properties()
-        center_x, center_y = main_properties.circle_center_x, main_properties.circle_center_y
-        safe_radius: float = (
-            main_properties.circle_x1 - center_x - main_properties.square_size / 2
-        )  # square_size / 2 because outline lies in middle of squares on circle outline
-
-        square_distance_from_center: float = square_in_circle_apothem(safe_radius)
-        x0, y0 = center_x - square_distance_from_center, center_y - square_distance_from_center
-        x1, y1 = center_x + square_distance_from_center, center_y + square_distance_from_center
-
-        return ((int(x0), int(y0)), (int(x1), int(y1)))
-
-    def __calculated_main_tile_sequence_properties(self) -> __MainTileSequenceProperties:
-        """Calculate and return the properties of the circular main tile sequence for drawing.
-
-        The properties correspond to a circle within the bounds of the screen
-
-        Returns:
-            The properties of the main tile sequence
-        """
-        width, height = PygameScreenController.instance().get_screen_size()
-        screen_center_x, screen_center_y = width / 2, height / 2
-
-        # getting optimal side length and radius to ensure the drawn board's circle fits within the user's screen
-        # optimal_side_length -> solving formula for side length given the radius of a polygon for side (length), letting r => solved for r, r + side/2 + side = screen_width/2 - 10.
-        #                        r + side/2 + side is the length from center of circle to the rightmost edge of a cave @ 0 deg
-        optimal_side_length: float = (width * sin_deg(180 / self.__main_tile_sequence_length) - 30 * sin_deg(180 / self.__main_tile_sequence_length)) / (
-            1 + 3 * sin_deg(180 / self.__main_tile_sequence_length)
-        )
-        optimal_radius: float = polygon_radius_given_side_length(optimal_side_length, self.__main_tile_sequence_length)
-
-        # calculating rect bounds of circle
-        circle_x0, circle_y0 = screen_center_x - optimal_radius, screen_center_y - optimal_radius
-        circle_x1, circle_y1 = circle_x0 + optimal_radius * 2, circle_y0 + optimal_radius * 2
-
-        return DefaultGameBoard.__MainTileSequenceProperties(
-            optimal_radius,
-            circle_x0,
-            circle_x1,
-            circle_y0,
-            circle_y1,
-            screen_center_x,
-            screen_center_y,
-            optimal_side_length,
-        )
-
-    class __MainTileSequenceProperties:
-        """Private data class for organising the circular main tile sequence data for the default game board.
-
-        Author: Shen
-        """
-
-        def __init__(
-            self,
-            circle_radius: float,
-            circle_x0: float,
-            circle_x1: float,
-            circle_y0: float,
-            circle_y1: float,
-            circle_center_x: float,
-            circle_center_y: float,
-            square_size: float,
-        ):
-            """
-            Args:
-                circle_radius: The radius of the bounding outline for the circular main tile sequence
-                circle_x0: The left x coordinate where the circular outline is to lie on
-                circle_x1: The right x coordinate where the circular outline is to lie on
-                circle_y0: The top y coordinate where the circular outline is to lie on
-                circle_y1: The bottom y coordinate where the circular outline is to lie on
-                circle_center_x: The x coordinate for the center of the circle
-                circle_center_y: The y coordinate for the center of the circle
-                square_size: The size of each dimension of the square tile
-
-            Discussion:
-                The circle_ coordinates represent coordinates of the circle outline that the center of the drawn objects will be located on.
-                The circle_radius represents the distance from the middle of the circle to the outline that the center of drawn objects will be located on.
-            """
-            self.circle_radius = circle_radius
-            self.circle_x0 = circle_x0
-            self.circle_x1 = circle_x1
-            self.circle_y0 = circle_y0
-            self.circle_y1 = circle_y1
-            self.circle_center_x: float = circle_center_x
-            self.circle_center_y: float = circle_center_y
-            self.square_size = square_size
@@ -0,0 +1,141 @@
+from __future__ import annotations
+from game_objects.game_board.DefaultGameBoardLayout import DefaultGameBoardLayout
+from game_objects.animals.Animal import Animal
+from game_objects.tiles.Tile import Tile
+from game_objects.tiles.NormalTile import NormalTile
+from game_objects.tiles.CaveTile import CaveTile
+from game_objects.tiles.CaveTileVariant import CaveTileVariant
+from game_objects.characters.Dragon import Dragon
+from game_objects.characters.PlayableCharacterVariant import PlayableCharacterVariant
+from game_objects.chit_cards.ChitCard import ChitCard
+from game_objects.chit_cards.AnimalChitCard import AnimalChitCard
+from game_objects.chit_cards.PirateChitCard import PirateChitCard
+from screen.DrawAssetInstruction import DrawAssetInstruction
+from screen.DrawProperties import DrawProperties
+from screen.ui.buttons.Button import Button
+
+
+class DefaultGameBoardAssetManifest:
+    """The list of every asset the default game board can draw for a particular layout, at the sizes and rotations it will be
+    drawn at. Used to load and transform the assets ahead of drawing the board.
+
+    Assets are found by creating stand-in game objects for every animal, cave tile variant, character variant and chit card, and
+    collecting their drawing instructions, so the manifest always matches how the objects draw themselves.
+
+    Author: Shen
+    """
+
+    __PIRATE_SYMBOL_COUNTS: list[int] = [1, 2]  # symbol counts for dragon pirate chit cards
+    __POWER_CHIT_CARD_NAMES: list[str] = ["skip_1", "skip_2", "swap"]  # names of power chit card assets: chit_card_{name}.png
+    __MAX_SPIN_FRAMES: int = 1000  # max frames of a character's turn animation to collect rotations for
+
+    def __init__(self, layout: DefaultGameBoardLayout):
+        """
+        Args:
+            layout: The layout of the board the assets are drawn for
+        """
+        self.__layout: DefaultGameBoardLayout = layout
+
+    def get_draw_assets_instructions(self) -> list[DrawAssetInstruction]:
+        """Get the instructions for drawing every asset the board can draw. Coordinates of the instructions are not meaningful, only
+        their asset path, size and rotation.
+
+        Returns:
+            The drawing instructions, without duplicates in asset path, size and rotation
+        """
+        instructions: list[DrawAssetInstruction] = []
+        instructions.extend(self.__tile_instructions())
+        instructions.extend(self.__character_instructions())
+        instructions.extend(self.__chit_card_instructions())
+        save_button: Button = Button("assets/menu/save.png", None, self.__layout.get_save_button_draw_properties())
+        instructions.extend(instruction for instruction, _ in save_button.get_draw_clickable_assets_instructions())
+
+        # remove duplicates
+        seen: set[tuple[str, object, float]] = set()
+        unique_instructions: list[DrawAssetInstruction] = []
+        for instruction in instructions:
+            key = (instruction.get_asset_path(), instruction.get_size(), instruction.get_rotation())
+            if key not in seen:
+                seen.add(key)
+                unique_instructions.append(instruction)
+
+        return unique_instructions
+
+    def __tile_instructions(self) -> list[DrawAssetInstruction]:
+        """Get the instructions for drawing every animal on a normal tile and every cave tile variant, at every position on the board.
+
+        Returns:
+            The drawing instructions
+        """
+        instructions: list[DrawAssetInstruction] = []
+        tiles: list[Tile] = []
+
+        for i in range(self.__layout.get_main_tile_count()):
+            for animal in Animal:
+                tiles.append(NormalTile(animal, self.__layout.get_main_tile_draw_properties(i)))
+                for variant in CaveTileVariant:
+                    tiles.append(CaveTile(animal, variant, self.__layout.get_cave_draw_properties(i)))
+
+        for tile in tiles:
+            instructions.extend(tile.get_draw_assets_instructions())
+        return instructions
+
+    def __character_instructions(self) -> list[DrawAssetInstruction]:
+        """Get the instructions for drawing every character variant standing on a tile, including every frame of its turn animation.
+
+        Returns:
+            The drawing instructions
+        """
+        instructions: list[DrawAssetInstruction] = []
+
+        for variant in PlayableCharacterVariant:
+            dragon: Dragon = Dragon(variant, variant.value)
+            NormalTile(Animal.UNIVERSAL, self.__layout.get_main_tile_draw_properties(0), dragon).get_draw_assets_instructions()
+            dragon.set_is_currently_playing(True)
+
+            # the turn animation changes the rotation of retained instructions in place, so copy each frame
+            for _ in range(DefaultGameBoardAssetManifest.__MAX_SPIN_FRAMES):
+                frame: list[DrawAssetInstruction] = dragon.get_draw_assets_instructions()
+                if any(instruction.get_rotation() >= 360 for instruction in frame):
+                    break
+                for instruction in frame:
+                    instructions.append(
+                        DrawAssetInstruction(
+                            instruction.get_asset_path(), instruction.get_x_coord(), instruction.get_y_coord(), instruction.get_size(), instruction.get_rotation()
+                        )
+                    )
+
+            dragon.set_is_currently_playing(False)
+            instructions.extend(dragon.get_draw_assets_instructions())
+
+        return instructions
+
+    def __chit_card_instructions(self) -> list[DrawAssetInstruction]:
+        """Get the instructions for drawing every chit card, both flipped and not flipped.
+
+        Returns:
+            The drawing instructions
+        """
+        instructions: list[DrawAssetInstruction] = []
+        chit_card_draw_properties: DrawProperties = DrawProperties((0, 0), self.__layout.get_chit_card_size())
+        chit_cards: list[ChitCard] = []
+
+        for animal in Animal:
+            # there are no universal matching chit cards
+            if animal == Animal.UNIVERSAL:
+                continue
+            for symbol_count in range(1, 4):
+                chit_cards.append(AnimalChitCard(animal, symbol_count, chit_card_draw_properties))
+        for symbol_count in DefaultGameBoardAssetManifest.__PIRATE_SYMBOL_COUNTS:
+            chit_cards.append(PirateChitCard(symbol_count, chit_card_draw_properties))
+
+        for chit_card in chit_cards:
+            for flipped in (False, True):
+                chit_card.set_flipped(flipped)
+                instructions.extend(instruction for instruction, _ in chit_card.get_draw_clickable_assets_instructions())
+
+        # power chit cards need their powers' game state to be created, so are found by their asset naming instead
+        for name in DefaultGameBoardAssetManifest.__POWER_CHIT_CARD_NAMES:
+            instructions.append(DrawAssetInstruction(f"assets/chit_cards/chit_card_{name}.png", 0, 0, chit_card_draw_properties.get_size()))
+
+        return instructions
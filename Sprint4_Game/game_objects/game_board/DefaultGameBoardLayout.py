@@ -0,0 +1,189 @@
+from __future__ import annotations
+from screen.DrawProperties import DrawProperties
+from utils.math_utils import *
+
+
+class DefaultGameBoardLayout:
+    """Precomputed drawing geometry for the default game board for a particular screen size and number of main tiles. Main
+    tiles are laid out in a circle that fits within the screen, caves jut out from the circle, and chit cards lie within a
+    square safe area inside the circle.
+
+    The geometry is computed once on construction, so reading it is a lookup.
+
+    Author: Shen
+    """
+
+    def __init__(self, screen_size: tuple[int, int], main_tile_count: int):
+        """
+        Args:
+            screen_size: The size of the screen the board is drawn on in form (width, height)
+            main_tile_count: The number of tiles in the main tile sequence (excluding starting tiles)
+        """
+        self.__screen_size: tuple[int, int] = screen_size
+        self.__main_tile_count: int = main_tile_count
+
+        width, height = screen_size
+        sin_half_central_deg: float = sin_deg(180 / main_tile_count)
+        self.circle_center_x: float = width / 2
+        self.circle_center_y: float = height / 2
+
+        # getting optimal side length and radius to ensure the drawn board's circle fits within the user's screen
+        # optimal_side_length -> solving formula for side length given the radius of a polygon for side (length), letting r => solved for r, r + side/2 + side = screen_width/2 - 10.
+        #                        r + side/2 + side is the length from center of circle to the rightmost edge of a cave @ 0 deg
+        self.square_size: float = (width * sin_half_central_deg - 30 * sin_half_central_deg) / (1 + 3 * sin_half_central_deg)
+        self.circle_radius: float = polygon_radius_given_side_length(self.square_size, main_tile_count)
+
+        # calculating rect bounds of circle
+        self.circle_x0: float = self.circle_center_x - self.circle_radius
+        self.circle_y0: float = self.circle_center_y - self.circle_radius
+        self.circle_x1: float = self.circle_x0 + self.circle_radius * 2
+        self.circle_y1: float = self.circle_y0 + self.circle_radius * 2
+
+        # precomputed tables
+        self.__main_tile_draw_properties: list[DrawProperties] = self.__circular_draw_properties_for_squares(
+            main_tile_count, self.square_size, (int(self.circle_center_x), int(self.circle_center_y))
+        )
+        self.__cave_draw_properties: list[DrawProperties] = [
+            self.__linearly_extrapolate_circlular_draw_properties(self.square_size, main_tile_count, i, draw_properties)
+            for i, draw_properties in enumerate(self.__main_tile_draw_properties)
+        ]
+        self.__chit_card_safe_area: tuple[tuple[int, int], tuple[int, int]] = self.__calculate_chit_card_safe_area()
+
+    def get_screen_size(self) -> tuple[int, int]:
+        """Get the screen size the layout was computed for.
+
+        Returns:
+            The screen size in form (width, height)
+        """
+        return self.__screen_size
+
+    def get_main_tile_count(self) -> int:
+        """Get the number of main tiles the layout was computed for.
+
+        Returns:
+            The number of main tiles
+        """
+        return self.__main_tile_count
+
+    def get_main_tile_draw_properties(self, i: int) -> DrawProperties:
+        """Get the drawing properties for the main tile at a position along the circle.
+
+        Args:
+            i: The position along the circle, going anti-clockwise from the tile at 0 degrees
+
+        Returns:
+            The drawing properties
+        """
+        return self.__main_tile_draw_properties[i]
+
+    def get_cave_draw_properties(self, i: int) -> DrawProperties:
+        """Get the drawing properties for a cave jutting out of the main tile at a position along the circle.
+
+        Args:
+            i: The position along the circle of the main tile the cave is connected to
+
+        Returns:
+            The drawing properties
+        """
+        return self.__cave_draw_properties[i]
+
+    def get_chit_card_size(self) -> tuple[int, int]:
+        """Get the size of the chit cards, which is relative to the width of the chit card safe area.
+
+        Returns:
+            The size in form (width, height)
+        """
+        safe_area = self.__chit_card_safe_area
+        safe_area_width: int = safe_area[1][0] - safe_area[0][0]
+        # We have modified chit card size to fit more than 16 chit cards (+2 skip chit cards)
+        return (int(0.16 * safe_area_width), int(0.16 * safe_area_width))
+
+    def get_save_button_draw_properties(self) -> DrawProperties:
+        """Get the drawing properties for the save button, which is at the top right of the screen.
+
+        Returns:
+            The drawing properties
+        """
+        screen_width, screen_height = self.__screen_size
+        save_button_size: tuple[int, int] = (screen_width // 10, screen_height // 10)
+        return DrawProperties((screen_width - save_button_size[1], 0), save_button_size)
+
+    def get_chit_card_safe_area(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Get the square safe area for the chit cards.
+
+        Returns:
+            ((x0, y0), (x1, y1)), where the first & second pair corresponds to the top left & bottom right corner of the square
+            shaped safe area.
+        """
+        return self.__chit_card_safe_area
+
+    # ------- Calculations ----------------------------------------------------------------------------------------------
+    def __calculate_chit_card_safe_area(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Calculate the square safe area for the chit cards.
+
+        Returns:
+            ((x0, y0), (x1, y1)), where the first & second pair corresponds to the top left & bottom right corner of the square
+            shaped safe area.
+        """
+        center_x, center_y = self.circle_center_x, self.circle_center_y
+        safe_radius: float = self.circle_x1 - center_x - self.square_size / 2  # square_size / 2 because outline lies in middle of squares on circle outline
+
+        square_distance_from_center: float = square_in_circle_apothem(safe_radius)
+        x0, y0 = center_x - square_distance_from_center, center_y - square_distance_from_center
+        x1, y1 = center_x + square_distance_from_center, center_y + square_distance_from_center
+
+        return ((int(x0), int(y0)), (int(x1), int(y1)))
+
+    @staticmethod
+    def __circular_draw_properties_for_squares(n: int, square_size: float, central_coordinate: tuple[int, int]) -> list[DrawProperties]:
+        """Gets the drawing properties (coordinates, rotation and size) that correspond to drawing squares such that their bottom corners
+        touch in a circle around a specified coordinate.
+
+        Args:
+            n: The number of squares making up the circle
+            square_size: The square size in pixels.
+            central_coordinate: The coordinate (x,y) at which the circle should be centered
+
+        Returns:
+            The draw properties to draw the circle
+        """
+        draw_properties: list[DrawProperties] = []
+        center_x: int = int(central_coordinate[0] - 0.5 * square_size)  # 0.5 * square size to offset for square overhang into circle
+        center_y: int = int(central_coordinate[1] - 0.5 * square_size)
+        circle_radius: float = polygon_radius_given_side_length(square_size, n)
+        internal_deg: float = polygon_internal_deg(n)
+        central_deg: float = polygon_central_deg(n)
+        rot_from_normal: float = (180 - internal_deg) / 2
+
+        # Going anti-clockwise for each vertex of the circle, get the coordinates and rotation to draw the square at
+        for i in range(n):
+            x: int = int(center_x + circle_radius * cos_deg(central_deg * i))
+            y: int = int(center_y - circle_radius * sin_deg(central_deg * i))  # sign flipped because pygame y coordinate system is reversed
+            rot: float = (((n - 1) + i) % n) * central_deg + rot_from_normal
+
+            draw_properties.append(DrawProperties((x, y), (int(square_size), int(square_size)), rot))
+
+        return draw_properties
+
+    @staticmethod
+    def __linearly_extrapolate_circlular_draw_properties(length: float, circle_sides: int, pos_in_circle: int, draw_properties: DrawProperties) -> DrawProperties:
+        """Linearly extrapolate the drawing coordinates of the drawing property along its axis within the unit circle for a particular
+        circle.
+
+        Args:
+            length: The size in px along its unit circle axis to extrapolate by
+            circle_sides: The number of sides/squares making up the circle to extrapolate in
+            pos_in_circle: The position of the square in the circle. 0 = square at 0 deg in unit circle (i.e first square)
+            draw_properties: The draw properties to extrapolate
+
+        Returns:
+            The linearly extrapolated draw properties.
+        """
+        x, y = draw_properties.get_coordinates()
+        central_deg: float = polygon_central_deg(circle_sides)
+
+        return DrawProperties(
+            (int(x + length * cos_deg(pos_in_circle * central_deg)), int(y - length * sin_deg(pos_in_circle * central_deg))),
+            draw_properties.get_size(),
+            draw_properties.get_rotation(),
+        )
@@ -6,11 +6,13 @@ from game_objects.tiles.Tile import Tile
 from game_objects.characters.PlayableCharacter import PlayableCharacter
 from screen.DrawableByAsset import DrawableByAsset
 from screen.ModularClickableSprite import ModularClickableSprite
+from screen.DirtyRectTrackable import DirtyRectTrackable
 
 
-class GameBoard(DrawableByAsset, JSONSavable, Protocol):
+class GameBoard(DrawableByAsset, JSONSavable, DirtyRectTrackable, Protocol):
     """Represents a game board that can be played on. Players can be placed on the board, and chit cards are used to
-    interact with the game board.
+    interact with the game board. The game board tracks the areas of the screen invalidated by changes to any of its
+    drawn objects (including its clickable sprites).
 
     Author: Shen
     """
@@ -25,6 +27,19 @@ class GameBoard(DrawableByAsset, JSONSavable, Protocol):
         """
         ...
 
+    @abstractmethod
+    def can_move_character_by_steps(self, character: PlayableCharacter, steps: int) -> bool:
+        """Get whether a character can move by an integer number of steps on the game board, without moving them.
+
+        Args:
+            character: The character
+            steps: Number of steps to move
+
+        Returns:
+            Whether the character would move if moved by the number of steps
+        """
+        ...
+
     @abstractmethod
     def get_character_floor_tile(self, character: PlayableCharacter) -> Tile:
         """Get the floor tile the character is standing on.
@@ -39,6 +54,11 @@ class GameBoard(DrawableByAsset, JSONSavable, Protocol):
         """Perform any configuration to the game board a player's turn ends. Called when a player's turn ends."""
         ...
 
+    @abstractmethod
+    def reset_chit_cards(self) -> None:
+        """Immediately return all chit cards to how they were at the start of a player's turn (i.e unflipped)."""
+        ...
+
     @abstractmethod
     def get_all_clickable_sprites(self) -> Sequence[ModularClickableSprite]:
         """Get a read-only list all the clickable sprites for the game board.
@@ -3,14 +3,19 @@ from typing import Optional
 from screen.DrawableByAsset import DrawableByAsset
 from screen.DrawProperties import DrawProperties
 from screen.DrawAssetInstruction import DrawAssetInstruction
+from screen.DirtyRectTrackable import DirtyRectTrackable
+from screen.DirtyRectTracker import DirtyRectTracker
 from game_objects.characters.PlayableCharacter import PlayableCharacter
 from game_objects.animals.Animal import Animal
 from codec.saves.JSONSavable import JSONSavable
 from utils.pygame_utils import get_coords_for_center_drawing_in_rect
 
+import pygame
 
-class Tile(ABC, DrawableByAsset, JSONSavable):
-    """Represents a tile that a character can stand on.
+
+class Tile(ABC, DrawableByAsset, JSONSavable, DirtyRectTrackable):
+    """Represents a tile that a character can stand on. The drawing instructions for the tile are kept between frames, and are only
+    rebuilt when the tile's draw data, or the character on the tile changes.
 
     Author: Shen
     """
@@ -25,6 +30,9 @@ class Tile(ABC, DrawableByAsset, JSONSavable):
         self._draw_data: Optional[DrawProperties] = draw_data
         self.__character: Optional[PlayableCharacter] = character
         self.__animal: Optional[Animal] = animal
+        self.__dirty_rect_tracker: DirtyRectTracker = DirtyRectTracker()
+        self.__draw_instructions: Optional[list[DrawAssetInstruction]] = None  # retained instructions, None when they must be rebuilt
+        self.__character_draw_instructions: Optional[list[DrawAssetInstruction]] = None  # retained instructions of the character on the tile
 
     def set_draw_data(self, draw_data: DrawProperties) -> None:
         """Set the data specifying how to draw the tile.
@@ -32,6 +40,8 @@ class Tile(ABC, DrawableByAsset, JSONSavable):
         Args:
             draw_data: The draw data
         """
+        if self.__dirty_rect_tracker.mark_draw_properties_change(self._draw_data, draw_data):
+            self.__draw_instructions = None
         self._draw_data = draw_data
 
     def get_animal(self) -> Optional[Animal]:
@@ -56,8 +66,19 @@ class Tile(ABC, DrawableByAsset, JSONSavable):
         Args:
             character (optional): The character
         """
+        if character is not self.__character:
+            self.__dirty_rect_tracker.mark_draw_properties_dirty(self._draw_data)
+            self.__draw_instructions = None
         self.__character = character
 
+    def consume_dirty_rects(self) -> list[pygame.Rect]:
+        """Get the areas of the screen invalidated by changes to the tile since the last call, and stop tracking them.
+
+        Returns:
+            The invalidated areas of the screen
+        """
+        return self.__dirty_rect_tracker.consume()
+
     @abstractmethod
     def place_character_on_tile(self, character: PlayableCharacter, perform_effect: bool) -> None:
         """Place the character on the tile and perform any effect.
@@ -79,7 +100,16 @@ class Tile(ABC, DrawableByAsset, JSONSavable):
         """
         if self._draw_data is None:
             raise Exception("Tried drawing, but the draw properties (properties required for drawing) weren't set.")
-        return self._on_draw_request(self._draw_data)
+
+        # let the character on the tile update its own retained instructions (e.g for animation). Rebuild if it replaced them.
+        character = self.get_character_on_tile()
+        if self.__draw_instructions is not None and character is not None:
+            if character.get_draw_assets_instructions() is not self.__character_draw_instructions:
+                self.__draw_instructions = None
+
+        if self.__draw_instructions is None:
+            self.__draw_instructions = self._on_draw_request(self._draw_data)
+        return self.__draw_instructions
 
     @abstractmethod
     def _on_draw_request(self, draw_properties: DrawProperties) -> list[DrawAssetInstruction]:
@@ -139,7 +169,8 @@ class Tile(ABC, DrawableByAsset, JSONSavable):
             char_x, char_y = get_coords_for_center_drawing_in_rect(self._draw_data.get_coordinates(), self._draw_data.get_size(), (char_width, char_height))
             character.set_draw_properties(DrawProperties((char_x, char_y), (char_width, char_height)))
 
-            for inst in character.get_draw_assets_instructions():
+            self.__character_draw_instructions = character.get_draw_assets_instructions()
+            for inst in self.__character_draw_instructions:
                 instructions.append(inst)
 
         return instructions
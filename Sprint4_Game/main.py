@@ -1,18 +1,32 @@
-"""Entry point for the execution of the game."""
-
-from settings import *
-from definitions import *
-from utils.os_utils import *
-from game_configurations.GameConfiguration import GameConfiguration
-from game_configurations.ArcadeGameConfiguration import ArcadeGameConfiguration
-from core.GameWorld import GameWorld
-from codec.saves.SaveCodec import SaveCodec
+"""Entry point for the execution of the game.
+
+Only what is needed to show the menu is imported up front. The game itself (the game configuration and everything it uses) is
+imported on a background thread whilst the menu is showing, so the window appears and the menu is interactive as soon as possible.
+"""
+
+from __future__ import annotations
+from settings import REQUESTED_SCREEN_SIZE, ASSET_WARMUP, ASSET_WARMUP_IN_BACKGROUND
+from utils.os_utils import ScreenDimension, nt_safe_size_for_program_window
 from codec.saves.JSONSaveCodec import JSONSaveCodec
+from codec.saves.BinarySaveCodec import BinarySaveCodec
+from codec.saves.DeltaSaveCodec import DeltaSaveCodec
+from codec.saves.AutosaveJournal import AutosaveJournal
 from screen.ui.Menu import Menu
 from screen.ui.buttons.ButtonType import ButtonType
+from screen.AssetWarmer import AssetWarmer
+from screen.PygameScreenController import PygameScreenController
+from concurrent.futures import Future
+from typing import Optional, cast, TYPE_CHECKING
 
 import pygame
 import os
+import threading
+import time
+
+if TYPE_CHECKING:
+    from game_configurations.ArcadeGameConfiguration import ArcadeGameConfiguration
+    from core.GameWorld import GameWorld
+    from replays.ReplayRecorder import ReplayRecorder
 
 if __name__ == "__main__":
     # ----- CONFIGURATION VARIABLES --------------------------------------------------------------------------------------
@@ -21,12 +35,30 @@ if __name__ == "__main__":
     SAVE_DIRECTORY: str = "saves"
 
     # SAVE_CODEC
-    # The codec to use for encoding/decoding save files
-    SAVE_CODEC: SaveCodec = JSONSaveCodec(SAVE_DIRECTORY)
+    # The codec to use for encoding/decoding save files. Either JSONSaveCodec (readable JSON), BinarySaveCodec (compact binary, for
+    # archiving games) or DeltaSaveCodec (appends only what changed each save, for frequent saves). All load the same save data, so a
+    # JSON save can be converted with BinarySaveCodec.encode() and vice versa
+    SAVE_CODEC: JSONSaveCodec = JSONSaveCodec(SAVE_DIRECTORY)
+
+    # AUTOSAVE_JOURNAL
+    # The journal to autosave every turn to, for resuming a game that stopped without saving. None to disable autosaving
+    AUTOSAVE_JOURNAL: Optional[AutosaveJournal] = AutosaveJournal(f"{SAVE_DIRECTORY}/autosave")
+
+    # REPLAY_DIRECTORY
+    # The directory relative to the root project to record a replay of every new game into, for replay.py. None to not record replays
+    REPLAY_DIRECTORY: Optional[str] = f"{SAVE_DIRECTORY}/replays"
+
+    # GAME_SEED
+    # The seed to generate a new game from, e.g a replay's seed to play the same board again. None for a random seed
+    GAME_SEED: Optional[int] = None
 
     # GAME_CONFIGURATION
-    # The game configuration the game is to use
-    GAME_CONFIGURATION: GameConfiguration = ArcadeGameConfiguration(SAVE_CODEC)
+    # Creates the game configuration the game is to use. Importing the game configuration imports the whole game, so it is imported
+    # here, which is called on a background thread whilst the menu is showing
+    def create_game_configuration() -> ArcadeGameConfiguration:
+        from game_configurations.ArcadeGameConfiguration import ArcadeGameConfiguration
+
+        return ArcadeGameConfiguration(SAVE_CODEC, autosave_journal=AUTOSAVE_JOURNAL, seed=GAME_SEED)
 
     # ----- PYGAME INIT -------------------------------------------------------------------------------------------------
     # Initialise pygame
@@ -46,22 +78,71 @@ if __name__ == "__main__":
         pygame.display.set_mode((REQUESTED_SCREEN_SIZE, REQUESTED_SCREEN_SIZE))
 
     # ----- GAME INSTANCE ------------------------------------------------------------------------------------------
-    # MENU
-    save_file_exists: bool = os.path.isfile(f"{ROOT_PATH}/{SAVE_DIRECTORY}/{JSONSaveCodec.SAVE_FILE_NAME}.json")
+    # RECOVERY
+    # Continue from whichever of the save file and the autosave journal was written last, so a game that stopped without being saved
+    # resumes from its last turn
+    continue_codec: Optional[JSONSaveCodec] = None
+    continue_save_time: float = 0
+    for codec in [SAVE_CODEC] + ([AUTOSAVE_JOURNAL] if AUTOSAVE_JOURNAL is not None else []):
+        last_save_time: Optional[float] = codec.get_last_save_time()
+        if last_save_time is not None and last_save_time > continue_save_time:
+            continue_codec, continue_save_time = codec, last_save_time
+
+    save_file_exists: bool = continue_codec is not None
 
-    menu: Menu = Menu(save_file_exists, SAVE_CODEC if save_file_exists else None)
+    # GAME LOADING
+    # Import and create the game configuration in a background thread, then warm up the game board's assets in it if they are to be
+    # warmed up whilst showing the menu. The thread does not stop the program from exiting
+    screen_size: tuple[int, int] = PygameScreenController.instance().get_screen_size()
+    game_configuration_future: Future[ArcadeGameConfiguration] = Future()
+
+    def load_game_configuration() -> None:
+        try:
+            configuration: ArcadeGameConfiguration = create_game_configuration()
+            if ASSET_WARMUP and ASSET_WARMUP_IN_BACKGROUND:
+                AssetWarmer(configuration.get_asset_manifest(screen_size)).warm_up()
+            game_configuration_future.set_result(configuration)
+        except BaseException as e:
+            game_configuration_future.set_exception(e)
+
+    threading.Thread(target=load_game_configuration, name="GameLoader", daemon=True).start()
+
+    # ASSET WARMUP
+    # Load and transform the menu's assets before showing it, and the game board's assets either before or whilst showing the menu
+    if ASSET_WARMUP:
+        AssetWarmer(Menu.get_asset_manifest(screen_size, save_file_exists)).warm_up()
+
+        if not ASSET_WARMUP_IN_BACKGROUND:
+            AssetWarmer(game_configuration_future.result().get_asset_manifest(screen_size)).warm_up()
+
+    # MENU
+    menu: Menu = Menu(save_file_exists, continue_codec)
     buttonTypePressed: ButtonType = menu.run()
 
     # GAME WORLD
-    # Generate game world based on whether the player chooses to continue or create a new game
+    # Wait for the game to finish loading (and warming up) before the game's first frame, then generate game world based on whether
+    # the player chooses to continue or create a new game
+    GAME_CONFIGURATION: ArcadeGameConfiguration = game_configuration_future.result()
     game_world: GameWorld
+    replay_recorder: Optional[ReplayRecorder] = None
 
     match buttonTypePressed:
         case ButtonType.CONTINUE:
-            load_data = SAVE_CODEC.load()
+            load_data = cast(JSONSaveCodec, continue_codec).load()
             game_world = GAME_CONFIGURATION.create_game_world_from_json_save(load_data)
 
         case _:
+            # the journal belongs to the previous game
+            if AUTOSAVE_JOURNAL is not None:
+                AUTOSAVE_JOURNAL.clear()
             game_world = GAME_CONFIGURATION.generate_game_world()
 
+            # only new games can be replayed, as continued games were not generated from the seed
+            if REPLAY_DIRECTORY is not None:
+                replay_recorder = GAME_CONFIGURATION.create_replay_recorder()
+                game_world.set_replay_recorder(replay_recorder)
+
     game_world.run()
+
+    if replay_recorder is not None:
+        replay_recorder.get_replay_log().write(f"{REPLAY_DIRECTORY}/{time.strftime('%Y%m%d-%H%M%S')}-{GAME_CONFIGURATION.get_seed()}.json")
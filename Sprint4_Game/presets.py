@@ -124,7 +124,7 @@ def add_swap_chit_cards_in_sequence(number: int, chit_cards: list[ChitCard]) ->
 
     while generated < number:
         for _ in range(1, 2):
-            chit_cards.append(PowerChitCard(SwapPower(None), "assets/chit_cards/chit_card_swap.png"))
+            chit_cards.append(PowerChitCard(swap_powers[generated], "assets/chit_cards/chit_card_swap.png"))
             generated += 1
 
             if generated >= number:
@@ -153,7 +153,7 @@ def normal_tiles_in_animal_sequence(number: int) -> list[Tile]:
                 return tiles
 
 
-def randomised_volcano_card_sequence(n: int) -> list[Tile]:
+def randomised_volcano_card_sequence(n: int, rng: random.Random) -> list[Tile]:
     """Generate a tile sequence in order that is composed of the specified number of random volcano cards in sequence.
 
     Volcano cards are a preset sequence of 3 tiles. Volcano cards are chosen randomly without replacement. Once volcano
@@ -161,6 +161,7 @@ def randomised_volcano_card_sequence(n: int) -> list[Tile]:
 
     Args:
         n: The number of volcano cards to generate
+        rng: The random number generator to choose volcano cards with
 
     Returns:
         The tiles composing the generated sequence.
@@ -177,7 +178,7 @@ def randomised_volcano_card_sequence(n: int) -> list[Tile]:
             choices = [i for i in range(len(volcano_cards))]
 
         # randomly choose from available volcano cards without replacement, and add its tiles to the growing tile sequence
-        rand_i = random.choice(choices)
+        rand_i = rng.choice(choices)
         rand_volcano_card = volcano_cards[rand_i]
 
         tiles.extend(rand_volcano_card)
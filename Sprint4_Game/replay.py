@@ -0,0 +1,65 @@
+"""Entry point for replaying games recorded by main.py.
+
+Replays each replay file given headlessly as fast as possible, reporting whether each replay reached the recorded winner (e.g to check
+rule changes against recorded games), or replays a single file visually at a multiple of the recorded speed.
+
+Example:
+    python replay.py saves/replays/*.json
+    python replay.py saves/replays/20240101-120000-12345.json --speed 4
+"""
+
+from settings import REQUESTED_SCREEN_SIZE
+from codec.saves.JSONSaveCodec import JSONSaveCodec
+from core.HeadlessGameEngine import HeadlessGameEngine
+from game_objects.characters.PlayableCharacter import PlayableCharacter
+from replays.ReplayLog import ReplayLog
+from replays.Replayer import Replayer
+from definitions import ROOT_PATH
+from typing import Optional
+
+import argparse
+import os
+import pygame
+import time
+
+# ----- CONFIGURATION VARIABLES --------------------------------------------------------------------------------------
+# SAVE_DIRECTORY
+# The save directory the replayed games' configurations are given. Replayed games are only saved if saved whilst replaying visually
+SAVE_DIRECTORY: str = "saves"
+
+if __name__ == "__main__":
+    # ----- ARGUMENTS -------------------------------------------------------------------------------------------------
+    parser = argparse.ArgumentParser(description="Replay games recorded by main.py, headlessly or visually.")
+    parser.add_argument("replays", nargs="+", help="replay files to replay, relative to the current directory")
+    parser.add_argument("--speed", type=float, default=None, help="replay a single file visually at this multiple of the recorded speed")
+    args = parser.parse_args()
+
+    replay_paths: list[str] = [os.path.relpath(os.path.abspath(path), ROOT_PATH) for path in args.replays]
+
+    # ----- VISUAL REPLAY -----------------------------------------------------------------------------------------------
+    if args.speed is not None:
+        if len(replay_paths) != 1:
+            parser.error("only one replay file can be replayed visually at a time")
+
+        pygame.init()
+        pygame.display.set_caption("Fiery Dragons (Replay)")
+        pygame.display.set_mode((REQUESTED_SCREEN_SIZE, REQUESTED_SCREEN_SIZE))
+        Replayer(ReplayLog.read(replay_paths[0]), JSONSaveCodec(SAVE_DIRECTORY)).play_visually(args.speed)
+
+    # ----- HEADLESS REPLAY ---------------------------------------------------------------------------------------------
+    else:
+        start_time: float = time.perf_counter()
+        mismatch_count: int = 0
+
+        for path in replay_paths:
+            replay_log: ReplayLog = ReplayLog.read(path)
+            engine: HeadlessGameEngine = Replayer(replay_log, JSONSaveCodec(SAVE_DIRECTORY)).play_headless()
+
+            winner: Optional[PlayableCharacter] = engine.get_winner()
+            winner_i: Optional[int] = engine.get_playable_characters().index(winner) if winner is not None else None
+            if winner_i != replay_log.get_winner():
+                mismatch_count += 1
+            print(f"{path} | clicks {len(replay_log.get_clicks())} | turns {engine.get_turn_count()} | winner {winner_i} (recorded {replay_log.get_winner()})")
+
+        elapsed: float = time.perf_counter() - start_time
+        print(f"Replayed {len(replay_paths)} games in {elapsed:.2f}s, {mismatch_count} with a different winner than recorded")
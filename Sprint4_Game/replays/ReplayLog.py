@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import Any, Optional
+from definitions import ROOT_PATH
+
+import json
+import os
+
+
+class ReplayLog:
+    """A compact record of a game of the arcade configuration, from which the game can be replayed exactly. Stores the seed the game was
+    generated from (which decides the volcano card sequence, chit card order and chit card
+    layout), the arguments the configuration was created with, every chit card click in form (game time, player index, chit card
+    index) and the index of the player who won, if any.
+
+    Author: Shen
+    """
+
+    FORMAT_VERSION: int = 2  # version of the replay file format, incremented on incompatible changes
+
+    def __init__(self, seed: int, configuration_arguments: dict[str, Any]):
+        """
+        Args:
+            seed: The seed the game's configuration was created with
+            configuration_arguments: The keyword arguments the ArcadeGameConfiguration was created with, besides the save codec
+        """
+        self.__seed: int = seed
+        self.__configuration_arguments: dict[str, Any] = configuration_arguments
+        self.__clicks: list[tuple[float, int, int]] = []  # (game time in seconds, player index, chit card index) of every click
+        self.__winner: Optional[int] = None  # index of the player who won
+
+    def add_click(self, time: float, player_i: int, chit_card_i: int) -> None:
+        """Record a click on a chit card.
+
+        Args:
+            time: The game time of the click in seconds
+            player_i: The index of the player who clicked, in turn order
+            chit_card_i: The index of the chit card clicked, in the order placed on the game board
+        """
+        self.__clicks.append((time, player_i, chit_card_i))
+
+    def set_winner(self, player_i: Optional[int]) -> None:
+        """Set the player who won the game.
+
+        Args:
+            player_i: The index of the player who won in turn order, or None if nobody won
+        """
+        self.__winner = player_i
+
+    def get_seed(self) -> int:
+        """Get the seed the game's configuration was created with.
+
+        Returns:
+            The seed
+        """
+        return self.__seed
+
+    def get_configuration_arguments(self) -> dict[str, Any]:
+        """Get the keyword arguments the ArcadeGameConfiguration was created with, besides the save codec.
+
+        Returns:
+            Dictionary with K = argument name, V = argument value
+        """
+        return self.__configuration_arguments
+
+    def get_clicks(self) -> list[tuple[float, int, int]]:
+        """Get every chit card click in the order clicked.
+
+        Returns:
+            List of tuples of form (game time in seconds, player index, chit card index)
+        """
+        return self.__clicks
+
+    def get_winner(self) -> Optional[int]:
+        """Get the player who won the game.
+
+        Returns:
+            The index of the player who won in turn order, or None if nobody won
+        """
+        return self.__winner
+
+    def write(self, path: str) -> None:
+        """Write the replay log to a JSON file, creating any directories that don't exist. Click times are stored in milliseconds.
+
+        Args:
+            path: The file path relative to the root of the project
+        """
+        file_path: str = f"{ROOT_PATH}/{path}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        replay: dict[str, Any] = {
+            "version": ReplayLog.FORMAT_VERSION,
+            "seed": self.__seed,
+            "configuration": self.__configuration_arguments,
+            "clicks": [[round(time * 1000), player_i, chit_card_i] for time, player_i, chit_card_i in self.__clicks],
+            "winner": self.__winner,
+        }
+        with open(file_path, "w") as fp:
+            json.dump(replay, fp, separators=(",", ":"))
+
+    @staticmethod
+    def read(path: str) -> ReplayLog:
+        """Read a replay log written by write().
+
+        Args:
+            path: The file path relative to the root of the project
+
+        Returns:
+            The replay log
+
+        Raises:
+            Exception if the file is not a replay log of a supported version
+        """
+        file_path: str = f"{ROOT_PATH}/{path}"
+        with open(file_path, "r") as fp:
+            try:
+                replay: dict[str, Any] = json.load(fp)
+            except Exception as e:
+                raise Exception(f"The replay file at: {file_path} cannot be parsed as JSON. Error: {e}")
+
+        if replay.get("version") != ReplayLog.FORMAT_VERSION:
+            raise Exception(f"The replay file at: {file_path} has unsupported version {replay.get('version')}. Supported: {ReplayLog.FORMAT_VERSION}")
+
+        replay_log: ReplayLog = ReplayLog(replay["seed"], replay["configuration"])
+        for time_ms, player_i, chit_card_i in replay["clicks"]:
+            replay_log.add_click(time_ms / 1000, player_i, chit_card_i)
+        replay_log.set_winner(replay["winner"])
+        return replay_log
@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from game_objects.characters.PlayableCharacter import PlayableCharacter
+from game_objects.chit_cards.ChitCard import ChitCard
+from game_concepts.events.WinEventListener import WinEventListener
+from game_concepts.events.WinEventPublisher import WinEventPublisher
+from screen.ModularClickableSprite import ModularClickableSprite
+from replays.ReplayLog import ReplayLog
+
+
+class ReplayRecorder(WinEventListener):
+    """Records the chit card clicks and winner of a game into a replay log, so the game can be replayed later.
+
+    Author: Shen
+    """
+
+    def __init__(self, replay_log: ReplayLog, chit_cards: Sequence[ChitCard], playable_characters: list[PlayableCharacter]):
+        """
+        Args:
+            replay_log: The replay log to record into, describing how the game was generated
+            chit_cards: The chit cards on the game board, in the order placed
+            playable_characters: The playable characters in turn order
+        """
+        self.__replay_log: ReplayLog = replay_log
+        self.__chit_card_indexes: dict[ModularClickableSprite, int] = {chit_card: i for i, chit_card in enumerate(chit_cards)}
+        self.__player_indexes: dict[PlayableCharacter, int] = {character: i for i, character in enumerate(playable_characters)}
+
+        WinEventPublisher.instance().subscribe(self)
+
+    def on_click(self, clickable: ModularClickableSprite, character: PlayableCharacter, time: float) -> None:
+        """Record a click by a player, if it was on a chit card.
+
+        Args:
+            clickable: The clickable sprite clicked
+            character: The character of the player who clicked
+            time: The game time of the click in seconds
+        """
+        chit_card_i: int = self.__chit_card_indexes.get(clickable, -1)
+        if chit_card_i != -1:
+            self.__replay_log.add_click(time, self.__player_indexes[character], chit_card_i)
+
+    def get_replay_log(self) -> ReplayLog:
+        """Get the replay log recorded into.
+
+        Returns:
+            The replay log
+        """
+        return self.__replay_log
+
+    # --------- WinEventListener interface -------------------------------------------------------------------------------------------------
+    def on_player_win(self, character: PlayableCharacter) -> None:
+        """On a player win, record the player who won if they played in the recorded game.
+
+        Args:
+            character: The character who won
+        """
+        if character in self.__player_indexes:
+            self.__replay_log.set_winner(self.__player_indexes[character])
@@ -0,0 +1,119 @@
+from collections.abc import Sequence
+from codec.saves.JSONSaveCodec import JSONSaveCodec
+from core.GameWorld import GameWorld
+from core.HeadlessGameEngine import HeadlessGameEngine
+from game_configurations.ArcadeGameConfiguration import ArcadeGameConfiguration
+from game_objects.characters.PlayableCharacter import PlayableCharacter
+from game_objects.chit_cards.ChitCard import ChitCard
+from game_concepts.turns.TurnManager import TurnManager
+from replays.ReplayLog import ReplayLog
+
+
+class Replayer:
+    """Replays a game recorded in a replay log, either headlessly as fast as possible, or visually through a GameWorld at a multiple of
+    the recorded speed. The game is regenerated from the log's seed and configuration arguments, and the recorded clicks are replayed
+    in order by the recorded players.
+
+    Author: Shen
+    """
+
+    __STEP_DELAY: float = 0.05  # seconds of game time between checks for whether the next click is due when replaying visually
+
+    def __init__(self, replay_log: ReplayLog, save_codec: JSONSaveCodec):
+        """
+        Args:
+            replay_log: The replay log to replay
+            save_codec: The codec the replayed game's configuration saves with
+        """
+        self.__replay_log: ReplayLog = replay_log
+        self.__save_codec: JSONSaveCodec = save_codec
+
+    def play_headless(self) -> HeadlessGameEngine:
+        """Replay the game without a screen, as fast as possible.
+
+        Returns:
+            The headless game engine that played the game, e.g to compare its winner to the recorded winner
+
+        Raises:
+            Exception if the replay diverges from the recording, i.e a click was recorded for a different player than is playing
+        """
+        engine: HeadlessGameEngine = self.__create_configuration().generate_headless_game()
+        playable_characters: list[PlayableCharacter] = engine.get_playable_characters()
+
+        try:
+            for i, (_, player_i, chit_card_i) in enumerate(self.__replay_log.get_clicks()):
+                Replayer.__check_player(i, player_i, playable_characters.index(engine.get_currently_playing_character()))
+                engine.flip_chit_card(chit_card_i)
+        finally:
+            engine.close()
+
+        return engine
+
+    def play_visually(self, speed: float) -> None:
+        """Replay the game through a GameWorld at a multiple of the recorded speed. Each click happens once the player can click again
+        and the recorded time since the previous click has passed at the speed. Clicks by the user are ignored.
+
+        Warning: Pygame and its display must be initialised through pygame.init() and pygame.display.set_mode() before replaying.
+
+        Args:
+            speed: The multiple of the recorded speed to replay at
+
+        Raises:
+            Exception if the replay diverges from the recording, i.e a click was recorded for a different player than is playing
+        """
+        configuration: ArcadeGameConfiguration = self.__create_configuration()
+        game_world: GameWorld = configuration.generate_game_world()
+        chit_cards: Sequence[ChitCard] = configuration.get_chit_cards()
+        turn_manager: TurnManager = configuration.get_turn_manager()
+        playable_characters: list[PlayableCharacter] = turn_manager.get_tracked_player_characters()
+        clicks: list[tuple[float, int, int]] = self.__replay_log.get_clicks()
+
+        next_click_i: int = 0  # index of the next click to replay
+        next_click_time: float = clicks[0][0] if len(clicks) > 0 else 0  # game time the next click is due
+
+        def replay_due_click() -> None:
+            nonlocal next_click_i, next_click_time
+            if next_click_i >= len(clicks):
+                return
+
+            # a click is only possible whilst the current player can continue their turn and clicks are enabled
+            character: PlayableCharacter = turn_manager.get_currently_playing_character()
+            if game_world.is_mouse_click_enabled() and character.should_continue_turn() and game_world.get_time() >= next_click_time:
+                time, player_i, chit_card_i = clicks[next_click_i]
+                Replayer.__check_player(next_click_i, player_i, playable_characters.index(character))
+                chit_cards[chit_card_i].on_click(character)
+
+                next_click_i += 1
+                if next_click_i < len(clicks):
+                    next_click_time = game_world.get_time() + clicks[next_click_i][0] - time
+
+            game_world.schedule(Replayer.__STEP_DELAY, replay_due_click)
+
+        game_world.disable_player_input()
+        game_world.set_time_scale(speed)
+        game_world.schedule(0, replay_due_click)
+        game_world.run()
+
+    def __create_configuration(self) -> ArcadeGameConfiguration:
+        """Create the configuration the recorded game was generated with.
+
+        Returns:
+            The configuration, which generates the recorded game
+        """
+        return ArcadeGameConfiguration(self.__save_codec, seed=self.__replay_log.get_seed(), **self.__replay_log.get_configuration_arguments())
+
+    # ----------- Class methods -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __check_player(click_i: int, recorded_player_i: int, playing_player_i: int) -> None:
+        """Check that a click is replayed by the player who made it when recorded.
+
+        Args:
+            click_i: The index of the click
+            recorded_player_i: The index of the player who made the click when recorded
+            playing_player_i: The index of the player currently playing in the replay
+
+        Raises:
+            Exception if the players differ
+        """
+        if recorded_player_i != playing_player_i:
+            raise Exception(f"The replay diverged at click {click_i}: recorded by player {recorded_player_i}, but player {playing_player_i} is playing.")
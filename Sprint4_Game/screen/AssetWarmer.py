@@ -0,0 +1,56 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from typing import Optional
+from screen.DrawAssetInstruction import DrawAssetInstruction
+from screen.PygameScreenController import PygameScreenController
+
+import threading
+
+
+class AssetWarmer:
+    """Warms up the screen controller's caches by loading and transforming the assets in a manifest ahead of drawing them, so that
+    the first frames drawing them do not stall. Warming up can be done immediately, or in a background thread whilst other things
+    are drawn.
+
+    Warning: Pygame and its display must be initialised through pygame.init() and pygame.display.set_mode() before warming up.
+
+    Author: Shen
+    """
+
+    def __init__(self, manifest: Sequence[DrawAssetInstruction]):
+        """
+        Args:
+            manifest: The drawing instructions for the assets to warm up, in the order they should be warmed up
+        """
+        self.__manifest: Sequence[DrawAssetInstruction] = manifest
+        self.__thread: Optional[threading.Thread] = None
+
+    def warm_up(self) -> None:
+        """Load and transform every asset in the manifest, returning once done."""
+        PygameScreenController.instance().preload_assets(self.__manifest)
+
+    def start(self) -> None:
+        """Start warming up in a background thread, returning immediately. Does nothing if already started.
+
+        The thread does not stop the program from exiting.
+        """
+        if self.__thread is not None:
+            return
+
+        # Create the controller on this thread so that the background thread only uses it
+        PygameScreenController.instance()
+        self.__thread = threading.Thread(target=self.warm_up, name="AssetWarmer", daemon=True)
+        self.__thread.start()
+
+    def wait(self) -> None:
+        """Wait for warming up in the background to finish. Does nothing if it was not started."""
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def is_done(self) -> bool:
+        """Get whether warming up in the background has finished.
+
+        Returns:
+            Whether warming up in the background has finished. False if it was not started.
+        """
+        return self.__thread is not None and not self.__thread.is_alive()
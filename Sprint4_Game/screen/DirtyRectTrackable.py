@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from typing import Protocol
+
+import pygame
+
+
+class DirtyRectTrackable(Protocol):
+    """Conformers keep track of the areas of the screen their changes in state have invalidated, so that only those areas need
+    to be redrawn.
+
+    Author: Shen
+    """
+
+    @abstractmethod
+    def consume_dirty_rects(self) -> list[pygame.Rect]:
+        """Get the areas of the screen invalidated since the last call, and stop tracking them.
+
+        Returns:
+            The invalidated areas of the screen
+        """
+        ...
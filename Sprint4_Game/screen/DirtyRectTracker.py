@@ -0,0 +1,77 @@
+from typing import Optional
+from screen.DrawProperties import DrawProperties
+from utils.pygame_utils import get_rotated_bounding_rect
+
+import pygame
+
+
+class DirtyRectTracker:
+    """Tracks the areas of the screen invalidated by changes in state of a single object. Used by objects to implement the
+    DirtyRectTrackable protocol.
+
+    Author: Shen
+    """
+
+    __ANY_ROTATION_DEG: float = 45  # rotation at which a square covers the largest area, covering the square at any other rotation
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.__dirty_rects: list[pygame.Rect] = []
+
+    def mark_dirty(self, rect: pygame.Rect) -> None:
+        """Mark an area of the screen as invalidated.
+
+        Args:
+            rect: The invalidated area
+        """
+        self.__dirty_rects.append(rect)
+
+    def mark_draw_properties_dirty(self, draw_properties: Optional[DrawProperties], any_rotation: bool = False) -> None:
+        """Mark the area of the screen covered by an object drawn with the draw properties as invalidated. Does nothing if
+        the draw properties are None.
+
+        Args:
+            draw_properties (optional): The draw properties of the object
+            any_rotation: Whether to mark the area covering the object at any rotation (for objects that animate their rotation)
+        """
+        if draw_properties is None:
+            return
+
+        rotation: float = DirtyRectTracker.__ANY_ROTATION_DEG if any_rotation else draw_properties.get_rotation()
+        self.__dirty_rects.append(get_rotated_bounding_rect(draw_properties.get_coordinates(), draw_properties.get_size(), rotation))
+
+    def mark_draw_properties_change(self, old: Optional[DrawProperties], new: Optional[DrawProperties], any_rotation: bool = False) -> bool:
+        """Mark the areas covered by the old and new draw properties as invalidated if they differ in coordinates, size or rotation.
+
+        Args:
+            old (optional): The draw properties previously used to draw the object
+            new (optional): The draw properties to be used to draw the object
+            any_rotation: Whether to mark the area covering the object at any rotation (for objects that animate their rotation)
+
+        Returns:
+            Whether the draw properties differed
+        """
+        if old is not None and new is not None:
+            if (
+                old.get_coordinates() == new.get_coordinates()
+                and old.get_size() == new.get_size()
+                and old.get_rotation() == new.get_rotation()
+            ):
+                return False
+
+        self.mark_draw_properties_dirty(old, any_rotation)
+        self.mark_draw_properties_dirty(new, any_rotation)
+        return True
+
+    def consume(self) -> list[pygame.Rect]:
+        """Get the invalidated areas marked since the last call, and stop tracking them.
+
+        Returns:
+            The invalidated areas
+        """
+        if len(self.__dirty_rects) == 0:
+            return []
+
+        dirty_rects = self.__dirty_rects
+        self.__dirty_rects = []
+        return dirty_rects
@@ -2,7 +2,8 @@ from typing import Optional
 
 
 class DrawAssetInstruction:
-    """A data class for organising the data required for drawing an image using an asset.
+    """A data class for organising the data required for drawing an image using an asset. Instructions can be kept and reused
+    across frames by their owners, with the rotation updated in place for animated assets.
 
     Author: Shen
     """
@@ -68,3 +69,11 @@ class DrawAssetInstruction:
             The degrees
         """
         return self.__rotate
+
+    def set_rotation(self, rotate: float) -> None:
+        """Set the degrees of anticlockwise rotation to draw the image at.
+
+        Args:
+            rotate: The degrees
+        """
+        self.__rotate = rotate
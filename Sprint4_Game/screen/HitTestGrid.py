@@ -0,0 +1,58 @@
+from __future__ import annotations
+from typing import Optional
+from collections.abc import Sequence
+from screen.ModularClickableSprite import ModularClickableSprite
+
+import pygame
+
+
+class HitTestGrid:
+    """Index of the hitboxes of drawn clickable sprites, for finding the sprite under a position without testing every hitbox. The screen
+    is split into square cells, each listing the hitboxes overlapping it in draw order. Where hitboxes overlap, the sprite drawn last
+    (topmost) is hit.
+
+    Author: Shen
+    """
+
+    __CELL_SIZE: int = 64  # width and height of each cell in px
+
+    def __init__(self, hitboxes: Sequence[tuple[pygame.Rect, ModularClickableSprite]]):
+        """
+        Args:
+            hitboxes: Tuples of form (rectangular hitbox, object associated with hitbox) in the order the sprites were drawn
+        """
+        self.__hitboxes: list[tuple[pygame.Rect, ModularClickableSprite]] = [(rect.copy(), clickable) for rect, clickable in hitboxes]
+        self.__cells: dict[tuple[int, int], list[tuple[pygame.Rect, ModularClickableSprite]]] = dict()  # K = (column, row), V = hitboxes in draw order
+
+        for rect, clickable in self.__hitboxes:
+            for column in range(rect.left // HitTestGrid.__CELL_SIZE, (rect.right - 1) // HitTestGrid.__CELL_SIZE + 1):
+                for row in range(rect.top // HitTestGrid.__CELL_SIZE, (rect.bottom - 1) // HitTestGrid.__CELL_SIZE + 1):
+                    self.__cells.setdefault((column, row), []).append((rect, clickable))
+
+    def get_topmost_at(self, position: tuple[int, int]) -> Optional[ModularClickableSprite]:
+        """Get the sprite drawn last whose hitbox contains a position.
+
+        Args:
+            position: The position in form (x, y)
+
+        Returns:
+            The topmost sprite at the position if any
+        """
+        cell_hitboxes: list[tuple[pygame.Rect, ModularClickableSprite]] = self.__cells.get(
+            (position[0] // HitTestGrid.__CELL_SIZE, position[1] // HitTestGrid.__CELL_SIZE), []
+        )
+        for rect, clickable in reversed(cell_hitboxes):
+            if rect.collidepoint(position):
+                return clickable
+        return None
+
+    def is_for(self, hitboxes: Sequence[tuple[pygame.Rect, ModularClickableSprite]]) -> bool:
+        """Get whether the index was built from the same hitboxes, i.e whether it is still valid for them.
+
+        Args:
+            hitboxes: Tuples of form (rectangular hitbox, object associated with hitbox) in the order the sprites were drawn
+
+        Returns:
+            Whether the hitboxes are the same as the ones indexed
+        """
+        return self.__hitboxes == list(hitboxes)
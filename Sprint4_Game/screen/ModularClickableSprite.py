@@ -1,12 +1,13 @@
 from __future__ import annotations
 from abc import abstractmethod
 from screen.DrawAssetInstruction import DrawAssetInstruction
+from screen.DirtyRectTrackable import DirtyRectTrackable
 from game_objects.tiles.Tile import Tile
 from game_objects.characters.PlayableCharacter import PlayableCharacter
 from typing import Protocol, Optional
 
 
-class ModularClickableSprite(Protocol):
+class ModularClickableSprite(DirtyRectTrackable, Protocol):
     """Allows an object to be represented by assets (images) that can be clicked on.
 
     Author: Shen
@@ -1,15 +1,19 @@
 from __future__ import annotations
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Optional, cast
 from definitions import ROOT_PATH
+from settings import BATCHED_BLITTING, TEXTURE_ATLAS, DISK_SURFACE_CACHE, DISK_SURFACE_CACHE_DIRECTORY
 from screen.DrawAssetInstruction import DrawAssetInstruction
 from screen.ModularClickableSprite import ModularClickableSprite
 from screen.DrawableByAsset import DrawableByAsset
+from screen.TextureAtlas import TextureAtlas
+from screen.SurfaceDiskCache import SurfaceDiskCache
 from screen.ModularClickableSprite import ModularClickableSprite
 from metaclasses.SingletonMeta import SingletonMeta
 
 import pygame
+import threading
 
 
 class PygameScreenController(metaclass=SingletonMeta):
@@ -21,7 +25,7 @@ class PygameScreenController(metaclass=SingletonMeta):
     Author: Shen
     """
 
-    __CACHE_RESIZED_MAX_SIZE = 10000  # max size the resized image cache can reach before purge
+    __CACHE_MAX_BYTES = 256 * 1024 * 1024  # max bytes of surface data the transformed image cache can hold before evicting
 
     def __init__(self) -> None:
         """Initialise screen controller.
@@ -32,11 +36,12 @@ class PygameScreenController(metaclass=SingletonMeta):
         self.__screen: pygame.Surface = pygame.display.get_surface()
 
         self.__image_cache: dict[str, pygame.Surface] = dict()  # K = Relative image path, V = Loaded image in alpha form
-        self.__image_cache_resized: dict[str, dict[tuple[int, int], pygame.Surface]] = defaultdict(
-            dict
-        )  # K = Relative image path, V = dictionary with key -> (width, height), value -> cached resized image
-        self.__image_cache_resized_size: int = 0  # current resized cache size
-        self.__rotate_cache: PygameScreenController.__ImageRotateCache = PygameScreenController.__ImageRotateCache()
+        self.__transform_cache: PygameScreenController.__TransformedImageCache = PygameScreenController.__TransformedImageCache(
+            PygameScreenController.__CACHE_MAX_BYTES
+        )  # resized and rotated images
+        self.__texture_atlas: TextureAtlas = TextureAtlas()  # K = (relative image path, (width, height)), V = packed resized image
+        self.__disk_cache: Optional[SurfaceDiskCache] = SurfaceDiskCache(DISK_SURFACE_CACHE_DIRECTORY) if DISK_SURFACE_CACHE else None
+        self.__cache_lock: threading.RLock = threading.RLock()
 
         if self.__screen is None:
             raise Exception("The pygame screen does not yet exist.")
@@ -49,11 +54,19 @@ class PygameScreenController(metaclass=SingletonMeta):
         """
         self.__screen.fill(rgb)
 
+    def set_draw_area(self, rect: Optional[pygame.Rect]) -> None:
+        """Restrict all drawing on the screen to an area. Anything drawn outside of the area is discarded.
+
+        Args:
+            rect (optional): The area to restrict drawing to. None allows drawing on the entire screen.
+        """
+        self.__screen.set_clip(rect)
+
     def draw_asset(self, image_path: str, x: int, y: int, size: Optional[tuple[int, int]] = None, rotate: float = 0) -> pygame.Surface:
         """Draw an asset on coordinates (x,y) on the screen with the specified size and rotation.
 
-        Has caching behaviour that attempts to utilise caches whenever possible. If the respective caches get too large,
-        the caches will be purged.
+        Has caching behaviour that attempts to utilise caches whenever possible. If the caches get too large, the least recently
+        used images are evicted.
 
         Args:
             image_path: The path to the asset relative to root directory
@@ -67,63 +80,180 @@ class PygameScreenController(metaclass=SingletonMeta):
 
         Author: Shen
         """
-        abs_image_path: str = f"{ROOT_PATH}/{image_path}"
+        image, position = self.__resolve_asset(image_path, x, y, size, rotate)
+        self.__screen.blit(image, position)
+        return image
+
+    def draw_assets_batched(self, instructions: Sequence[DrawAssetInstruction]) -> list[pygame.Surface]:
+        """Draw assets in order based on instructions, by first resolving every instruction to its transformed image and position
+        then submitting them to the screen at once with Surface.blits(). Uses the same caches as draw_asset().
+
+        Args:
+            instructions: The drawing instructions
+
+        Returns:
+            The images that were drawn in order of instruction input
+        """
+        blit_sequence: list[tuple[pygame.Surface, tuple[int, int]]] = [
+            self.__resolve_asset(
+                instruction.get_asset_path(),
+                instruction.get_x_coord(),
+                instruction.get_y_coord(),
+                instruction.get_size(),
+                instruction.get_rotation(),
+            )
+            for instruction in instructions
+        ]
+        self.__screen.blits(blit_sequence, doreturn=False)
+
+        return [image for image, _ in blit_sequence]
+
+    def __resolve_asset(self, image_path: str, x: int, y: int, size: Optional[tuple[int, int]], rotate: float) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Resolve an asset to the transformed image with the specified size and rotation, and the position to draw it at so that it is
+        drawn on coordinates (x,y). Utilises caches whenever possible. If the caches get too large, the least recently used images are evicted.
+
+        Args:
+            image_path: The path to the asset relative to root directory
+            x: x-coordinate
+            y: y-coordinate
+            size (optional): Requested width and height for the image in form (width, height)
+            rotate: Degrees to rotate anti-clockwise by
+
+        Returns:
+            Tuple in form (the transformed image, the position (x, y) to draw the image at)
+
+        Author: Shen
+        """
+        # Caches are shared with threads preloading assets, so only one thread may use them at a time
+        with self.__cache_lock:
+            # Rotate image if rotation is value other than 0 degrees. Otherwise use without rotation.
+            if rotate != 0:
+                image, (x_rotate_offset, y_rotate_offset) = self.__rotated_image(image_path, size, rotate)
+                return (image, (x - x_rotate_offset, y - y_rotate_offset))
+
+            return (self.__resized_image(image_path, size), (x, y))
 
+    def __loaded_image(self, image_path: str) -> pygame.Surface:
+        """Get the image for an asset as loaded from its file. Utilises the image cache whenever possible.
+
+        Args:
+            image_path: The path to the asset relative to root directory
+
+        Returns:
+            The image in alpha form
+        """
         # Use image cache to load image if possible. HIT: Load cached image. MISS: Load then cache image
         if image_path not in self.__image_cache:
-            self.__image_cache[image_path] = pygame.image.load(abs_image_path).convert_alpha()
+            self.__image_cache[image_path] = pygame.image.load(f"{ROOT_PATH}/{image_path}").convert_alpha()
 
-        ### TRANSFORMING & DRAWING
-        image: pygame.Surface = self.__image_cache[image_path]
+        return self.__image_cache[image_path]
 
-        # Resize image to requested width and height
-        if size is not None:
-            width, height = size[0], size[1]
+    def __resized_image(self, image_path: str, size: Optional[tuple[int, int]]) -> pygame.Surface:
+        """Get the image for an asset resized to a size. Utilises the texture atlas and caches whenever possible.
 
-            # purge cache on exceeding resized cache's max size
-            if self.__image_cache_resized_size > PygameScreenController.__CACHE_RESIZED_MAX_SIZE:
-                self.__image_cache_resized = defaultdict(dict)
-                self.__image_cache_resized_size = 0
+        Args:
+            image_path: The path to the asset relative to root directory
+            size (optional): Requested width and height for the image in form (width, height). None if it should not be resized
+
+        Returns:
+            The resized image
+        """
+        if size is None:
+            return self.__loaded_image(image_path)
+
+        # Use the texture atlas if the resized image was packed into it
+        requested_size: tuple[int, int] = (size[0], size[1])
+        atlas_image: Optional[pygame.Surface] = self.__texture_atlas.get((image_path, requested_size)) if TEXTURE_ATLAS else None
+        if atlas_image is not None:
+            return atlas_image
+
+        # Resize image whilst using the transformed image cache as much as possible, then the disk cache from previous runs
+        cached_resized_image: Optional[tuple[pygame.Surface, tuple[int, int]]] = self.__transform_cache.get(image_path, requested_size, 0)
+        if cached_resized_image is not None:
+            return cached_resized_image[0]
+
+        disk_cached_resized_image = self.__disk_cache.get(image_path, requested_size, 0) if self.__disk_cache is not None else None
+        if disk_cached_resized_image is not None:
+            image: pygame.Surface = disk_cached_resized_image[0]
+        else:
+            image = pygame.transform.smoothscale(self.__loaded_image(image_path), requested_size)
+            if self.__disk_cache is not None:
+                self.__disk_cache.add(image_path, requested_size, 0, image, (0, 0))
 
-            # Resize image whilst using resized cache as much as possible
-            requested_size: tuple[int, int] = (width, height)
-            resized_cache_for_image: dict[tuple[int, int], pygame.Surface] = self.__image_cache_resized[image_path]
+        # Resized images are packed into the texture atlas whilst it has room, and otherwise cached as separate images
+        packed_image: Optional[pygame.Surface] = self.__texture_atlas.add((image_path, requested_size), image) if TEXTURE_ATLAS else None
+        if packed_image is not None:
+            return packed_image
 
-            if requested_size not in resized_cache_for_image:
-                resized_cache_for_image[requested_size] = pygame.transform.smoothscale(image, (width, height))
-                self.__image_cache_resized_size += 1
-            image = resized_cache_for_image[requested_size]
+        self.__transform_cache.add(image_path, requested_size, 0, image, (0, 0))
+        return image
+
+    def __rotated_image(self, image_path: str, size: Optional[tuple[int, int]], rotate: float) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Get the image for an asset resized to a size then rotated. Utilises caches whenever possible.
 
-        # Rotate image if rotation is value other than 0 degrees before drawing, whilst using cache as much as possible. Otherwise draw without rotation.
-        if rotate != 0:
-            cached_rotated_image: Optional[tuple[pygame.Surface, tuple[int, int]]] = self.__rotate_cache.get_cached_image(rotate, image_path)
+        Args:
+            image_path: The path to the asset relative to root directory
+            size (optional): Requested width and height for the image in form (width, height). None if it should not be resized
+            rotate: Degrees to rotate anti-clockwise by
 
-            # Cache hit. Use cached rotated image and offset to draw
+        Returns:
+            Tuple in form (the rotated image, the offset (x, y) to subtract from drawing coordinates to correct for padding from rotation)
+        """
+        # Cache hit. Use cached rotated image and offset, from this run or previous runs
+        cached_rotated_image: Optional[tuple[pygame.Surface, tuple[int, int]]] = self.__transform_cache.get(image_path, size, rotate)
+        if cached_rotated_image is not None:
+            return cached_rotated_image
+
+        if self.__disk_cache is not None:
+            cached_rotated_image = self.__disk_cache.get(image_path, size, rotate)
             if cached_rotated_image is not None:
-                image, (x_rotate_offset, y_rotate_offset) = cached_rotated_image
-                self.__screen.blit(image, (x - x_rotate_offset, y - y_rotate_offset))
-                return image
-            # Cache miss, rotate the image, draw and add to cache
-            else:
-                before_rotate_rect = image.get_rect()
-                before_rotate_width, before_rotate_height = before_rotate_rect.width, before_rotate_rect.height
+                self.__transform_cache.add(image_path, size, rotate, cached_rotated_image[0], cached_rotated_image[1])
+                return cached_rotated_image
 
-                # Rotate image
-                image = pygame.transform.rotate(image, rotate)
+        # Cache miss, rotate the image and add to cache
+        image: pygame.Surface = self.__resized_image(image_path, size)
+        before_rotate_width, before_rotate_height = image.get_size()
 
-                # Draw rotated image, offsetting for padding of image size from rotation
-                image_rect = image.get_rect()
-                x_rotate_offset, y_rotate_offset = int((image_rect.width - before_rotate_width) / 2), int((image_rect.height - before_rotate_height) / 2)
+        # Rotate image
+        image = pygame.transform.rotate(image, rotate)
 
-                self.__rotate_cache.add_cached_image(rotate, image_path, (x_rotate_offset, y_rotate_offset), image)
-                self.__screen.blit(image, (x - x_rotate_offset, y - y_rotate_offset))
-        else:
-            self.__screen.blit(image, (x, y))
+        # Offset for padding of image size from rotation
+        image_rect = image.get_rect()
+        offset: tuple[int, int] = (int((image_rect.width - before_rotate_width) / 2), int((image_rect.height - before_rotate_height) / 2))
 
-        return image
+        self.__transform_cache.add(image_path, size, rotate, image, offset)
+        if self.__disk_cache is not None:
+            self.__disk_cache.add(image_path, size, rotate, image, offset)
+        return (image, offset)
+
+    def build_texture_atlas(self, assets: Sequence[tuple[str, tuple[int, int]]]) -> None:
+        """Load, resize and pack assets into the texture atlas ahead of drawing, so that they are drawn from the atlas. Assets are packed
+        tallest first to pack them tightly. Does nothing if the texture atlas is disabled.
+
+        Args:
+            assets: The assets to pack in form (path to the asset relative to root directory, (width, height) to resize to)
+        """
+        if not TEXTURE_ATLAS:
+            return
+
+        for image_path, size in sorted(set(assets), key=lambda asset: asset[1][1], reverse=True):
+            self.__resolve_asset(image_path, 0, 0, size, 0)
+
+    def preload_assets(self, instructions: Sequence[DrawAssetInstruction]) -> None:
+        """Load and transform the assets of drawing instructions into the caches ahead of drawing them, so that drawing them later
+        does not need to. Resized assets are packed into the texture atlas first. Safe to call from a thread other than the one drawing.
+
+        Args:
+            instructions: The drawing instructions for the assets. Coordinates are ignored.
+        """
+        self.build_texture_atlas([(instruction.get_asset_path(), size) for instruction in instructions if (size := instruction.get_size()) is not None])
+
+        for instruction in instructions:
+            self.__resolve_asset(instruction.get_asset_path(), 0, 0, instruction.get_size(), instruction.get_rotation())
 
     def draw_drawable_by_assets(self, drawables: Sequence[DrawableByAsset]) -> list[pygame.Surface]:
-        """Draw assets according to the list of drawables's instructions.
+        """Draw assets according to the list of drawables's instructions. Drawables may retain their instructions between frames, which
+        are drawn as is.
 
         Args:
             drawables: The drawables that can be drawn using assets.
@@ -134,7 +264,10 @@ class PygameScreenController(metaclass=SingletonMeta):
         images: list[pygame.Surface] = []
 
         for drawable in drawables:
-            drawn_images = self.__draw_assets_from_instructions(drawable.get_draw_assets_instructions())
+            if BATCHED_BLITTING:
+                drawn_images = self.draw_assets_batched(drawable.get_draw_assets_instructions())
+            else:
+                drawn_images = self.__draw_assets_from_instructions(drawable.get_draw_assets_instructions())
             for image in drawn_images:
                 images.append(image)
 
@@ -151,13 +284,24 @@ class PygameScreenController(metaclass=SingletonMeta):
             A list of tuples of form (rectangular hitbox, object associated with hitbox)
         """
         hitboxes_map: list[tuple[pygame.Rect, ModularClickableSprite]] = []
+        instructions: list[DrawAssetInstruction] = []  # instructions to batch draw if batching
         for clickable in clickables:
             for instruction, clickable in clickable.get_draw_clickable_assets_instructions():
-                drawn_img = self.__draw_assets_from_instructions([instruction])
-                rect = drawn_img[0].get_rect()
+                if BATCHED_BLITTING:
+                    instructions.append(instruction)
+                    hitboxes_map.append((pygame.Rect(instruction.get_x_coord(), instruction.get_y_coord(), 0, 0), clickable))
+                    continue
+
+                drawn_img = self.__draw_asset_from_instruction(instruction)
+                rect = drawn_img.get_rect()
                 rect.x, rect.y = instruction.get_x_coord(), instruction.get_y_coord()
                 hitboxes_map.append((rect, clickable))
 
+        # size hitboxes to their drawn images once all are drawn in one batch
+        if BATCHED_BLITTING:
+            for (rect, _), drawn_img in zip(hitboxes_map, self.draw_assets_batched(instructions)):
+                rect.size = drawn_img.get_size()
+
         return hitboxes_map
 
     def __draw_assets_from_instructions(self, instructions: list[DrawAssetInstruction]) -> list[pygame.Surface]:
@@ -171,17 +315,27 @@ class PygameScreenController(metaclass=SingletonMeta):
         """
         images: list[pygame.Surface] = []
         for instruction in instructions:
-            image = self.draw_asset(
-                instruction.get_asset_path(),
-                instruction.get_x_coord(),
-                instruction.get_y_coord(),
-                instruction.get_size(),
-                instruction.get_rotation(),
-            )
-            images.append(image)
+            images.append(self.__draw_asset_from_instruction(instruction))
 
         return images
 
+    def __draw_asset_from_instruction(self, instruction: DrawAssetInstruction) -> pygame.Surface:
+        """Draw an asset based on an instruction.
+
+        Args:
+            instruction: The drawing instruction
+
+        Returns:
+            The image that was drawn
+        """
+        return self.draw_asset(
+            instruction.get_asset_path(),
+            instruction.get_x_coord(),
+            instruction.get_y_coord(),
+            instruction.get_size(),
+            instruction.get_rotation(),
+        )
+
     def get_screen_size(self) -> tuple[int, int]:
         """Get the screen size.
 
@@ -192,6 +346,17 @@ class PygameScreenController(metaclass=SingletonMeta):
         """
         return self.__screen.get_size()
 
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get statistics about the cache of resized and rotated images since the controller was created. Images packed into the texture
+        atlas are not part of the cache.
+
+        Returns:
+            Dictionary with keys 'hits', 'misses', 'evictions' (counts of lookups and evicted images), 'entries' (number of cached
+            images), 'bytes' and 'max_bytes' (bytes of surface data cached and allowed to be cached)
+        """
+        with self.__cache_lock:
+            return self.__transform_cache.get_stats()
+
     @staticmethod
     def instance() -> PygameScreenController:
         """Get the shared instance of this controller.
@@ -205,68 +370,101 @@ class PygameScreenController(metaclass=SingletonMeta):
         return PygameScreenController()
 
     # -------- CACHE CLASSES ----------------------------------------------------------------------------------------------------------
-    class __ImageRotateCache:
-        """Cache for storing rotated images.
+    class __TransformedImageCache:
+        """Cache for storing resized and rotated images, bounded by the bytes of surface data it holds. When adding an image would exceed
+        the bound, the least recently used images are evicted one at a time until it fits.
 
         Author: Shen
         """
 
-        __MAX_ASSET_PATH_CACHE_SIZE = 400  # Max number of entries for one asset path before purge
-
-        def __init__(self, max_size: int = 10000):
+        def __init__(self, max_bytes: int):
             """
             Args:
-                max_size: The max size the cache can reach before it is purged.
+                max_bytes: The max bytes of surface data the cache can hold
             """
-            self.__max_size: int = max_size
-            self.__size: int = 0
-            self.__cache: dict[str, dict[float, tuple[pygame.Surface, tuple[int, int]]]] = defaultdict(
-                dict
-            )  # K = Relative image path, V = dict [rotation, (cached image, offsets for drawing rotated image)]
-
-        def add_cached_image(self, rotation: float, asset_path: str, offset: tuple[int, int], rotated_image: pygame.Surface) -> None:
-            """Add the cached image for the cache only if the image at the specified rotation has not been cached.
-            Otherwise does nothing.
+            self.__max_bytes: int = max_bytes
+            self.__bytes: int = 0
+            self.__cache: OrderedDict[tuple[str, Optional[tuple[int, int]], float], tuple[pygame.Surface, tuple[int, int]]] = (
+                OrderedDict()
+            )  # K = (relative image path, (width, height) or None if not resized, rotation), V = (cached image, offsets for drawing image). Least recently used first
+            self.__hits: int = 0
+            self.__misses: int = 0
+            self.__evictions: int = 0
+
+        def add(self, asset_path: str, size: Optional[tuple[int, int]], rotation: float, image: pygame.Surface, offset: tuple[int, int]) -> None:
+            """Add the transformed image to the cache as the most recently used, only if it has not been cached. Otherwise does nothing.
+            Images larger than the cache's bound are not cached.
 
             Args:
-                rotation: The rotation value for the image
                 asset_path: The relative asset path for the image
-                offset: The offset for coordinates (x, y) used to correct the rotation of the image
-                rotated_image: The rotated image
+                size (optional): The size the image was resized to in form (width, height), or None if it was not resized
+                rotation: The rotation value for the image
+                image: The transformed image
+                offset: The offset for coordinates (x, y) used to correct the drawing position of the image
             """
-            rot_modded: float = round(rotation, 1) % 360
-            cache_for_asset_path = self.__cache[asset_path]
+            key = (asset_path, size, round(rotation, 1) % 360)
+            image_bytes: int = self.__surface_bytes(image)
+
+            if key in self.__cache or image_bytes > self.__max_bytes:
+                return
 
-            if rot_modded not in cache_for_asset_path:
-                if len(cache_for_asset_path) > self.__MAX_ASSET_PATH_CACHE_SIZE:
-                    # purge cache for asset path if size limit for asset path cache is exceeded
-                    self.__cache[asset_path] = dict()
-                if self.__size + 1 > self.__max_size:
-                    # purge entire cache if max size exceeded
-                    self.__cache = defaultdict(dict)
-                    self.__size = 0
+            # evict least recently used images until the image fits
+            while self.__bytes + image_bytes > self.__max_bytes:
+                _, (evicted_image, _) = self.__cache.popitem(last=False)
+                self.__bytes -= self.__surface_bytes(evicted_image)
+                self.__evictions += 1
 
-                self.__cache[asset_path][rot_modded] = (rotated_image, offset)
-                self.__size += 1
+            self.__cache[key] = (image, offset)
+            self.__bytes += image_bytes
 
-        def get_cached_image(self, rotation: float, asset_path: str) -> Optional[tuple[pygame.Surface, tuple[int, int]]]:
-            """Returns the cached image for the specified rotation and asset path if it exists.
+        def get(self, asset_path: str, size: Optional[tuple[int, int]], rotation: float) -> Optional[tuple[pygame.Surface, tuple[int, int]]]:
+            """Returns the cached transformed image if it exists, marking it as the most recently used.
 
             Args:
-                rotation: The rotation value
                 asset_path: The relative asset path for the image
+                size (optional): The size the image was resized to in form (width, height), or None if it was not resized
+                rotation: The rotation value for the image
 
             Returns
-                Tuple in form (The cached image, The offset for coordinates (x, y) used to correct the rotation of the image) if it exists.
+                Tuple in form (The cached image, The offset for coordinates (x, y) used to correct the drawing position of the image) if it exists.
+            """
+            key = (asset_path, size, round(rotation, 1) % 360)
+            cached = self.__cache.get(key)
+
+            if cached is None:
+                self.__misses += 1
+                return None
+
+            self.__hits += 1
+            self.__cache.move_to_end(key)
+            return cached
+
+        def get_stats(self) -> dict[str, int]:
+            """Get statistics about the cache since it was created.
+
+            Returns:
+                Dictionary with keys 'hits', 'misses', 'evictions', 'entries', 'bytes' and 'max_bytes'
+            """
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "entries": len(self.__cache),
+                "bytes": self.__bytes,
+                "max_bytes": self.__max_bytes,
+            }
+
+        @staticmethod
+        def __surface_bytes(surface: pygame.Surface) -> int:
+            """Get the bytes of pixel data held by a surface.
+
+            Args:
+                surface: The surface
+
+            Returns:
+                The bytes of pixel data
             """
-            rot_modded: float = round(rotation, 1) % 360
-
-            if asset_path in self.__cache:
-                cache_for_asset_path: dict[float, tuple[pygame.Surface, tuple[int, int]]] = self.__cache[asset_path]
-                if rot_modded in cache_for_asset_path:
-                    image, offset = cache_for_asset_path[rot_modded]
-                    return (image, offset)
-            return None
+            return surface.get_pitch() * surface.get_height()
 
 
 # NOTES
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import Optional
+from definitions import ROOT_PATH
+
+import hashlib
+import os
+import struct
+import pygame
+
+
+class SurfaceDiskCache:
+    """Cache for storing resized and rotated images on disk between runs, so that images do not need to be transformed again on the
+    next run. Images are stored as raw RGBA pixels, one file per image, keyed by the asset path, the modification time of the asset
+    file, the size and rotation. Editing an asset therefore never loads a stale image.
+
+    Warning: Pygame and its display must be initialised through pygame.init() and pygame.display.set_mode() before loading images.
+
+    Author: Shen
+    """
+
+    __HEADER_FORMAT: str = "<4i"  # header of a cache file: width, height, x offset, y offset. Followed by the RGBA pixels
+    __FILE_EXTENSION: str = "rgba"
+
+    def __init__(self, cache_path: str):
+        """
+        Args:
+            cache_path: The directory path relative to the root of the project to store the cache files in
+        """
+        self.__cache_directory_path: str = f"{ROOT_PATH}/{cache_path}"
+
+    def get(self, asset_path: str, size: Optional[tuple[int, int]], rotation: float) -> Optional[tuple[pygame.Surface, tuple[int, int]]]:
+        """Load the transformed image from the cache if it exists and was transformed from the current version of the asset.
+
+        Args:
+            asset_path: The path to the asset relative to the root of the project
+            size (optional): The size the image was resized to in form (width, height), or None if it was not resized
+            rotation: The rotation value for the image
+
+        Returns:
+            Tuple in form (The cached image in alpha form, The offset for coordinates (x, y) used to correct the drawing position of the
+            image) if it exists.
+        """
+        cache_file_path: Optional[str] = self.__cache_file_path(asset_path, size, rotation)
+        if cache_file_path is None or not os.path.isfile(cache_file_path):
+            return None
+
+        try:
+            with open(cache_file_path, "rb") as fp:
+                data: bytes = fp.read()
+
+            header_size: int = struct.calcsize(SurfaceDiskCache.__HEADER_FORMAT)
+            width, height, x_offset, y_offset = struct.unpack_from(SurfaceDiskCache.__HEADER_FORMAT, data)
+            pixels: memoryview = memoryview(data)[header_size:]
+            if len(pixels) != width * height * 4:
+                return None
+
+            image: pygame.Surface = pygame.image.frombuffer(pixels, (width, height), "RGBA").convert_alpha()
+            return (image, (x_offset, y_offset))
+        except (OSError, struct.error, ValueError, pygame.error):
+            # treat unreadable or partially written files as missing
+            return None
+
+    def add(self, asset_path: str, size: Optional[tuple[int, int]], rotation: float, image: pygame.Surface, offset: tuple[int, int]) -> None:
+        """Store the transformed image in the cache, whilst creating any directories that don't exist. Does nothing if the cache could
+        not be written to.
+
+        Args:
+            asset_path: The path to the asset relative to the root of the project
+            size (optional): The size the image was resized to in form (width, height), or None if it was not resized
+            rotation: The rotation value for the image
+            image: The transformed image
+            offset: The offset for coordinates (x, y) used to correct the drawing position of the image
+        """
+        cache_file_path: Optional[str] = self.__cache_file_path(asset_path, size, rotation)
+        if cache_file_path is None:
+            return
+
+        width, height = image.get_size()
+        header: bytes = struct.pack(SurfaceDiskCache.__HEADER_FORMAT, width, height, offset[0], offset[1])
+
+        # write to a temporary file first so a partially written file is never read
+        temp_file_path: str = f"{cache_file_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.__cache_directory_path, exist_ok=True)
+            with open(temp_file_path, "wb") as fp:
+                fp.write(header)
+                fp.write(pygame.image.tobytes(image, "RGBA"))
+            os.replace(temp_file_path, cache_file_path)
+        except OSError:
+            return
+
+    def __cache_file_path(self, asset_path: str, size: Optional[tuple[int, int]], rotation: float) -> Optional[str]:
+        """Get the path of the cache file for a transformed image of the current version of an asset.
+
+        Args:
+            asset_path: The path to the asset relative to the root of the project
+            size (optional): The size the image was resized to in form (width, height), or None if it was not resized
+            rotation: The rotation value for the image
+
+        Returns:
+            The absolute path of the cache file, or None if the asset does not exist
+        """
+        try:
+            modified_time: int = os.stat(f"{ROOT_PATH}/{asset_path}").st_mtime_ns
+        except OSError:
+            return None
+
+        key: str = f"{asset_path}|{modified_time}|{size}|{round(rotation, 1) % 360}"
+        return f"{self.__cache_directory_path}/{hashlib.sha1(key.encode()).hexdigest()}.{SurfaceDiskCache.__FILE_EXTENSION}"
@@ -0,0 +1,117 @@
+from typing import Hashable, Optional
+
+import pygame
+
+
+class TextureAtlas:
+    """Packs images into a few large surfaces (pages), and serves the packed images as subsurfaces of those pages. Images are packed
+    using rows (shelves) along each page, and remain packed for the lifetime of the atlas.
+
+    Warning: Pygame and its display must be initialised before adding images.
+
+    Author: Shen
+    """
+
+    def __init__(self, page_size: int = 2048, max_pages: int = 4):
+        """
+        Args:
+            page_size: The width and height of each page in pixels
+            max_pages: The maximum number of pages that can be created before the atlas is full
+        """
+        self.__page_size: int = page_size
+        self.__max_pages: int = max_pages
+        self.__pages: list[pygame.Surface] = []
+        self.__shelves: list[list[list[int]]] = []  # for each page, the shelves as [y, height, next free x]
+        self.__next_shelf_y: list[int] = []  # for each page, the y coordinate where the next shelf starts
+        self.__packed: dict[Hashable, pygame.Surface] = dict()  # K = key of image, V = subsurface of packed image
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Get a packed image if it exists.
+
+        Args:
+            key: The key the image was packed with
+
+        Returns:
+            The packed image as a subsurface of a page of the atlas
+        """
+        return self.__packed.get(key)
+
+    def add(self, key: Hashable, image: pygame.Surface) -> Optional[pygame.Surface]:
+        """Pack an image into the atlas. If an image was already packed with the key, the existing packed image is returned instead.
+
+        Args:
+            key: The key to pack the image with
+            image: The image to pack
+
+        Returns:
+            The packed image as a subsurface of a page of the atlas, or None if the image could not fit within the atlas.
+        """
+        if key in self.__packed:
+            return self.__packed[key]
+
+        width, height = image.get_size()
+        if width > self.__page_size or height > self.__page_size:
+            return None
+
+        position: Optional[tuple[int, int, int]] = self.__allocate(width, height)
+        if position is None:
+            return None
+
+        # copy pixels exactly (including alpha) onto the empty region of the page
+        page_i, x, y = position
+        page: pygame.Surface = self.__pages[page_i]
+        page.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+
+        packed: pygame.Surface = page.subsurface(pygame.Rect(x, y, width, height))
+        self.__packed[key] = packed
+        return packed
+
+    def get_page_count(self) -> int:
+        """Get the number of pages created by the atlas.
+
+        Returns:
+            The number of pages
+        """
+        return len(self.__pages)
+
+    def __allocate(self, width: int, height: int) -> Optional[tuple[int, int, int]]:
+        """Find free space for an image with the specified size, creating a new page if required.
+
+        Args:
+            width: The width of the image
+            height: The height of the image
+
+        Returns:
+            Tuple in form (page index, x, y) of the free space, or None if there was no free space.
+        """
+        for page_i in range(len(self.__pages)):
+            # use the existing shelf which wastes the least height
+            best_shelf: Optional[list[int]] = None
+            for shelf in self.__shelves[page_i]:
+                shelf_y, shelf_height, shelf_x = shelf
+                if height <= shelf_height and shelf_x + width <= self.__page_size:
+                    if best_shelf is None or shelf_height < best_shelf[1]:
+                        best_shelf = shelf
+
+            if best_shelf is not None:
+                x = best_shelf[2]
+                best_shelf[2] += width
+                return (page_i, x, best_shelf[0])
+
+            # otherwise start a new shelf on the page if there is room
+            if self.__next_shelf_y[page_i] + height <= self.__page_size:
+                y = self.__next_shelf_y[page_i]
+                self.__shelves[page_i].append([y, height, width])
+                self.__next_shelf_y[page_i] += height
+                return (page_i, 0, y)
+
+        if len(self.__pages) >= self.__max_pages:
+            return None
+
+        # start a new page
+        page: pygame.Surface = pygame.Surface((self.__page_size, self.__page_size), pygame.SRCALPHA).convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.__pages.append(page)
+        self.__shelves.append([[0, height, width]])
+        self.__next_shelf_y.append(height)
+        return (len(self.__pages) - 1, 0, 0)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 from screen.PygameScreenController import PygameScreenController
-from settings import FRAMES_PER_SECOND
+from settings import FRAMES_PER_SECOND, ADAPTIVE_FRAME_RATE, IDLE_DELAY
 from screen.ui.buttons.Button import Button
 from screen.DrawProperties import DrawProperties
+from screen.DrawAssetInstruction import DrawAssetInstruction
 from screen.ModularClickableSprite import ModularClickableSprite
+from screen.HitTestGrid import HitTestGrid
 from commands.saving.SaveCommand import SaveCommand
 from codec.saves.SaveCodec import SaveCodec
 from screen.ui.buttons.ButtonType import ButtonType
@@ -49,15 +51,20 @@ class Menu:
 
         #### GAME LOOP
         running = True
+        idle_time: float = 0  # seconds since the last event
+        hit_test_grid: HitTestGrid = HitTestGrid([])  # index of the hitboxes of the buttons, rebuilt when they change
         while running:
 
             # Handle Drawing
             PygameScreenController.instance().fill_screen_with_colour((0, 0, 0))
             self.__display_title()
             clickable_hitboxes = PygameScreenController.instance().draw_modular_clickable_sprites(self.__clickables)
+            if not hit_test_grid.is_for(clickable_hitboxes):
+                hit_test_grid = HitTestGrid(clickable_hitboxes)
 
             # Handle Events
-            for event in pygame.event.get():
+            events: list[pygame.event.Event] = pygame.event.get()
+            for event in events:
                 match event.type:
                     # handle when X pressed on window
                     case pygame.QUIT:
@@ -67,26 +74,49 @@ class Menu:
                     # handle mouse click
                     # >>>>> Kinda hacky (evidence: switch cases). If more time, would've created new FieryDragon class to manage GameWorld instances, menu, etc. And load, new game commands passed to buttons would act through the FieryDragon class. GameWorld would also no longer be singleton. - Shen
                     case pygame.MOUSEBUTTONDOWN:
-                        clickedSprite: Optional[ModularClickableSprite] = self.__fire_onclick_for_clicked_hitboxes(clickable_hitboxes)
+                        clickedSprite: Optional[ModularClickableSprite] = self.__fire_onclick_for_clicked_sprite(hit_test_grid, event.pos)
 
                         if clickedSprite is not None:
                             if clickedSprite == self.__new_game_button:
                                 return ButtonType.NEW_GAME
                             return ButtonType.CONTINUE
 
-            # Update screen & Set FPS
+            # Update screen & Set FPS. The menu doesn't change by itself, so once idle, sleep until the next event instead
             pygame.display.flip()  # update screen
-            clock.tick(FRAMES_PER_SECOND)
+            idle_time = 0 if len(events) > 0 else idle_time + clock.get_time() / 1000
+            if ADAPTIVE_FRAME_RATE and idle_time >= IDLE_DELAY:
+                pygame.event.post(pygame.event.wait())  # left for the next frame to handle
+                clock.tick()
+            else:
+                clock.tick(FRAMES_PER_SECOND)
 
         # Quit game if quitting by pygame.QUIT
         pygame.quit()
 
+    @staticmethod
+    def get_asset_manifest(screen_size: tuple[int, int], show_continue_button: bool) -> list[DrawAssetInstruction]:
+        """Get the instructions for drawing every asset the menu draws for a screen size, used to load and transform the assets ahead
+        of showing the menu.
+
+        Args:
+            screen_size: The size of the screen the menu is shown on in form (width, height)
+            show_continue_button: Whether the continue button is shown
+
+        Returns:
+            The drawing instructions
+        """
+        instructions: list[DrawAssetInstruction] = [Menu.__title_draw_instruction(screen_size)]
+        instructions.append(DrawAssetInstruction("assets/menu/new_game.png", 0, 0, Menu.__menu_button_size(screen_size)))
+        if show_continue_button:
+            instructions.append(DrawAssetInstruction("assets/menu/continue.png", 0, 0, Menu.__menu_button_size(screen_size)))
+        return instructions
+
     def __create_menu_button(self) -> None:
         """
         create buttons object of the menu
         """
         screen_size: tuple[int, int] = PygameScreenController.instance().get_screen_size()
-        menu_button_size: tuple[int, int] = (screen_size[0] // 2, screen_size[1] // 5)
+        menu_button_size: tuple[int, int] = Menu.__menu_button_size(screen_size)
 
         # creating new game button
         new_game_button: Button = Button(
@@ -119,22 +149,35 @@ class Menu:
         """
         display the title of the game
         """
-        screen_size: tuple[int, int] = PygameScreenController.instance().get_screen_size()
+        title = Menu.__title_draw_instruction(PygameScreenController.instance().get_screen_size())
+        PygameScreenController.instance().draw_asset(title.get_asset_path(), title.get_x_coord(), title.get_y_coord(), title.get_size())
+
+    @staticmethod
+    def __title_draw_instruction(screen_size: tuple[int, int]) -> DrawAssetInstruction:
+        """
+        get the instruction to draw the title of the game, which is at the top middle of the screen
+        """
         title_size: tuple[int, int] = (screen_size[0] // 2, screen_size[1] // 4)
-        PygameScreenController.instance().draw_asset("assets/menu/title.png", screen_size[0] // 2 - title_size[0] // 2, 0, (title_size[0], title_size[1]))
+        return DrawAssetInstruction("assets/menu/title.png", screen_size[0] // 2 - title_size[0] // 2, 0, (title_size[0], title_size[1]))
+
+    @staticmethod
+    def __menu_button_size(screen_size: tuple[int, int]) -> tuple[int, int]:
+        """
+        get the size of the menu buttons in form (width, height)
+        """
+        return (screen_size[0] // 2, screen_size[1] // 5)
 
-    def __fire_onclick_for_clicked_hitboxes(self, hitboxes: list[tuple[pygame.Rect, ModularClickableSprite]]) -> Optional[ModularClickableSprite]:
-        """Fires on_click() for any objects containing hitboxes under the user's current cursor position.
+    def __fire_onclick_for_clicked_sprite(self, hit_test_grid: HitTestGrid, position: tuple[int, int]) -> Optional[ModularClickableSprite]:
+        """Fires on_click() for the topmost clickable sprite under the position clicked if any.
 
         Args:
-            hitboxes: A list of tuples of form (rectangular hitbox, object associated with hitbox)
+            hit_test_grid: The index of the hitboxes of the drawn buttons
+            position: The position clicked in form (x, y)
 
         Returns:
             The sprite clicked if any
         """
-        for rect, clickable in hitboxes:
-            pos = pygame.mouse.get_pos()
-            if rect.collidepoint(pos):
-                clickable.on_click(None)
-                return clickable
-        return None
+        clickable: Optional[ModularClickableSprite] = hit_test_grid.get_topmost_at(position)
+        if clickable is not None:
+            clickable.on_click(None)
+        return clickable
@@ -2,9 +2,12 @@ from typing import Optional
 from screen.ModularClickableSprite import ModularClickableSprite
 from screen.DrawProperties import DrawProperties
 from screen.DrawAssetInstruction import DrawAssetInstruction
+from screen.DirtyRectTracker import DirtyRectTracker
 from game_objects.characters.PlayableCharacter import PlayableCharacter
 from commands.Command import Command
 
+import pygame
+
 
 class Button(ModularClickableSprite):
     """A class that represents the buttons other than game_objects.
@@ -22,6 +25,8 @@ class Button(ModularClickableSprite):
         self.__asset_path = asset_path
         self.__command: Optional[Command] = command
         self._draw_properties: Optional[DrawProperties] = draw_properties
+        self.__dirty_rect_tracker: DirtyRectTracker = DirtyRectTracker()
+        self.__draw_instructions: Optional[list[tuple[DrawAssetInstruction, ModularClickableSprite]]] = None  # retained, None when they must be rebuilt
 
     def set_draw_properties(self, draw_properties: DrawProperties) -> None:
         """Set how the button should be drawn.
@@ -29,10 +34,20 @@ class Button(ModularClickableSprite):
         Args:
             draw_properties: The draw properties
         """
+        if self.__dirty_rect_tracker.mark_draw_properties_change(self._draw_properties, draw_properties):
+            self.__draw_instructions = None
         self._draw_properties = draw_properties
 
+    def consume_dirty_rects(self) -> list[pygame.Rect]:
+        """Get the areas of the screen invalidated by changes to the button since the last call, and stop tracking them.
+
+        Returns:
+            The invalidated areas of the screen
+        """
+        return self.__dirty_rect_tracker.consume()
+
     def get_draw_clickable_assets_instructions(self) -> list[tuple[DrawAssetInstruction, ModularClickableSprite]]:
-        """Get the instructions required to draw the button
+        """Get the instructions required to draw the button. The instructions are kept between frames until the draw properties change.
 
         Returns:
             A list containing tuples in the form of (drawing instruction, object to return when clicking on
@@ -43,7 +58,9 @@ class Button(ModularClickableSprite):
         """
         if self._draw_properties is None:
             raise Exception("Tried drawing, but the draw properties (properties required for drawing) weren't set.")
-        return self._on_draw_request(self._draw_properties)
+        if self.__draw_instructions is None:
+            self.__draw_instructions = self._on_draw_request(self._draw_properties)
+        return self.__draw_instructions
 
     def _on_draw_request(self, draw_properties: DrawProperties) -> list[tuple[DrawAssetInstruction, ModularClickableSprite]]:
         """On draw request, returns instructions to draw a button that displays based on the type of button
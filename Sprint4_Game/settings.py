@@ -11,8 +11,74 @@ REQUESTED_SCREEN_SIZE = 1900
 # Screen background colour in (R, G, B)
 SCREEN_BACKGROUND_COLOUR = (255, 255, 255)
 
+# DIRTY_RECT_RENDERING
+# Whether the game should only redraw and update the areas of the screen that changed since the last frame. Set to False to
+# redraw and update the entire screen every frame
+DIRTY_RECT_RENDERING = True
+
+# BATCHED_BLITTING
+# Whether assets should be drawn in batches, resolving each frame's images first then drawing them to the screen at once. Set to False to
+# draw assets one at a time
+BATCHED_BLITTING = True
+
+# TEXTURE_ATLAS
+# Whether resized assets should be packed into a few large surfaces (a texture atlas) and drawn from there. Set to False to keep each
+# resized asset as a separate surface
+TEXTURE_ATLAS = True
+
+# DISK_SURFACE_CACHE
+# Whether resized and rotated assets should be stored on disk, so that later runs load them instead of resizing and rotating them again.
+# Set to False to transform assets on every run
+DISK_SURFACE_CACHE = True
+
+# DISK_SURFACE_CACHE_DIRECTORY
+# The directory relative to the root project to store resized and rotated assets in. Safe to delete
+DISK_SURFACE_CACHE_DIRECTORY = ".cache/surfaces"
+
+# ASSET_WARMUP
+# Whether every asset the menu and game board draw should be loaded and resized/rotated before showing the menu, so that the first frames
+# of the menu and game do not stall
+ASSET_WARMUP = True
+
+# ASSET_WARMUP_IN_BACKGROUND
+# Whether the game board's assets should be warmed up in the background whilst the menu is shown, instead of before showing the menu.
+# Only applies if ASSET_WARMUP is True
+ASSET_WARMUP_IN_BACKGROUND = True
+
 # ===== GAME ============================================================================================================================
 
 # FRAMES_PER_SECOND
 # Target frames per second the game should run at
 FRAMES_PER_SECOND = 60  # FPS the game should run at
+
+# ADAPTIVE_FRAME_RATE
+# Whether the game and menu should stop redrawing at FRAMES_PER_SECOND once idle, which is when there has been no input or turn change for
+# IDLE_DELAY seconds. Whilst idle, the loop sleeps until the next event, scheduled action or animation frame. Saves power and CPU on displays
+# left unattended
+ADAPTIVE_FRAME_RATE = True
+
+# IDLE_DELAY
+# Seconds without input or turn changes after which the game is idle. Only applies if ADAPTIVE_FRAME_RATE is True
+IDLE_DELAY = 3.0
+
+# IDLE_FRAMES_PER_SECOND
+# Target frames per second whilst idle and an animation is playing (e.g the current player's dragon spinning). Animations play slower
+# whilst idle. Only applies if ADAPTIVE_FRAME_RATE is True
+IDLE_FRAMES_PER_SECOND = 15
+
+# FRAME_PROFILER
+# Whether to measure the time spent in each stage of every frame of the game (e.g drawing, handling events, updating the screen)
+FRAME_PROFILER = False
+
+# FRAME_PROFILER_WINDOW
+# The number of most recent frames the frame profiler computes percentiles over. Only applies if FRAME_PROFILER is True
+FRAME_PROFILER_WINDOW = 600
+
+# FRAME_PROFILER_OVERLAY
+# Whether to show the frame profiler's percentiles for each stage at the top left of the screen. Only applies if FRAME_PROFILER is True
+FRAME_PROFILER_OVERLAY = True
+
+# FRAME_PROFILER_TRACE_PATH
+# The path relative to the root of the project to write the time spent in each stage of every frame to when the game closes, as CSV if
+# it ends in .csv, otherwise JSON. None to not write a trace. Only applies if FRAME_PROFILER is True
+FRAME_PROFILER_TRACE_PATH = None
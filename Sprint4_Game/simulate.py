@@ -0,0 +1,206 @@
+"""Entry point for simulating games without a screen, for balancing game configurations.
+
+Plays games of the arcade configuration with randomly chosen chit cards, for every combination of the chit card counts given, across
+all CPU cores. Reports the win rate of each seat (in turn order), the average game length in turns and, for each kind of chit card, the
+win rate of players who flipped it (compare against 1 / seats).
+
+With --vectorised, each batch of games is played all at once as NumPy arrays, which is much faster for large batches.
+
+Example:
+    python simulate.py --games 100000 --pirate 2 4 6 --skip 0 2 --swap 0 2 --random-starts
+    python simulate.py --games 1000000 --vectorised --batch-size 20000
+"""
+
+from codec.saves.JSONSaveCodec import JSONSaveCodec
+from game_configurations.ArcadeGameConfiguration import ArcadeGameConfiguration
+from core.HeadlessGameEngine import HeadlessGameEngine
+from game_objects.characters.PlayableCharacter import PlayableCharacter
+from game_objects.chit_cards.ChitCard import ChitCard
+from game_objects.chit_cards.PirateChitCard import PirateChitCard
+from game_objects.chit_cards.PowerChitCard import PowerChitCard
+from game_concepts.powers.SkipTurnPower import SkipTurnPower
+from game_concepts.powers.SwapPower import SwapPower
+from simulation.SimulationStats import SimulationStats
+from simulation.VectorisedGameBoards import VectorisedGameBoards
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Optional
+
+import argparse
+import itertools
+import numpy as np
+import os
+import random
+import time
+
+# ----- CONFIGURATION VARIABLES --------------------------------------------------------------------------------------
+# SEAT_COUNT
+# The number of players in a game of the arcade configuration
+SEAT_COUNT: int = 4
+
+# SAVE_DIRECTORY
+# The save directory the configuration is given. Simulated games are never saved
+SAVE_DIRECTORY: str = "saves"
+
+# VECTORISED_CHIT_CARD_KINDS
+# The kinds of chit cards whose impact on winning is measured, as named by chit_card_kind(), for vectorised game boards
+VECTORISED_CHIT_CARD_KINDS: dict[int, str] = {
+    VectorisedGameBoards.CHIT_CARD_PIRATE: "pirate",
+    VectorisedGameBoards.CHIT_CARD_SKIP: "skip",
+    VectorisedGameBoards.CHIT_CARD_SWAP: "swap",
+}
+
+
+def chit_card_kind(chit_card: ChitCard) -> Optional[str]:
+    """Get the kind of a chit card whose impact on winning is measured.
+
+    Args:
+        chit_card: The chit card
+
+    Returns:
+        'pirate', 'skip' or 'swap', or None for animal chit cards
+    """
+    if isinstance(chit_card, PirateChitCard):
+        return "pirate"
+    if isinstance(chit_card, PowerChitCard):
+        if isinstance(chit_card.get_power(), SkipTurnPower):
+            return "skip"
+        if isinstance(chit_card.get_power(), SwapPower):
+            return "swap"
+    return None
+
+
+def simulate_games(chit_card_counts: tuple[int, int, int], game_count: int, seed: int, random_starts: bool, max_turns: int) -> SimulationStats:
+    """Simulate games of the arcade configuration where every player flips randomly chosen chit cards.
+
+    Args:
+        chit_card_counts: The number of chit cards of each kind in form (pirate, skip, swap)
+        game_count: The number of games to simulate
+        seed: The seed for the games. The same seed always simulates the same games
+        random_starts: Whether the starting tiles are placed at random positions instead of the default positions
+        max_turns: The number of turns after which a game is stopped if no player has won
+
+    Returns:
+        The statistics of the simulated games
+    """
+    pirate_count, skip_count, swap_count = chit_card_counts
+    rng: random.Random = random.Random(seed)
+    stats: SimulationStats = SimulationStats(SEAT_COUNT)
+
+    for _ in range(game_count):
+        starting_tile_positions: Optional[list[int]] = sorted(rng.sample(range(ArcadeGameConfiguration.GEN_MAIN_TILE_COUNT), SEAT_COUNT)) if random_starts else None
+        engine: HeadlessGameEngine = ArcadeGameConfiguration(
+            JSONSaveCodec(SAVE_DIRECTORY), pirate_count, skip_count, swap_count, starting_tile_positions, seed=rng.randrange(2**32)
+        ).generate_headless_game()
+
+        seats: dict[PlayableCharacter, int] = {character: i for i, character in enumerate(engine.get_playable_characters())}
+        kinds: list[Optional[str]] = [chit_card_kind(chit_card) for chit_card in engine.get_chit_cards()]
+        kind_flipper_seats: dict[str, set[int]] = {kind: set() for kind in kinds if kind is not None}
+
+        # every player flips random chit cards until a player wins
+        try:
+            while not engine.is_game_over() and engine.get_turn_count() < max_turns:
+                i: int = rng.choice(engine.get_unflipped_chit_card_indexes())
+                kind: Optional[str] = kinds[i]
+                if kind is not None:
+                    kind_flipper_seats[kind].add(seats[engine.get_currently_playing_character()])
+                engine.flip_chit_card(i)
+        finally:
+            engine.close()
+
+        winner: Optional[PlayableCharacter] = engine.get_winner()
+        stats.record_game(seats[winner] if winner is not None else None, engine.get_turn_count(), kind_flipper_seats)
+
+    return stats
+
+
+def simulate_vectorised_games(chit_card_counts: tuple[int, int, int], game_count: int, seed: int, random_starts: bool, max_turns: int) -> SimulationStats:
+    """Simulate games of the arcade configuration where every player flips randomly chosen chit cards, playing all games at once as
+    vectorised game boards. Follows the same rules as simulate_games(), but does not simulate the same games for a seed.
+
+    Args:
+        chit_card_counts: The number of chit cards of each kind in form (pirate, skip, swap)
+        game_count: The number of games to simulate
+        seed: The seed for the games. The same seed always simulates the same games
+        random_starts: Whether the starting tiles are placed at random positions instead of the default positions
+        max_turns: The number of turns after which a game is stopped if no player has won
+
+    Returns:
+        The statistics of the simulated games
+    """
+    pirate_count, skip_count, swap_count = chit_card_counts
+    stats: SimulationStats = SimulationStats(SEAT_COUNT)
+
+    game_boards: VectorisedGameBoards = ArcadeGameConfiguration(
+        JSONSaveCodec(SAVE_DIRECTORY), pirate_count, skip_count, swap_count, seed=seed
+    ).generate_vectorised_game_boards(game_count, random_starts)
+    winners: np.ndarray = game_boards.play_random_games(np.random.default_rng(seed), max_turns)
+    turn_counts: np.ndarray = game_boards.get_turn_counts()
+    chit_card_kind_flippers: np.ndarray = game_boards.get_chit_card_kind_flippers()
+
+    # only measure kinds of chit cards that are in the games, like simulate_games()
+    kind_counts: dict[int, int] = {
+        VectorisedGameBoards.CHIT_CARD_PIRATE: pirate_count,
+        VectorisedGameBoards.CHIT_CARD_SKIP: skip_count,
+        VectorisedGameBoards.CHIT_CARD_SWAP: swap_count,
+    }
+    kinds: dict[int, str] = {kind: name for kind, name in VECTORISED_CHIT_CARD_KINDS.items() if kind_counts[kind] > 0}
+
+    for i in range(game_count):
+        winner: Optional[int] = int(winners[i]) if winners[i] != VectorisedGameBoards.NO_WINNER else None
+        kind_flipper_seats: dict[str, set[int]] = {name: set(np.nonzero(chit_card_kind_flippers[i, :, kind])[0].tolist()) for kind, name in kinds.items()}
+        stats.record_game(winner, int(turn_counts[i]), kind_flipper_seats)
+
+    return stats
+
+
+if __name__ == "__main__":
+    # ----- ARGUMENTS -------------------------------------------------------------------------------------------------
+    parser = argparse.ArgumentParser(description="Simulate games of the arcade configuration across all CPU cores to balance it.")
+    parser.add_argument("--games", type=int, default=10000, help="number of games to simulate for each combination of chit card counts")
+    parser.add_argument("--pirate", type=int, nargs="+", default=[4], help="dragon pirate chit card counts to try")
+    parser.add_argument("--skip", type=int, nargs="+", default=[2], help="skip chit card counts to try")
+    parser.add_argument("--swap", type=int, nargs="+", default=[2], help="swap chit card counts to try")
+    parser.add_argument("--random-starts", action="store_true", help="place starting tiles at random positions in every game")
+    parser.add_argument("--max-turns", type=int, default=5000, help="turns after which a game is stopped if no player has won")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of processes to simulate games in (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=500, help="number of games each process simulates at a time")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the simulation. The same seed always simulates the same games")
+    parser.add_argument("--vectorised", action="store_true", help="play each batch of games all at once with NumPy. Use large batch sizes")
+    args = parser.parse_args()
+
+    # ----- SIMULATION --------------------------------------------------------------------------------------------------
+    # Split the games for each combination of chit card counts into batches, each simulated with its own seed
+    chit_card_count_combinations: list[tuple[int, int, int]] = list(itertools.product(args.pirate, args.skip, args.swap))
+    start_time: float = time.perf_counter()
+    batch_i: int = 0
+    simulate = simulate_vectorised_games if args.vectorised else simulate_games
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures: dict[tuple[int, int, int], list[Future[SimulationStats]]] = dict()
+
+        for chit_card_counts in chit_card_count_combinations:
+            futures[chit_card_counts] = []
+            for batch_start in range(0, args.games, args.batch_size):
+                batch_game_count: int = min(args.batch_size, args.games - batch_start)
+                futures[chit_card_counts].append(
+                    executor.submit(simulate, chit_card_counts, batch_game_count, args.seed * 1_000_000 + batch_i, args.random_starts, args.max_turns)
+                )
+                batch_i += 1
+
+        # ----- REPORT --------------------------------------------------------------------------------------------------
+        for chit_card_counts, batch_futures in futures.items():
+            stats: SimulationStats = SimulationStats(SEAT_COUNT)
+            for future in batch_futures:
+                stats.merge(future.result())
+
+            seat_win_rates: str = " ".join(f"{rate * 100:5.1f}" for rate in stats.get_seat_win_rates())
+            kind_win_rates: str = " ".join(f"{kind} {rate * 100:.1f}" for kind, rate in sorted(stats.get_chit_card_kind_win_rates().items()))
+            print(
+                f"pirate={chit_card_counts[0]} skip={chit_card_counts[1]} swap={chit_card_counts[2]} | "
+                f"games {stats.get_game_count()} ({stats.get_unfinished_game_count()} unfinished) | "
+                f"avg turns {stats.get_average_turns():.1f} | seat win % {seat_win_rates} | win % when flipped: {kind_win_rates}"
+            )
+
+    elapsed: float = time.perf_counter() - start_time
+    total_games: int = args.games * len(chit_card_count_combinations)
+    print(f"Simulated {total_games} games in {elapsed:.1f}s ({total_games / elapsed:.0f} games/s) with {args.workers} processes")
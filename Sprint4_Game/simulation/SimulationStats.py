@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Optional
+
+
+class SimulationStats:
+    """Statistics collected from simulating games of one configuration. Statistics from separate batches of games can be merged,
+    e.g when batches are simulated in separate processes.
+
+    Author: Shen
+    """
+
+    def __init__(self, seat_count: int):
+        """
+        Args:
+            seat_count: The number of players (seats) in each game, in turn order
+        """
+        self.__seat_count: int = seat_count
+        self.__games: int = 0
+        self.__unfinished_games: int = 0  # games stopped before anyone won
+        self.__seat_wins: list[int] = [0] * seat_count
+        self.__total_turns: int = 0  # turns across finished games
+        self.__chit_card_kind_flippers: dict[str, int] = dict()  # K = chit card kind, V = number of players who flipped the kind in a game
+        self.__chit_card_kind_flipper_wins: dict[str, int] = dict()  # K = chit card kind, V = number of those players who won the game
+
+    def record_game(self, winner_seat: Optional[int], turns: int, chit_card_kind_flipper_seats: dict[str, set[int]]) -> None:
+        """Record the outcome of a game.
+
+        Args:
+            winner_seat (optional): The seat of the player who won, or None if the game was stopped before anyone won
+            turns: The number of turns played
+            chit_card_kind_flipper_seats: The seats of the players who flipped each kind of chit card at least once. Only recorded for
+                finished games
+        """
+        self.__games += 1
+
+        if winner_seat is None:
+            self.__unfinished_games += 1
+            return
+
+        self.__seat_wins[winner_seat] += 1
+        self.__total_turns += turns
+
+        for kind, seats in chit_card_kind_flipper_seats.items():
+            self.__chit_card_kind_flippers[kind] = self.__chit_card_kind_flippers.get(kind, 0) + len(seats)
+            if winner_seat in seats:
+                self.__chit_card_kind_flipper_wins[kind] = self.__chit_card_kind_flipper_wins.get(kind, 0) + 1
+
+    def merge(self, other: SimulationStats) -> None:
+        """Add the statistics of another batch of games of the same configuration to these statistics.
+
+        Args:
+            other: The statistics to add
+
+        Raises:
+            Exception if the number of seats differ
+        """
+        if other.__seat_count != self.__seat_count:
+            raise Exception(f"Cannot merge statistics for {other.__seat_count} seats into statistics for {self.__seat_count} seats.")
+
+        self.__games += other.__games
+        self.__unfinished_games += other.__unfinished_games
+        self.__total_turns += other.__total_turns
+        self.__seat_wins = [wins + other_wins for wins, other_wins in zip(self.__seat_wins, other.__seat_wins)]
+        for kind, flippers in other.__chit_card_kind_flippers.items():
+            self.__chit_card_kind_flippers[kind] = self.__chit_card_kind_flippers.get(kind, 0) + flippers
+        for kind, wins in other.__chit_card_kind_flipper_wins.items():
+            self.__chit_card_kind_flipper_wins[kind] = self.__chit_card_kind_flipper_wins.get(kind, 0) + wins
+
+    def get_game_count(self) -> int:
+        """Get the number of games recorded.
+
+        Returns:
+            The number of games
+        """
+        return self.__games
+
+    def get_unfinished_game_count(self) -> int:
+        """Get the number of games that were stopped before anyone won.
+
+        Returns:
+            The number of unfinished games
+        """
+        return self.__unfinished_games
+
+    def get_seat_win_rates(self) -> list[float]:
+        """Get the fraction of finished games won by each seat.
+
+        Returns:
+            The win rate of each seat in turn order. All 0 if no games finished.
+        """
+        finished_games: int = self.__games - self.__unfinished_games
+        return [wins / finished_games if finished_games > 0 else 0 for wins in self.__seat_wins]
+
+    def get_average_turns(self) -> float:
+        """Get the average number of turns played in finished games.
+
+        Returns:
+            The average number of turns. 0 if no games finished.
+        """
+        finished_games: int = self.__games - self.__unfinished_games
+        return self.__total_turns / finished_games if finished_games > 0 else 0
+
+    def get_chit_card_kind_win_rates(self) -> dict[str, float]:
+        """Get, for each kind of chit card, the fraction of players who flipped the kind at least once in a finished game that went on
+        to win the game. Compare against 1 / seats to see the impact of the kind on winning.
+
+        Returns:
+            Dictionary with K = chit card kind, V = win rate of players who flipped it
+        """
+        return {kind: self.__chit_card_kind_flipper_wins.get(kind, 0) / flippers for kind, flippers in self.__chit_card_kind_flippers.items() if flippers > 0}
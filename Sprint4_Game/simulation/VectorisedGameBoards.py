@@ -0,0 +1,367 @@
+from __future__ import annotations
+from typing import Optional
+from game_objects.animals.Animal import Animal
+
+import numpy as np
+
+
+class VectorisedGameBoards:
+    """Many games of fiery dragons stored as arrays with one row per game, played all at once with NumPy instead of one game at a time.
+    Follows the same rules as the DefaultGameBoard, chit cards, powers and DefaultTurnManager: moving along the main tiles and into a
+    character's own cave, overshooting caves, landing on occupied tiles, skip and swap powers and turns ending. Used to simulate large
+    numbers of games quickly, e.g for balancing.
+
+    Tiles are stored in the same expanded sequence the DefaultGameBoard moves characters along, where each cave is inserted after the
+    main tile it is attached to followed by a duplicate of that main tile. Characters can therefore only re-enter their own cave once they
+    have travelled around the whole board, without needing to track which tiles they have visited.
+
+    Author: Shen
+    """
+
+    # ------ Chit card kinds ----
+    CHIT_CARD_ANIMAL: int = 0
+    CHIT_CARD_PIRATE: int = 1
+    CHIT_CARD_SKIP: int = 2
+    CHIT_CARD_SWAP: int = 3
+    CHIT_CARD_KIND_COUNT: int = 4
+
+    # NO_WINNER
+    # The winner of games that no character has won yet
+    NO_WINNER: int = -1
+
+    # Animals as stored in the tile and chit card arrays, in order of the Animal enum
+    ANIMALS: list[Animal] = list(Animal)
+    __UNIVERSAL_ANIMAL: int = list(Animal).index(Animal.UNIVERSAL)
+    __NOT_A_CAVE: int = -1
+
+    def __init__(
+        self,
+        main_tile_animals: np.ndarray,
+        starting_tile_positions: np.ndarray,
+        starting_tile_animals: list[Animal],
+        chit_card_kinds: np.ndarray,
+        chit_card_values: np.ndarray,
+        chit_card_animals: np.ndarray,
+    ):
+        """
+        Constructor. All characters start in their caves, with the first character playing.
+
+        Args:
+            main_tile_animals: The animals of the main tiles of each game as indexes into ANIMALS. Shape (games, main tiles)
+            starting_tile_positions: The positions as indexes along the main tiles of each game that each character's cave is attached to,
+                in turn order. Must be sorted from lowest to highest to break ties between closest characters like the DefaultGameBoard.
+                Shape (games, characters)
+            starting_tile_animals: The animal of each character's cave, in turn order
+            chit_card_kinds: The kind of each chit card of each game as one of the CHIT_CARD_* kinds. Shape (games, chit cards)
+            chit_card_values: The symbol count of each animal and pirate chit card, or the number of players skipped by each skip chit card.
+                Shape (games, chit cards)
+            chit_card_animals: The animal of each animal chit card as indexes into ANIMALS. Ignored for other kinds. Shape (games, chit cards)
+
+        Raises:
+            Exception if the shapes of the arrays do not match
+        """
+        game_count, main_tile_count = main_tile_animals.shape
+        character_count: int = len(starting_tile_animals)
+        if starting_tile_positions.shape != (game_count, character_count):
+            raise Exception(f"Expected starting tile positions of shape {(game_count, character_count)}. Got={starting_tile_positions.shape}")
+        if not chit_card_kinds.shape == chit_card_values.shape == chit_card_animals.shape or chit_card_kinds.shape[0] != game_count:
+            raise Exception("The chit card arrays must have the same shape, with one row per game.")
+
+        self.__game_count: int = game_count
+        self.__character_count: int = character_count
+        self.__sequence_length: int = main_tile_count + 2 * character_count
+
+        # ----- Tiles: expanded sequence, with each cave and the duplicate of its main tile inserted after the main tile ----
+        games: np.ndarray = np.arange(game_count)[:, None]
+        characters: np.ndarray = np.arange(character_count)[None, :]
+        has_cave: np.ndarray = np.zeros((game_count, main_tile_count), dtype=bool)
+        has_cave[games, starting_tile_positions] = True
+        caves_before: np.ndarray = np.cumsum(has_cave, axis=1) - has_cave
+        main_tile_indexes: np.ndarray = np.arange(main_tile_count)[None, :] + 2 * caves_before  # indexes of main tiles in expanded sequence
+        cave_indexes: np.ndarray = main_tile_indexes[games, starting_tile_positions] + 1
+        duplicate_tile_indexes: np.ndarray = cave_indexes + 1
+
+        self.__tile_animals: np.ndarray = np.empty((game_count, self.__sequence_length), dtype=np.int8)
+        self.__tile_animals[games, main_tile_indexes] = main_tile_animals
+        self.__tile_animals[games, cave_indexes] = np.array([VectorisedGameBoards.ANIMALS.index(animal) for animal in starting_tile_animals], dtype=np.int8)
+        self.__tile_animals[games, duplicate_tile_indexes] = main_tile_animals[games, starting_tile_positions]
+
+        # tiles are identified by their main tile index, or by main tile count + character for caves. A main tile and its duplicate are the
+        # same tile, so only one character can stand on them
+        self.__tile_ids: np.ndarray = np.empty((game_count, self.__sequence_length), dtype=np.int16)
+        self.__tile_ids[games, main_tile_indexes] = np.arange(main_tile_count)[None, :]
+        self.__tile_ids[games, cave_indexes] = main_tile_count + characters
+        self.__tile_ids[games, duplicate_tile_indexes] = starting_tile_positions
+
+        self.__cave_owners: np.ndarray = np.full((game_count, self.__sequence_length), VectorisedGameBoards.__NOT_A_CAVE, dtype=np.int8)
+        self.__cave_owners[games, cave_indexes] = characters
+        self.__cave_indexes: np.ndarray = cave_indexes.astype(np.int32)  # index of each character's cave in the expanded sequence
+
+        # ----- Chit cards ----
+        self.__chit_card_kinds: np.ndarray = chit_card_kinds.astype(np.int8)
+        self.__chit_card_values: np.ndarray = chit_card_values.astype(np.int8)
+        self.__chit_card_animals: np.ndarray = chit_card_animals.astype(np.int8)
+        self.__flipped: np.ndarray = np.zeros(chit_card_kinds.shape, dtype=bool)
+
+        # ----- Characters and turns ----
+        self.__positions: np.ndarray = self.__cave_indexes.copy()  # index of each character's tile in the expanded sequence
+        self.__currently_playing: np.ndarray = np.zeros(game_count, dtype=np.int32)
+        self.__skipped: np.ndarray = np.zeros((game_count, character_count), dtype=bool)  # characters whose next turn ends immediately
+        self.__winners: np.ndarray = np.full(game_count, VectorisedGameBoards.NO_WINNER, dtype=np.int8)
+        self.__turn_counts: np.ndarray = np.zeros(game_count, dtype=np.int32)
+        self.__chit_card_kind_flippers: np.ndarray = np.zeros((game_count, character_count, VectorisedGameBoards.CHIT_CARD_KIND_COUNT), dtype=bool)
+
+    # ----------- Class methods ----------------------------------------------------------------------------------------------------------------
+    def play_random_games(self, rng: np.random.Generator, max_turns: int) -> np.ndarray:
+        """Play every game until a character wins or the number of turns reaches a limit, with every player flipping a randomly chosen
+        unflipped chit card each time.
+
+        Args:
+            rng: The random number generator to choose chit cards with
+            max_turns: The number of turns after which to stop playing a game if no character has won
+
+        Returns:
+            The winner of each game, or NO_WINNER if the game was stopped
+        """
+        games: np.ndarray = np.nonzero(self.get_playing_games(max_turns))[0]
+        while len(games) > 0:
+            # choose the n-th unflipped chit card in each game, for a uniformly random n
+            unflipped: np.ndarray = ~self.__flipped[games]
+            n: np.ndarray = (rng.random(len(games)) * unflipped.sum(axis=1)).astype(np.int32)
+            self.flip_chit_cards(games, np.argmax(np.cumsum(unflipped, axis=1) > n[:, None], axis=1))
+            games = games[self.get_playing_games(max_turns)[games]]
+
+        return self.get_winners()
+
+    def flip_chit_cards(self, games: np.ndarray, chit_cards: np.ndarray) -> None:
+        """Flip a chit card in each chosen game as its currently playing character, as if they had clicked on it. Where the character's
+        turn ends as a result, or there are no unflipped chit cards left to flip, turns change to the next character to play.
+
+        Args:
+            games: The unique indexes of the games to flip a chit card in. Must not include games that have ended
+            chit_cards: The index of the unflipped chit card to flip in each of the games
+        """
+        characters: np.ndarray = self.__currently_playing[games]
+        kinds: np.ndarray = self.__chit_card_kinds[games, chit_cards]
+        values: np.ndarray = self.__chit_card_values[games, chit_cards]
+
+        self.__flipped[games, chit_cards] = True
+        self.__chit_card_kind_flippers[games, characters, kinds] = True
+        turn_ended: np.ndarray = np.zeros(len(games), dtype=bool)
+
+        # ANIMAL: move forward if the animal matches the character's tile, otherwise end the turn
+        is_animal: np.ndarray = kinds == VectorisedGameBoards.CHIT_CARD_ANIMAL
+        tile_animals: np.ndarray = self.__tile_animals[games, self.__positions[games, characters]]
+        matches: np.ndarray = (tile_animals == VectorisedGameBoards.__UNIVERSAL_ANIMAL) | (tile_animals == self.__chit_card_animals[games, chit_cards])
+        turn_ended |= is_animal & ~matches
+
+        # ANIMAL & PIRATE: move forward or backwards, ending the turn if the move is not allowed
+        is_pirate: np.ndarray = kinds == VectorisedGameBoards.CHIT_CARD_PIRATE
+        movers: np.ndarray = (is_animal & matches) | is_pirate
+        steps: np.ndarray = np.where(is_pirate, -values, values).astype(np.int32)
+        turn_ended[movers] |= ~self.__move_characters_by_steps(games[movers], characters[movers], steps[movers])
+
+        # SKIP: players between the user and the player skipped to have their next turn end immediately
+        is_skip: np.ndarray = kinds == VectorisedGameBoards.CHIT_CARD_SKIP
+        if is_skip.any():
+            self.__skip_players(games[is_skip], characters[is_skip], values[is_skip])
+
+        # SWAP: swap with the closest character if there is one and end the turn
+        is_swap: np.ndarray = kinds == VectorisedGameBoards.CHIT_CARD_SWAP
+        if is_swap.any():
+            turn_ended[is_swap] = self.__swap_with_closest_characters(games[is_swap], characters[is_swap])
+
+        # change turns in games still being played, also when players can't continue their turn as every chit card is flipped
+        playing: np.ndarray = self.__winners[games] == VectorisedGameBoards.NO_WINNER
+        turn_ended |= self.__flipped[games].all(axis=1)
+        self.__end_turns(games[turn_ended & playing])
+
+    def get_playing_games(self, max_turns: Optional[int] = None) -> np.ndarray:
+        """Get which games are still being played, which is until a character has won.
+
+        Args:
+            max_turns (optional): The number of turns after which a game is no longer being played if no character has won
+
+        Returns:
+            Whether each game is still being played. Shape (games,)
+        """
+        playing: np.ndarray = self.__winners == VectorisedGameBoards.NO_WINNER
+        if max_turns is not None:
+            playing &= self.__turn_counts < max_turns
+        return playing
+
+    def get_game_count(self) -> int:
+        """Get the number of games.
+
+        Returns:
+            The number of games
+        """
+        return self.__game_count
+
+    def get_winners(self) -> np.ndarray:
+        """Get the character who won each game, as indexes in turn order.
+
+        Returns:
+            The winner of each game, or NO_WINNER if no character has won. Shape (games,)
+        """
+        return self.__winners.copy()
+
+    def get_turn_counts(self) -> np.ndarray:
+        """Get the number of turns that have ended in each game, including turns that were skipped.
+
+        Returns:
+            The number of turns of each game. Shape (games,)
+        """
+        return self.__turn_counts.copy()
+
+    def get_currently_playing(self) -> np.ndarray:
+        """Get the character whose turn it is in each game, as indexes in turn order.
+
+        Returns:
+            The currently playing character of each game. Shape (games,)
+        """
+        return self.__currently_playing.copy()
+
+    def get_unflipped_chit_cards(self) -> np.ndarray:
+        """Get which chit cards can be flipped in each game.
+
+        Returns:
+            Whether each chit card of each game is unflipped. Shape (games, chit cards)
+        """
+        return ~self.__flipped
+
+    def get_character_positions(self) -> np.ndarray:
+        """Get the position of each character in each game, as indexes into the expanded tile sequence the characters move along.
+
+        Returns:
+            The positions of the characters in turn order. Shape (games, characters)
+        """
+        return self.__positions.copy()
+
+    def get_chit_card_kind_flippers(self) -> np.ndarray:
+        """Get which characters flipped each kind of chit card at least once in each game.
+
+        Returns:
+            Whether each character flipped each kind of chit card, indexed by CHIT_CARD_* kinds. Shape (games, characters, kinds)
+        """
+        return self.__chit_card_kind_flippers.copy()
+
+    def __move_characters_by_steps(self, games: np.ndarray, characters: np.ndarray, steps: np.ndarray) -> np.ndarray:
+        """Move a character in each game by a number of steps along the game board, following the same rules as the DefaultGameBoard.
+        Characters can only re-enter their cave moving forward once they have travelled around the board, without overshooting it.
+        Characters can not move backwards past their cave or land on a tile occupied by another character. Characters who move into
+        their cave win the game.
+
+        Args:
+            games: The games to move a character in
+            characters: The character to move in each game
+            steps: The number of steps to move in each game (negative = anti-clockwise, positive = clockwise)
+
+        Returns:
+            Whether each character moved. Characters that did not move must end their turn.
+        """
+        direction: np.ndarray = np.sign(steps)
+        step_counts: np.ndarray = np.abs(steps)
+        own_caves: np.ndarray = self.__cave_indexes[games, characters]
+        tile_i: np.ndarray = self.__positions[games, characters].copy()
+        current_tile_i: np.ndarray = tile_i.copy()
+        failed: np.ndarray = np.zeros(len(games), dtype=bool)
+        entered_cave: np.ndarray = np.zeros(len(games), dtype=bool)
+
+        # walk all characters one step at a time, until each has taken their steps
+        for step in range(int(step_counts.max(initial=0))):
+            walking: np.ndarray = (step < step_counts) & ~failed & ~entered_cave
+
+            # characters in their cave can't move further back
+            failed |= walking & (current_tile_i == own_caves) & (steps < 0)
+            walking &= ~failed
+
+            tile_i += direction * walking
+            current_tile_i = np.where(walking, tile_i % self.__sequence_length, current_tile_i)
+            at_cave: np.ndarray = walking & (self.__cave_owners[games, current_tile_i] != VectorisedGameBoards.__NOT_A_CAVE)
+            at_own_cave: np.ndarray = at_cave & (current_tile_i == own_caves)
+
+            # can't pass their cave backwards or overshoot it forwards. Otherwise go into their cave
+            failed |= at_own_cave & ((steps < 0) | (step + 1 < step_counts))
+            entered_cave |= at_own_cave & ~failed
+
+            # pass over other characters' caves and the duplicate of the main tile they are attached to
+            tile_i += 2 * direction * (at_cave & ~at_own_cave)
+
+        # don't move onto tiles occupied by another character
+        destinations: np.ndarray = tile_i % self.__sequence_length
+        destination_ids: np.ndarray = self.__tile_ids[games, destinations]
+        occupied_ids: np.ndarray = self.__tile_ids[games[:, None], self.__positions[games]]
+        others: np.ndarray = np.arange(self.__character_count)[None, :] != characters[:, None]
+        failed |= ((occupied_ids == destination_ids[:, None]) & others).any(axis=1)
+
+        moved: np.ndarray = ~failed
+        self.__positions[games[moved], characters[moved]] = destinations[moved]
+
+        won: np.ndarray = moved & (destinations == own_caves)
+        self.__winners[games[won]] = characters[won]
+        return moved
+
+    def __skip_players(self, games: np.ndarray, characters: np.ndarray, players_to_skip: np.ndarray) -> None:
+        """Skip the turns of players following the user in each game once the user's turn ends, like the DefaultTurnManager.
+
+        Args:
+            games: The games to skip players in
+            characters: The user of the skip in each game
+            players_to_skip: The number of players to skip in each game
+        """
+        targets: np.ndarray = (characters + players_to_skip + 1) % self.__character_count
+        reached_target: np.ndarray = np.zeros(len(games), dtype=bool)
+
+        for n in range(1, self.__character_count):
+            downstream: np.ndarray = (characters + n) % self.__character_count
+            reached_target |= downstream == targets
+            self.__skipped[games[~reached_target], downstream[~reached_target]] = True
+
+    def __swap_with_closest_characters(self, games: np.ndarray, characters: np.ndarray) -> np.ndarray:
+        """Swap the character in each game with the character closest to it along the expanded tile sequence, like the DefaultGameBoard.
+        Characters in caves neither swap nor are swapped with. Ties go to the character first in turn order.
+
+        Args:
+            games: The games to swap characters in
+            characters: The character to swap in each game
+
+        Returns:
+            Whether each character swapped. Characters that swapped must end their turn.
+        """
+        positions: np.ndarray = self.__positions[games]
+        user_positions: np.ndarray = positions[np.arange(len(games)), characters]
+        in_cave: np.ndarray = self.__cave_owners[games[:, None], positions] != VectorisedGameBoards.__NOT_A_CAVE
+
+        forward_distances: np.ndarray = np.abs(positions - user_positions[:, None])
+        distances: np.ndarray = np.minimum(forward_distances, self.__sequence_length - forward_distances)
+        candidates: np.ndarray = ~in_cave & (np.arange(self.__character_count)[None, :] != characters[:, None])
+        distances = np.where(candidates, distances, np.iinfo(distances.dtype).max)
+
+        swapped: np.ndarray = candidates.any(axis=1) & ~in_cave[np.arange(len(games)), characters]
+        closest: np.ndarray = np.argmin(distances, axis=1)  # first closest in turn order
+
+        games, characters, closest = games[swapped], characters[swapped], closest[swapped]
+        self.__positions[games, characters], self.__positions[games, closest] = self.__positions[games, closest], self.__positions[games, characters]
+        return swapped
+
+    def __end_turns(self, games: np.ndarray) -> None:
+        """End the turn of the currently playing character in each game, changing turns until a player can play their turn as turns of
+        players who are skipped end immediately. Every chit card is flipped back over.
+
+        Args:
+            games: The games to end the current turn in
+        """
+        self.__flipped[games] = False
+        self.__turn_counts[games] += 1
+        self.__currently_playing[games] = (self.__currently_playing[games] + 1) % self.__character_count
+
+        for _ in range(self.__character_count):
+            skipped: np.ndarray = self.__skipped[games, self.__currently_playing[games]]
+            if not skipped.any():
+                return
+
+            games = games[skipped]
+            self.__skipped[games, self.__currently_playing[games]] = False
+            self.__turn_counts[games] += 1
+            self.__currently_playing[games] = (self.__currently_playing[games] + 1) % self.__character_count
@@ -4,7 +4,6 @@ Author: Shen
 """
 
 import os
-import ctypes
 
 from enum import Enum
 
@@ -30,7 +29,9 @@ def nt_safe_size_for_program_window(dimension: ScreenDimension) -> int:
         Exception if the os is not Windows
     """
     if os.name == "nt":
-        # Windows resolution configuration
+        # Windows resolution configuration. ctypes is only imported here, as it is only needed on Windows
+        import ctypes
+
         user32 = ctypes.windll.user32
         user32.SetProcessDPIAware()  # ignore ui scaling
         user_screen_width, user_screen_height = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
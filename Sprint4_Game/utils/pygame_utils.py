@@ -4,6 +4,11 @@ Utilities for pygame.
 Author: Shen
 """
 
+from utils.math_utils import cos_deg, sin_deg
+
+import math
+import pygame
+
 
 def get_coords_for_center_drawing_in_rect(rect_coords: tuple[int, int], rect_size: tuple[int, int], draw_size: tuple[int, int]) -> tuple[int, int]:
     """
@@ -26,3 +31,28 @@ def get_coords_for_center_drawing_in_rect(rect_coords: tuple[int, int], rect_siz
     draw_to_center_width, draw_to_center_height = int(draw_width / 2), int(draw_height / 2)
 
     return (rect_center_x - draw_to_center_width, rect_center_y - draw_to_center_height)
+
+
+def get_rotated_bounding_rect(coords: tuple[int, int], size: tuple[int, int], rotation: float) -> pygame.Rect:
+    """
+    Get the screen area covered by an element drawn at the coordinates with the specified size and rotation. Rotated elements
+    are assumed to be drawn centered on their unrotated position (see PygameScreenController.draw_asset()).
+
+    Args:
+        coords: The coordinates the element is drawn at in form (x, y)
+        size: The size of the element before rotation in pixels in form (width, height)
+        rotation: The degrees anti-clockwise the element is rotated by
+
+    Returns:
+        The rectangle covering the drawn element, padded by a pixel on each side to account for rounding
+    """
+    x, y = coords
+    width, height = size
+
+    if rotation % 360 != 0:
+        rotated_width = math.ceil(abs(width * cos_deg(rotation)) + abs(height * sin_deg(rotation)))
+        rotated_height = math.ceil(abs(width * sin_deg(rotation)) + abs(height * cos_deg(rotation)))
+        x, y = x - int((rotated_width - width) / 2), y - int((rotated_height - height) / 2)
+        width, height = rotated_width, rotated_height
+
+    return pygame.Rect(x - 1, y - 1, width + 2, height + 2)